@@ -0,0 +1,99 @@
+"""Benchmark subcellular_enrichment_scores against the per-sample loop it replaced.
+
+Usage: python benchmarks/algorithms_enrichment.py [N_SAMPLES] [N_PROTEINS]
+"""
+
+import sys
+import time
+
+from typing import Tuple
+
+import numpy as np
+import pandas as pd
+
+from talus_utils import algorithms
+
+
+def subcellular_enrichment_scores_loop(
+    proteins_with_locations: pd.DataFrame, expected_fractions_of_locations: pd.DataFrame
+) -> pd.DataFrame:
+    """Calculate the enrichment scores one sample at a time, as before."""
+    for sample in proteins_with_locations["Sample"].unique():
+        sample_df = proteins_with_locations.loc[
+            proteins_with_locations["Sample"] == sample
+        ]
+        total_proteins = sample_df["Protein"].nunique()
+        sample_df = sample_df.groupby("Main location", as_index=False).apply(
+            lambda location: location["Protein"].nunique() / total_proteins
+        )
+        sample_df.columns = ["Main location", sample]
+        expected_fractions_of_locations = pd.merge(
+            expected_fractions_of_locations, sample_df, on="Main location", how="left"
+        )
+        expected_fractions_of_locations[sample] /= expected_fractions_of_locations[
+            "Expected Fraction"
+        ]
+
+    expected_fractions_of_locations = expected_fractions_of_locations.drop(
+        ["Expected Fraction", "# of Proteins", "Total # of Proteins"], axis=1
+    )
+    return expected_fractions_of_locations.set_index("Main location")
+
+
+def make_inputs(
+    n_samples: int, n_proteins: int, n_locations: int = 35, seed: int = 0
+) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """Create proteins with locations detected in each sample and the expected fractions."""
+    rng = np.random.default_rng(seed)
+    locations = np.array([f"Location {i}" for i in range(n_locations)], dtype=object)
+    protein_locations = locations[rng.integers(0, n_locations, n_proteins)]
+    # Like the Human Protein Atlas, some proteins don't have a main location.
+    protein_locations[rng.random(n_proteins) < 0.15] = np.nan
+    proteins = np.array([f"PROT{i}" for i in range(n_proteins)], dtype=object)
+    samples = np.array([f"sample_{i:04d}.mzML" for i in range(n_samples)], dtype=object)
+
+    detected = rng.random((n_samples, n_proteins)) < 0.7
+    sample_positions, protein_positions = np.nonzero(detected)
+    proteins_with_locations = pd.DataFrame(
+        {
+            "Protein": proteins[protein_positions],
+            "Sample": samples[sample_positions],
+            "Main location": protein_locations[protein_positions],
+        }
+    )
+    n_location_proteins = pd.Series(protein_locations).value_counts()
+    expected_fractions_of_locations = pd.DataFrame(
+        {
+            "Main location": locations,
+            "# of Proteins": n_location_proteins.reindex(locations).to_numpy(),
+            "Total # of Proteins": n_proteins,
+        }
+    )
+    expected_fractions_of_locations["Expected Fraction"] = (
+        expected_fractions_of_locations["# of Proteins"] / n_proteins
+    )
+    return proteins_with_locations, expected_fractions_of_locations
+
+
+def main() -> None:
+    """Run the benchmark."""
+    n_samples = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    n_proteins = int(sys.argv[2]) if len(sys.argv) > 2 else 20_000
+    proteins_with_locations, expected_fractions = make_inputs(n_samples, n_proteins)
+    print(f"{len(proteins_with_locations)} rows, {n_samples} samples")
+
+    results = {}
+    for name, func in [
+        ("loop", subcellular_enrichment_scores_loop),
+        ("groupby", algorithms.subcellular_enrichment_scores),
+    ]:
+        start = time.perf_counter()
+        results[name] = func(proteins_with_locations, expected_fractions)
+        print(f"{name:>8} {time.perf_counter() - start:>8.2f} s")
+
+    pd.testing.assert_frame_equal(results["groupby"], results["loop"])
+    print("outputs match")
+
+
+if __name__ == "__main__":
+    main()
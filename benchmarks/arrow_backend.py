@@ -0,0 +1,104 @@
+"""Benchmark the talus_utils.dataframe decorators on pandas DataFrames and pyarrow Tables.
+
+Memory is the growth of the peak RSS of a forked child running each decorator, since
+tracemalloc doesn't see the allocations of pyarrow's memory pool.
+
+Usage: python benchmarks/arrow_backend.py [N_ROWS]
+"""
+import multiprocessing
+import sys
+import time
+
+from typing import Any, Callable, Dict, Tuple
+
+import numpy as np
+import pyarrow as pa
+
+from dataframe_explode import make_protein_groups
+from dataframe_normalize import make_matrix
+
+from talus_utils import dataframe
+from talus_utils.fasta import parse_fasta_header_uniprot_protein
+
+
+def read_status_mb(field: str) -> float:
+    """Read a memory field of /proc/self/status in megabytes."""
+    with open("/proc/self/status") as status:
+        line = next(line for line in status if line.startswith(field))
+    return int(line.split()[1]) / 1024
+
+
+def run_child(func: Callable[[], Any], queue: multiprocessing.Queue) -> None:
+    """Run func and report its wall time and peak RSS growth in megabytes."""
+    # Writing 5 to clear_refs resets the peak RSS to the current RSS.
+    with open("/proc/self/clear_refs", "w") as clear_refs:
+        clear_refs.write("5")
+    rss = read_status_mb("VmRSS")
+    start = time.perf_counter()
+    try:
+        func()
+    except Exception:
+        # Don't leave the parent waiting for a result.
+        queue.put((float("nan"), float("nan")))
+        raise
+    elapsed = time.perf_counter() - start
+    queue.put((elapsed, read_status_mb("VmHWM") - rss))
+
+
+def measure_rss(func: Callable[[], Any]) -> Tuple[float, float]:
+    """Return the wall time in seconds and peak RSS growth in MB of func."""
+    context = multiprocessing.get_context("fork")
+    queue = context.Queue()
+    process = context.Process(target=run_child, args=(func, queue))
+    process.start()
+    result = queue.get()
+    process.join()
+    return result
+
+
+def get_benchmarks(n_rows: int) -> Dict[str, Tuple[Callable[..., Any], Any, Any]]:
+    """Return the decorators to benchmark with their pandas and pyarrow inputs."""
+    groups = make_protein_groups(n_rows)
+    accessions = dataframe.explode_column(groups.head(n_rows // 2), "Protein", ";")
+    matrix = make_matrix(n_rows, 20)
+    matrix.columns = matrix.columns.astype(str)
+    return {
+        "dropna": (dataframe.dropna(how="all"), matrix, pa.Table.from_pandas(matrix)),
+        "explode": (
+            dataframe.explode(column="Protein", sep=";"),
+            groups,
+            pa.Table.from_pandas(groups),
+        ),
+        "update_column": (
+            dataframe.update_column(
+                column="Protein", update_func=parse_fasta_header_uniprot_protein
+            ),
+            accessions,
+            pa.Table.from_pandas(accessions),
+        ),
+        "log_scaling": (
+            dataframe.log_scaling(log_function=np.log2),
+            matrix,
+            pa.Table.from_pandas(matrix),
+        ),
+        "normalize": (
+            dataframe.normalize(how="median"),
+            matrix,
+            pa.Table.from_pandas(matrix),
+        ),
+    }
+
+
+def main() -> None:
+    """Run the benchmark."""
+    n_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 2_000_000
+    print(f"{'decorator':>14} {'backend':>8} {'seconds':>8} {'peak MB':>8}")
+    for name, (decorator, df, table) in get_benchmarks(n_rows).items():
+        wrapped_func = decorator(lambda x: x)
+        for backend, data in [("pandas", df), ("arrow", table)]:
+            elapsed, peak = measure_rss(lambda: wrapped_func(data))
+            print(f"{name:>14} {backend:>8} {elapsed:>8.2f} {peak:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""Benchmark the cached decorator on a quantile normalization pipeline.
+
+Usage: python benchmarks/dataframe_cached.py [N_ROWS,N_COLUMNS ...]
+"""
+
+import sys
+import tempfile
+import time
+
+from typing import Any, Callable
+
+import pandas as pd
+
+from dataframe_normalize import make_matrix, parse_shapes
+
+from talus_utils import dataframe
+
+
+def seconds(func: Callable[[], Any]) -> float:
+    """Return the wall time of func in seconds."""
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    """Run the benchmark."""
+    shapes = parse_shapes(sys.argv[1:])
+    print(
+        f"{'shape':>14} {'uncached':>9} {'miss':>7} {'hit':>7} {'disk hit':>9} "
+        f"{'hash':>7} {'hash_pandas_object':>19}"
+    )
+    for n_rows, n_columns in shapes:
+        df = make_matrix(n_rows, n_columns)
+        df.columns = df.columns.astype(str)
+        analyze = dataframe.normalize(how="quantile")(lambda x: x)
+        with tempfile.TemporaryDirectory() as cache_dir:
+            cached = dataframe.cached(cache_dir=cache_dir)(analyze)
+            uncached = seconds(lambda: analyze(df))
+            miss = seconds(lambda: cached(df))
+            # A new but equal DataFrame, as in a re-run notebook cell.
+            hit = seconds(lambda: cached(df.copy()))
+            cached.cache_clear()
+            disk_hit = seconds(lambda: cached(df.copy()))
+        content_hash = seconds(lambda: dataframe._content_hash(df))
+        pandas_hash = seconds(lambda: pd.util.hash_pandas_object(df))
+        print(
+            f"{f'{n_rows}x{n_columns}':>14} {uncached:>9.3f} {miss:>7.3f} {hit:>7.3f} "
+            f"{disk_hit:>9.3f} {content_hash:>7.3f} {pandas_hash:>19.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""Benchmark the memory of the modes of the talus_utils.dataframe copy decorator.
+
+Usage: python benchmarks/dataframe_copy.py [N_ROWS,N_COLUMNS ...]
+"""
+import sys
+
+import pandas as pd
+
+from dataframe_normalize import make_matrix, measure
+
+from talus_utils import dataframe
+
+
+def read_only(df: pd.DataFrame) -> pd.Series:
+    """Count the values of df without writing to it."""
+    return df.count()
+
+
+def write_value(df: pd.DataFrame) -> pd.Series:
+    """Overwrite one value of df in place, then count its values."""
+    df.iloc[0, 0] = 0.0
+    return df.count()
+
+
+def replace_column(df: pd.DataFrame) -> pd.Series:
+    """Replace one column of df, then count its values."""
+    df[df.columns[0]] = df[df.columns[0]].fillna(0)
+    return df.count()
+
+
+def main() -> None:
+    """Run the benchmark."""
+    shapes = [tuple(int(n) for n in argument.split(",")) for argument in sys.argv[1:]]
+    print(f"{'shape':>14} {'function':>18} {'mode':>9} {'seconds':>8} {'peak MB':>8}")
+    for n_rows, n_columns in shapes or [(100_000, 100), (1_000_000, 50)]:
+        df = make_matrix(n_rows, n_columns)
+        for func in [read_only, write_value, replace_column]:
+            for mode in dataframe.COPY_MODES:
+                # A read-only view can't be written to in place.
+                if func is write_value and mode == "readonly":
+                    continue
+                wrapped_func = dataframe.copy(func, mode=mode)
+                elapsed, peak = measure(lambda: wrapped_func(df))
+                print(
+                    f"{f'{n_rows}x{n_columns}':>14} {func.__name__:>18} {mode:>9}"
+                    f" {elapsed:>8.2f} {peak:>8.1f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
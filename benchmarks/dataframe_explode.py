@@ -0,0 +1,68 @@
+"""Benchmark explode_column in talus_utils.dataframe on a synthetic protein group table.
+
+Usage: python benchmarks/dataframe_explode.py [N_ROWS ...]
+"""
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from dataframe_normalize import measure
+
+from talus_utils import dataframe
+
+
+def legacy_explode_column(df: pd.DataFrame, column: str, sep: str) -> pd.DataFrame:
+    """Explode a column the way it was done before, splitting row by row."""
+    return df.assign(
+        **{
+            column: df[column].apply(
+                lambda row: row.split(sep) if isinstance(row, str) else row
+            )
+        }
+    ).explode(column=column)
+
+
+def make_protein_groups(
+    n_rows: int, n_proteins: int = 20000, seed: int = 0
+) -> pd.DataFrame:
+    """Create a peptide to protein group table with 1 to 4 accessions per group."""
+    rng = np.random.default_rng(seed)
+    accessions = np.array([f"sp|P{i:05d}|PROT{i}_HUMAN" for i in range(n_proteins)])
+    group_sizes = rng.choice([1, 2, 3, 4], size=n_rows, p=[0.6, 0.25, 0.1, 0.05])
+    members = accessions[rng.integers(0, n_proteins, size=group_sizes.sum())]
+    boundaries = np.cumsum(group_sizes)[:-1]
+    groups = [";".join(group) for group in np.split(members, boundaries)]
+    return pd.DataFrame(
+        {
+            "Peptide": pd.RangeIndex(n_rows).astype(str),
+            "Protein": groups,
+            "Score": rng.random(n_rows),
+        }
+    )
+
+
+def main() -> None:
+    """Run the benchmark."""
+    print(f"{'rows':>10} {'method':>12} {'seconds':>8} {'peak MB':>8}")
+    for n_rows in [int(n) for n in sys.argv[1:]] or [5_000_000]:
+        df = make_protein_groups(n_rows)
+        benchmarks = {
+            "legacy": lambda: legacy_explode_column(df, "Protein", ";"),
+            "vectorized": lambda: dataframe.explode_column(df, "Protein", ";"),
+            "categorical": lambda: dataframe.explode_column(
+                df, "Protein", ";", categorical=True
+            ),
+        }
+        for name, func in benchmarks.items():
+            # tracemalloc slows down allocating many small strings, so time separately.
+            start = time.perf_counter()
+            func()
+            elapsed = time.perf_counter() - start
+            _, peak = measure(func)
+            print(f"{n_rows:>10} {name:>12} {elapsed:>8.2f} {peak:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""Benchmark the normalizations in talus_utils.dataframe across matrix shapes.
+
+The normalizations are timed on every shape, then on the first shape across a sweep
+of missing value densities.
+
+Usage: python benchmarks/dataframe_normalize.py [N_ROWS,N_COLUMNS ...]
+"""
+
+import sys
+import time
+import tracemalloc
+
+from typing import Any, Callable, Dict, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+from talus_utils import dataframe
+
+LEGACY = {
+    "row": lambda df: df.apply(lambda x: x / x.sum(), axis=1),
+    "column": lambda df: df.apply(lambda x: x / x.sum(), axis=0),
+    "minmax": lambda df: (df - df.min()) / (df.max() - df.min()),
+    "median": lambda df: df / df.median(),
+}
+NAN_FRACTIONS = [0.0, 0.2, 0.5, 0.8]
+
+
+def legacy_quantile_normalize(df: pd.DataFrame) -> pd.DataFrame:
+    """Quantile normalize the way it was done before, with pandas reshapes."""
+    rank_mean = df.stack().groupby(df.rank(method="first").stack().astype(int)).mean()
+    return df.rank(method="min").stack().astype(int).map(rank_mean).unstack()
+
+
+def make_matrix(
+    n_rows: int, n_columns: int, nan_fraction: float = 0.2, seed: int = 0
+) -> pd.DataFrame:
+    """Create a peptides x samples quant matrix with missing values."""
+    rng = np.random.default_rng(seed)
+    values = rng.lognormal(mean=10, sigma=2, size=(n_rows, n_columns))
+    values[rng.random(values.shape) < nan_fraction] = np.nan
+    return pd.DataFrame(values)
+
+
+def measure(func: Callable[[], Any]) -> Tuple[float, float]:
+    """Return the wall time in seconds and peak traced memory in MB of func."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak / 1024 ** 2
+
+
+def parse_shapes(arguments: List[str]) -> List[Tuple[int, int]]:
+    """Parse N_ROWS,N_COLUMNS arguments."""
+    shapes = [tuple(int(n) for n in argument.split(",")) for argument in arguments]
+    return shapes or [(10_000, 30), (100_000, 100), (500_000, 300)]
+
+
+def get_benchmarks() -> Dict[str, Callable[[pd.DataFrame], Any]]:
+    """Return the functions to benchmark by name."""
+    benchmarks: Dict[str, Callable[[pd.DataFrame], Any]] = {}
+    for how, legacy_func in LEGACY.items():
+        benchmarks[f"{how} (legacy)"] = legacy_func
+        benchmarks[how] = lambda df, how=how: dataframe.normalize(how)(lambda x: x)(df)
+        benchmarks[f"{how} float32"] = lambda df, how=how: dataframe.normalize(
+            how, dtype=np.float32
+        )(lambda x: x)(df)
+        # The copy is made outside of the measurement.
+        benchmarks[f"{how} inplace"] = lambda df, how=how: dataframe.normalize(
+            how, inplace=True
+        )(lambda x: x)(df)
+    benchmarks["quantile (legacy)"] = legacy_quantile_normalize
+    benchmarks["quantile"] = dataframe.quantile_normalize
+    benchmarks["quantile float32"] = lambda df: dataframe.quantile_normalize(
+        df, dtype=np.float32
+    )
+    return benchmarks
+
+
+def run(df: pd.DataFrame, label: str) -> None:
+    """Print the time and peak memory of every benchmark on df."""
+    for name, func in get_benchmarks().items():
+        df_input = df.copy() if name.endswith("inplace") else df
+        elapsed, peak = measure(lambda: func(df_input))
+        print(f"{label:>14} {name:>20} {elapsed:>8.2f} {peak:>8.1f}")
+
+
+def main() -> None:
+    """Run the benchmark."""
+    shapes = parse_shapes(sys.argv[1:])
+    print(f"{'shape':>14} {'method':>20} {'seconds':>8} {'peak MB':>8}")
+    for n_rows, n_columns in shapes:
+        run(make_matrix(n_rows, n_columns), f"{n_rows}x{n_columns}")
+
+    n_rows, n_columns = shapes[0]
+    print(f"\n{'NaN fraction':>14} {'method':>20} {'seconds':>8} {'peak MB':>8}")
+    for nan_fraction in NAN_FRACTIONS:
+        run(
+            make_matrix(n_rows, n_columns, nan_fraction=nan_fraction), f"{nan_fraction}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""Benchmark the n_jobs column-block parallelism of the talus_utils.dataframe decorators.
+
+Usage: python benchmarks/dataframe_parallel.py [N_ROWS,N_COLUMNS ...]
+"""
+
+import os
+import sys
+import time
+
+from typing import Any, Callable, Dict, Optional
+
+import numpy as np
+
+from dataframe_normalize import make_matrix, parse_shapes
+
+from talus_utils import dataframe
+
+N_JOBS = [None, 2, 4, 8]
+
+
+def get_decorators(n_jobs: Optional[int]) -> Dict[str, Callable[..., Any]]:
+    """Return the decorators to benchmark with the given number of threads."""
+    return {
+        "median": dataframe.normalize(how="median", n_jobs=n_jobs),
+        "column": dataframe.normalize(how="column", n_jobs=n_jobs),
+        "minmax": dataframe.normalize(how="minmax", n_jobs=n_jobs),
+        "log_scaling": dataframe.log_scaling(log_function=np.log2, n_jobs=n_jobs),
+    }
+
+
+def main() -> None:
+    """Run the benchmark."""
+    shapes = parse_shapes(sys.argv[1:]) if len(sys.argv) > 1 else [(20_000, 300)]
+    print(f"{os.cpu_count()} CPUs")
+    print(
+        f"{'shape':>14} {'decorator':>12} {'n_jobs':>6} {'seconds':>8} {'speedup':>8}"
+    )
+    for n_rows, n_columns in shapes:
+        df = make_matrix(n_rows, n_columns)
+        baselines = {}
+        for n_jobs in N_JOBS:
+            for name, decorator in get_decorators(n_jobs).items():
+                wrapped_func = decorator(lambda x: x)
+                start = time.perf_counter()
+                wrapped_func(df)
+                elapsed = time.perf_counter() - start
+                baselines.setdefault(name, elapsed)
+                print(
+                    f"{f'{n_rows}x{n_columns}':>14} {name:>12} {str(n_jobs):>6} "
+                    f"{elapsed:>8.2f} {baselines[name] / elapsed:>8.2f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+"""Benchmark a stack of talus_utils.dataframe decorators, eager versus lazy.
+
+Usage: python benchmarks/dataframe_pipeline.py [N_ROWS,N_COLUMNS ...]
+"""
+import sys
+
+import pandas as pd
+
+from dataframe_normalize import make_matrix, measure, parse_shapes
+
+from talus_utils import dataframe
+
+
+@dataframe.copy
+@dataframe.dropna(how="all")
+@dataframe.log_scaling()
+@dataframe.normalize(how="median")
+@dataframe.sort_row_values(how="median")
+def analyze(df: pd.DataFrame) -> pd.DataFrame:
+    """Return the transformed quant matrix."""
+    return df
+
+
+def main() -> None:
+    """Run the benchmark."""
+    benchmarks = {"eager": analyze, "lazy": dataframe.lazy(analyze)}
+    print(f"{'shape':>14} {'mode':>8} {'seconds':>8} {'peak MB':>8}")
+    for n_rows, n_columns in parse_shapes(sys.argv[1:]):
+        df = make_matrix(n_rows, n_columns)
+        for name, func in benchmarks.items():
+            elapsed, peak = measure(lambda: func(df))
+            print(
+                f"{f'{n_rows}x{n_columns}':>14} {name:>8} {elapsed:>8.2f} {peak:>8.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
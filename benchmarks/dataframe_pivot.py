@@ -0,0 +1,62 @@
+"""Benchmark the pivot_table decorator on long peptide x sample quant tables.
+
+Memory is the growth of the peak RSS of a forked child running each pivot.
+
+Usage: python benchmarks/dataframe_pivot.py [N_ROWS] [N_SAMPLES]
+"""
+
+import sys
+
+import numpy as np
+import pandas as pd
+
+from arrow_backend import measure_rss
+
+from talus_utils import dataframe
+
+
+def make_long_table(n_rows: int, n_samples: int, seed: int = 0) -> pd.DataFrame:
+    """Create a long quant table with unique (peptide, sample) pairs, like EncyclopeDIA exports."""
+    rng = np.random.default_rng(seed)
+    n_peptides = n_rows // n_samples
+    peptides = np.array([f"PEPTIDE{i}K" for i in range(n_peptides)], dtype=object)
+    samples = np.array([f"sample_{i:03d}.mzML" for i in range(n_samples)], dtype=object)
+    values = rng.lognormal(mean=10, sigma=2, size=n_peptides * n_samples)
+    values[rng.random(len(values)) < 0.2] = np.nan
+    return pd.DataFrame(
+        {
+            "Peptide": np.repeat(peptides, n_samples),
+            "Sample": np.tile(samples, n_peptides),
+            "Intensity": values,
+        }
+    )
+
+
+def main() -> None:
+    """Run the benchmark."""
+    n_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000_000
+    n_samples = int(sys.argv[2]) if len(sys.argv) > 2 else 300
+    df = make_long_table(n_rows, n_samples)
+    pivot_kwargs = {"index": "Peptide", "columns": "Sample", "values": "Intensity"}
+    pivots = {
+        "pandas": lambda: df.pivot_table(**pivot_kwargs),
+        "unique": dataframe.pivot_table(**pivot_kwargs)(lambda x: x),
+        "assume_unique": dataframe.pivot_table(**pivot_kwargs, assume_unique=True)(
+            lambda x: x
+        ),
+        "float32": dataframe.pivot_table(
+            **pivot_kwargs, assume_unique=True, dtype=np.float32
+        )(lambda x: x),
+    }
+    print(f"{len(df)} rows, {n_samples} samples")
+    print(f"{'pivot':>14} {'seconds':>8} {'peak MB':>8}")
+    for name, pivot in pivots.items():
+        if name == "pandas":
+            elapsed, peak = measure_rss(pivot)
+        else:
+            elapsed, peak = measure_rss(lambda: pivot(df))
+        print(f"{name:>14} {elapsed:>8.2f} {peak:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
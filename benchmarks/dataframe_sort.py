@@ -0,0 +1,45 @@
+"""Benchmark sort_row_values in talus_utils.dataframe, full sort versus top-k selection.
+
+Usage: python benchmarks/dataframe_sort.py [N_ROWS,N_COLUMNS ...]
+"""
+import sys
+
+import pandas as pd
+
+from dataframe_normalize import make_matrix, measure
+
+from talus_utils import dataframe
+
+
+def legacy_sort_row_values(df: pd.DataFrame, how: str) -> pd.DataFrame:
+    """Sort the rows the way it was done before, with a pandas reduction and reindex."""
+    return df.reindex(index=getattr(df, how)(axis=1).sort_values(ascending=False).index)
+
+
+def main() -> None:
+    """Run the benchmark."""
+    shapes = [tuple(int(n) for n in argument.split(",")) for argument in sys.argv[1:]]
+    print(f"{'shape':>14} {'how':>8} {'method':>12} {'seconds':>8} {'peak MB':>8}")
+    for n_rows, n_columns in shapes or [(1_000_000, 20)]:
+        df = make_matrix(n_rows, n_columns)
+        # Use string labels like peptide sequences, which makes reindex costlier.
+        df.index = "PEPTIDE" + pd.RangeIndex(n_rows).astype(str)
+        for how in ["max", "mean", "median"]:
+            benchmarks = {
+                "legacy": lambda: legacy_sort_row_values(df, how),
+                "full": lambda: dataframe.sort_row_values(how)(lambda x: x)(df),
+            }
+            for k in [50, 500]:
+                benchmarks[f"top_k={k}"] = lambda k=k: dataframe.sort_row_values(
+                    how, top_k=k
+                )(lambda x: x)(df)
+            for name, func in benchmarks.items():
+                elapsed, peak = measure(func)
+                print(
+                    f"{f'{n_rows}x{n_columns}':>14} {how:>8} {name:>12}"
+                    f" {elapsed:>8.2f} {peak:>8.1f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
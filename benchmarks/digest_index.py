@@ -0,0 +1,74 @@
+"""Benchmark building a PeptideIndex and mapping peptides to proteins.
+
+The synthetic proteome has about as many residues as the human one (11M), and the
+queries mix 80% digested peptides with 20% peptides that aren't in it. Memory is the
+growth of the peak RSS of a forked child running each step.
+
+Usage: python benchmarks/digest_index.py [N_PROTEINS] [N_QUERIES]
+"""
+
+import sys
+import tempfile
+
+from pathlib import Path
+from typing import Dict, List
+
+import numpy as np
+import pyarrow as pa
+
+from arrow_backend import measure_rss
+from fasta_index import write_fasta
+
+from talus_utils.digest import PeptideIndex, cleave
+from talus_utils.fasta import read_fasta
+
+
+def build_dict(path: Path) -> Dict[str, List[str]]:
+    """Map every peptide to its proteins with a dict of lists."""
+    peptide_proteins: Dict[str, List[str]] = {}
+    for record in read_fasta(path):
+        for peptide in cleave(record.sequence):
+            peptide_proteins.setdefault(peptide, []).append(record.accession)
+    return peptide_proteins
+
+
+def main() -> None:
+    """Run the benchmark."""
+    n_proteins = int(sys.argv[1]) if len(sys.argv) > 1 else 37_000
+    n_queries = int(sys.argv[2]) if len(sys.argv) > 2 else 10_000_000
+    rng = np.random.default_rng(0)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        fasta_path = Path(tmp_dir, "proteome.fasta")
+        index_path = Path(tmp_dir, "proteome.npz")
+        write_fasta(fasta_path, n_proteins)
+        index = PeptideIndex.from_fasta(fasta_path)
+        index.save(index_path)
+        peptide_proteins = build_dict(fasta_path)
+
+        peptides = np.array(list(peptide_proteins), dtype=object)
+        queries = peptides[rng.integers(0, len(peptides), n_queries)]
+        missing = rng.random(n_queries) < 0.2
+        queries[missing] = "X" + queries[missing]
+        arrow_queries = pa.array(queries, type=pa.large_string())
+        print(
+            f"{n_proteins} proteins, {len(index)} peptides, {n_queries} queries, "
+            f"index {index_path.stat().st_size / 1024 ** 2:.0f} MB"
+        )
+
+        steps = {
+            "dict build": lambda: build_dict(fasta_path),
+            "index build": lambda: PeptideIndex.from_fasta(fasta_path),
+            "index load": lambda: PeptideIndex.load(index_path),
+            "dict lookup": lambda: [peptide_proteins.get(q, []) for q in queries],
+            "index lookup": lambda: index.lookup(queries),
+            "map_peptides": lambda: index.map_peptides(queries),
+            "arrow lookup": lambda: index.lookup(arrow_queries),
+        }
+        print(f"{'step':>14} {'seconds':>8} {'peak MB':>8}")
+        for name, step in steps.items():
+            elapsed, peak = measure_rss(step)
+            print(f"{name:>14} {elapsed:>8.2f} {peak:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
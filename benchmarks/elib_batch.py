@@ -0,0 +1,54 @@
+"""Scaling benchmark for get_unique_peptide_proteins_batch over many elib files.
+
+Usage: python benchmarks/elib_batch.py [N_FILES] [N_ROWS]
+"""
+import os
+import sys
+import tempfile
+import time
+
+from pathlib import Path
+
+from synthetic_elib import make_elib
+
+from talus_utils.elib import get_unique_peptide_proteins_batch
+
+
+def main() -> None:
+    """Run the benchmark."""
+    n_files = int(sys.argv[1]) if len(sys.argv) > 1 else 32
+    n_rows = int(sys.argv[2]) if len(sys.argv) > 2 else 200_000
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        template = make_elib(Path(tmp_dir, "template.elib"), n_rows=n_rows)
+        filenames = []
+        for i in range(n_files):
+            filename = Path(tmp_dir, f"sample_{i:03d}.elib")
+            os.link(template, filename)
+            filenames.append(filename)
+
+        n_workers = [1]
+        while n_workers[-1] * 2 <= (os.cpu_count() or 1):
+            n_workers.append(n_workers[-1] * 2)
+
+        print(f"{n_files} files x {n_rows} rows")
+        print(f"{'executor':>10} {'workers':>8} {'seconds':>8} {'speedup':>8}")
+        for use_processes in [False, True]:
+            baseline = None
+            for max_workers in n_workers:
+                start = time.perf_counter()
+                get_unique_peptide_proteins_batch(
+                    elib_filenames=filenames,
+                    max_workers=max_workers,
+                    use_processes=use_processes,
+                )
+                elapsed = time.perf_counter() - start
+                baseline = baseline or elapsed
+                executor = "process" if use_processes else "thread"
+                print(
+                    f"{executor:>10} {max_workers:>8} {elapsed:>8.2f} {baseline / elapsed:>8.2f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
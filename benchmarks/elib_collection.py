@@ -0,0 +1,75 @@
+"""Compare a per-file query loop against ElibCollection's ATTACH + UNION ALL queries.
+
+Usage: python benchmarks/elib_collection.py [N_FILES] [N_ROWS]
+"""
+import os
+import sys
+import tempfile
+import time
+
+from pathlib import Path
+from typing import List
+
+import pandas as pd
+
+from synthetic_elib import make_elib
+
+from talus_utils.elib import ELIB_TABLES, Elib, ElibCollection
+
+
+QUERIES = {
+    "union": "SELECT PeptideSeq, ProteinAccession FROM {peptidetoprotein} WHERE isDecoy == 0;",
+    "count": "SELECT COUNT(DISTINCT ProteinAccession) AS Proteins FROM {peptidetoprotein};",
+    "metadata": "SELECT Value FROM {metadata} WHERE Key == 'version';",
+}
+
+
+def per_file_loop(filenames: List[Path], sql: str) -> pd.DataFrame:
+    """Run the query on every file with its own Elib and concatenate the results."""
+    dfs = []
+    for filename in filenames:
+        with Elib(key_or_filename=filename) as elib:
+            df = elib.execute_sql(
+                sql=sql.format_map({table: table for table in ELIB_TABLES}),
+                use_pandas=True,
+            )
+        dfs.append(df.assign(Sample=filename.stem))
+    return pd.concat(dfs, ignore_index=True)
+
+
+def collection(filenames: List[Path], sql: str) -> pd.DataFrame:
+    """Run the query once per batch of attached files."""
+    with ElibCollection(filenames) as elib_collection:
+        return pd.concat(elib_collection.execute_sql(sql=sql), ignore_index=True)
+
+
+def main() -> None:
+    """Run the benchmark."""
+    n_files = int(sys.argv[1]) if len(sys.argv) > 1 else 48
+    n_rows = int(sys.argv[2]) if len(sys.argv) > 2 else 50_000
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        template = make_elib(Path(tmp_dir, "template.elib"), n_rows=n_rows)
+        filenames = []
+        for i in range(n_files):
+            filename = Path(tmp_dir, f"sample_{i:03d}.elib")
+            os.link(template, filename)
+            filenames.append(filename)
+
+        print(f"{n_files} files x {n_rows} rows")
+        print(f"{'query':>10} {'loop (s)':>10} {'collection (s)':>15}")
+        for name, sql in QUERIES.items():
+            start = time.perf_counter()
+            df_loop = per_file_loop(filenames, sql)
+            loop_elapsed = time.perf_counter() - start
+
+            start = time.perf_counter()
+            df_collection = collection(filenames, sql)
+            collection_elapsed = time.perf_counter() - start
+
+            assert len(df_loop) == len(df_collection)
+            print(f"{name:>10} {loop_elapsed:>10.3f} {collection_elapsed:>15.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""Compare cross-run summaries served from SQLite and from exported Parquet datasets.
+
+Every round reopens each library and summarizes one SourceFile, which is what
+cross-run analyses that repeatedly revisit the same libraries do.
+
+Usage: python benchmarks/elib_parquet.py [N_ROWS] [N_ROUNDS]
+"""
+import sys
+import tempfile
+import time
+
+from pathlib import Path
+
+import pyarrow.dataset as ds
+
+from synthetic_elib import make_elib
+
+from talus_utils.elib import Elib, ElibParquet
+
+
+def main() -> None:
+    """Run the benchmark."""
+    n_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 500_000
+    n_rounds = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+    n_source_files = 24
+    source_files = [f"sample_{source:03d}.mzML" for source in range(n_source_files)]
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        filename = make_elib(
+            Path(tmp_dir, "synthetic.elib"),
+            n_rows=n_rows,
+            n_source_files=n_source_files,
+        )
+        start = time.perf_counter()
+        with Elib(key_or_filename=filename) as elib:
+            directory = elib.to_parquet(Path(tmp_dir, "parquet"))
+        print(f"{n_rows} rows, export took {time.perf_counter() - start:.2f} s")
+
+        start = time.perf_counter()
+        for _ in range(n_rounds):
+            for source_file in source_files[:4]:
+                with Elib(key_or_filename=filename, read_only=True) as elib:
+                    elib.count_distinct(
+                        "peptidescores",
+                        "PeptideSeq",
+                        where="IsDecoy == 0 AND QValue <= ? AND SourceFile == ?",
+                        parameters=(0.01, source_file),
+                    )
+        sqlite_elapsed = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for _ in range(n_rounds):
+            for source_file in source_files[:4]:
+                ElibParquet(directory).count_distinct(
+                    "peptidescores",
+                    "PeptideSeq",
+                    filter=~ds.field("IsDecoy")
+                    & (ds.field("QValue") <= 0.01)
+                    & (ds.field("SourceFile") == source_file),
+                )
+        parquet_elapsed = time.perf_counter() - start
+
+        print(f"{'sqlite':>8} {sqlite_elapsed:>8.2f} s")
+        print(f"{'parquet':>8} {parquet_elapsed:>8.2f} s")
+
+
+if __name__ == "__main__":
+    main()
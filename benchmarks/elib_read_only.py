@@ -0,0 +1,64 @@
+"""Compare repeated dashboard queries on a default and a read-only tuned Elib.
+
+Usage: python benchmarks/elib_read_only.py [N_ROWS] [N_REPEATS]
+"""
+import sys
+import tempfile
+import time
+
+from pathlib import Path
+
+from synthetic_elib import make_elib
+
+from talus_utils.elib import Elib
+
+
+QUERIES = [
+    (
+        "SELECT SourceFile, COUNT(DISTINCT PeptideSeq) FROM peptidescores "
+        "WHERE IsDecoy == 0 AND QValue <= ? GROUP BY SourceFile;",
+        (0.01,),
+    ),
+    (
+        "SELECT ProteinAccession, MIN(QValue) FROM proteinscores "
+        "WHERE IsDecoy == 0 GROUP BY ProteinAccession HAVING MIN(QValue) <= ?;",
+        (0.01,),
+    ),
+    (
+        "SELECT PeptideSeq, ProteinAccession FROM peptidetoprotein "
+        "WHERE ProteinAccession == ?;",
+        ("sp|P00042|PROT42_HUMAN",),
+    ),
+]
+
+
+def run(elib: Elib, n_repeats: int) -> float:
+    """Run every query n_repeats times and return the elapsed seconds."""
+    start = time.perf_counter()
+    for _ in range(n_repeats):
+        for sql, parameters in QUERIES:
+            elib.execute_sql(sql=sql, parameters=parameters).fetchall()
+        elib.get_summary()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    """Run the benchmark."""
+    n_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 500_000
+    n_repeats = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        filename = make_elib(
+            Path(tmp_dir, "synthetic.elib"), n_rows=n_rows, n_source_files=24
+        )
+        print(f"{n_rows} rows, {n_repeats} repeats")
+        timings = {}
+        for read_only in [False, True]:
+            elib = Elib(key_or_filename=filename, read_only=read_only)
+            timings[read_only] = run(elib, n_repeats)
+            elib.close()
+            print(f"read_only={read_only!s:<5} {timings[read_only]:>8.2f} s")
+        print(f"speedup: {timings[False] / timings[True]:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
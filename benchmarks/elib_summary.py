@@ -0,0 +1,73 @@
+"""Compare counting unique peptides/proteins in SQLite against loading them into pandas.
+
+Usage: python benchmarks/elib_summary.py [N_ROWS]
+"""
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from pathlib import Path
+from typing import Any, Callable, Tuple
+
+from synthetic_elib import make_elib
+
+from talus_utils.elib import Elib
+
+
+def pandas_counts(elib: Elib) -> Tuple[int, int]:
+    """Count unique proteins and peptides the way it was done before, in pandas."""
+    peptide_to_protein = elib.execute_sql(
+        sql="SELECT PeptideSeq, ProteinAccession FROM peptidetoprotein WHERE isDecoy == 0;",
+        use_pandas=True,
+    )
+    return (
+        peptide_to_protein["ProteinAccession"].nunique(),
+        peptide_to_protein["PeptideSeq"].nunique(),
+    )
+
+
+def sqlite_counts(elib: Elib) -> Tuple[int, int]:
+    """Count unique proteins and peptides with COUNT(DISTINCT ...) in SQLite."""
+    return (
+        elib.count_distinct("peptidetoprotein", "ProteinAccession", "isDecoy == 0"),
+        elib.count_distinct("peptidetoprotein", "PeptideSeq", "isDecoy == 0"),
+    )
+
+
+def measure(func: Callable[[Elib], Any], elib: Elib) -> Tuple[Any, float, float]:
+    """Return the result, wall time in seconds and peak traced memory in MB.
+
+    tracemalloc only sees Python allocations; SQLite's own page cache is bounded
+    by its cache_size pragma and not included.
+    """
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = func(elib)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, peak / 1024 ** 2
+
+
+def main() -> None:
+    """Run the benchmark."""
+    n_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        elib = Elib(make_elib(Path(tmp_dir, "synthetic.elib"), n_rows=n_rows))
+        print(f"{n_rows} rows")
+        print(f"{'path':>8} {'seconds':>8} {'peak MB':>8}")
+        results = []
+        for name, func in [("pandas", pandas_counts), ("sqlite", sqlite_counts)]:
+            result, elapsed, peak = measure(func, elib)
+            results.append(result)
+            print(f"{name:>8} {elapsed:>8.2f} {peak:>8.1f}")
+        assert results[0] == results[1]
+
+        _, elapsed, peak = measure(lambda elib: elib.get_summary(), elib)
+        print(f"get_summary: {elapsed:.2f} s, {peak:.1f} MB peak")
+        elib.close()
+
+
+if __name__ == "__main__":
+    main()
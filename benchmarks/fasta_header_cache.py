@@ -0,0 +1,58 @@
+"""Benchmark the cached header parse functions on repeated ProteinAccession values.
+
+Memory is the growth of the peak RSS of a forked child running each parser, which
+includes the parsed Series.
+
+Usage: python benchmarks/fasta_header_cache.py [N_ROWS] [N_PROTEINS]
+"""
+
+import sys
+
+from arrow_backend import measure_rss
+from fasta_headers import make_accessions
+
+from talus_utils.fasta import (
+    header_cache_clear,
+    header_cache_info,
+    parse_fasta_header_series,
+    parse_fasta_header_uniprot_protein,
+    parse_fasta_headers,
+)
+
+
+def parse_protein_uncached(fasta_header: str) -> str:
+    """Parse the protein name the way parse_fasta_header_uniprot_protein did before caching."""
+    db, unique_identifier, entry_name = fasta_header.split("|")
+    if not db or not unique_identifier or not entry_name:
+        raise ValueError("Invalid Fasta Header.")
+    protein_name, species_name = entry_name.split("_")
+    if not protein_name or not species_name:
+        raise ValueError("Invalid Fasta Header Entry Name.")
+    return protein_name
+
+
+def main() -> None:
+    """Run the benchmark."""
+    n_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 5_000_000
+    n_proteins = int(sys.argv[2]) if len(sys.argv) > 2 else 20_000
+    accessions = make_accessions(n_rows, n_proteins)
+    parsers = {
+        "uncached apply": lambda: accessions.apply(parse_protein_uncached),
+        "cached apply": lambda: accessions.apply(parse_fasta_header_uniprot_protein),
+        "series": lambda: parse_fasta_header_series(accessions),
+        "bulk arrow": lambda: parse_fasta_headers(accessions),
+    }
+    print(f"{n_rows} rows, {n_proteins} proteins")
+    print(f"{'parser':>16} {'seconds':>8} {'peak MB':>8}")
+    for name, parser in parsers.items():
+        header_cache_clear()
+        elapsed, peak = measure_rss(parser)
+        print(f"{name:>16} {elapsed:>8.2f} {peak:>8.1f}")
+
+    accessions.apply(parse_fasta_header_uniprot_protein)
+    for name, cache_info in header_cache_info().items():
+        print(f"{name}: {cache_info}")
+
+
+if __name__ == "__main__":
+    main()
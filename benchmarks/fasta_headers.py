@@ -0,0 +1,55 @@
+"""Benchmark bulk fasta header parsing against the per-row parsers.
+
+Memory is the growth of the peak RSS of a forked child running each parser.
+
+Usage: python benchmarks/fasta_headers.py [N_ROWS]
+"""
+
+import sys
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+from arrow_backend import measure_rss
+
+from talus_utils.fasta import (
+    parse_fasta_header,
+    parse_fasta_header_uniprot_entry,
+    parse_fasta_header_uniprot_protein,
+    parse_fasta_headers,
+)
+
+
+def make_accessions(n_rows: int, n_proteins: int = 20_000, seed: int = 0) -> pd.Series:
+    """Create a ProteinAccession column, with every protein repeated over peptides and runs."""
+    rng = np.random.default_rng(seed)
+    proteins = np.array(
+        [f"sp|P{i:05d}|PROT{i}_HUMAN" for i in range(n_proteins)], dtype=object
+    )
+    return pd.Series(proteins[rng.integers(0, n_proteins, n_rows)])
+
+
+def main() -> None:
+    """Run the benchmark."""
+    n_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 5_000_000
+    accessions = make_accessions(n_rows)
+    array = pa.array(accessions, type=pa.string())
+    parsers = {
+        "apply protein": lambda: accessions.apply(parse_fasta_header_uniprot_protein),
+        "apply all": lambda: (
+            accessions.apply(parse_fasta_header),
+            accessions.apply(parse_fasta_header_uniprot_entry),
+        ),
+        "bulk pandas": lambda: parse_fasta_headers(accessions),
+        "bulk arrow": lambda: parse_fasta_headers(array),
+    }
+    print(f"{n_rows} rows")
+    print(f"{'parser':>14} {'seconds':>8} {'peak MB':>8}")
+    for name, parser in parsers.items():
+        elapsed, peak = measure_rss(parser)
+        print(f"{name:>14} {elapsed:>8.2f} {peak:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""Benchmark streaming and indexed reads of a synthetic UniProtKB/TrEMBL-like FASTA file.
+
+TrEMBL has about 250M entries with a mean length of about 300 residues. The default
+size fits on a laptop, pass N_ENTRIES to scale it up. Memory is the growth of the
+peak RSS of a forked child running each step.
+
+Usage: python benchmarks/fasta_index.py [N_ENTRIES]
+"""
+
+import sys
+import tempfile
+import time
+
+from pathlib import Path
+from typing import Dict
+
+import numpy as np
+
+from arrow_backend import measure_rss
+
+from talus_utils.fasta import IndexedFasta, index_fasta, read_fasta
+
+AMINO_ACIDS = np.frombuffer(b"ACDEFGHIKLMNPQRSTVWY", dtype=np.uint8)
+LINE_WIDTH = 60
+
+
+def write_fasta(path: Path, n_entries: int, seed: int = 0) -> None:
+    """Write a FASTA file with TrEMBL-like headers and 60 residue lines."""
+    rng = np.random.default_rng(seed)
+    with open(path, "w") as fasta_file:
+        for chunk_start in range(0, n_entries, 10_000):
+            n_chunk = min(10_000, n_entries - chunk_start)
+            lengths = rng.gamma(shape=2.0, scale=150, size=n_chunk).astype(int) + 10
+            residues = AMINO_ACIDS[rng.integers(0, 20, lengths.sum())].tobytes()
+            entries = []
+            position = 0
+            for i, length in enumerate(lengths):
+                sequence = residues[position : position + length].decode()
+                position += length
+                accession = f"A0A{chunk_start + i:07d}"
+                lines = [
+                    sequence[start : start + LINE_WIDTH]
+                    for start in range(0, length, LINE_WIDTH)
+                ]
+                entries.append(
+                    f">tr|{accession}|{accession}_HUMAN Uncharacterized protein "
+                    f"OS=Homo sapiens OX=9606 GN=G{i} PE=4 SV=1\n" + "\n".join(lines)
+                )
+            fasta_file.write("\n".join(entries) + "\n")
+
+
+def load_dict(path: Path) -> Dict[str, str]:
+    """Load the whole file into a dict, the way scripts did before."""
+    sequences = {}
+    accession = None
+    with open(path) as fasta_file:
+        for line in fasta_file:
+            if line.startswith(">"):
+                accession = line.split("|")[1]
+                sequences[accession] = ""
+            else:
+                sequences[accession] += line.strip()
+    return sequences
+
+
+def main() -> None:
+    """Run the benchmark."""
+    n_entries = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    rng = np.random.default_rng(1)
+    keys = [f"A0A{i:07d}" for i in rng.integers(0, n_entries, 100_000)]
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = Path(tmp_dir, "trembl.fasta")
+        write_fasta(path, n_entries)
+        print(f"{n_entries} entries, {path.stat().st_size / 1024 ** 2:.0f} MB")
+
+        def lookup() -> None:
+            with IndexedFasta(path) as fasta:
+                start = time.perf_counter()
+                for key in keys:
+                    _ = fasta[key]
+                elapsed = time.perf_counter() - start
+                print(f"{'':>16} {1e6 * elapsed / len(keys):.1f} us per lookup")
+
+        steps = {
+            "dict": lambda: load_dict(path),
+            "read_fasta": lambda: sum(1 for _ in read_fasta(path)),
+            "index_fasta": lambda: index_fasta(path),
+            "open_index": lambda: IndexedFasta(path).close(),
+            "100k lookups": lookup,
+        }
+        print(f"{'step':>16} {'seconds':>8} {'peak MB':>8}")
+        for name, step in steps.items():
+            elapsed, peak = measure_rss(step)
+            print(f"{name:>16} {elapsed:>8.2f} {peak:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""Benchmark the talus_utils.dataframe decorators on Parquet files, in memory and streamed.
+
+The in-memory pipeline reads the whole file into a pandas DataFrame, the streamed one
+passes a ParquetFrame and writes the result batch by batch. Memory is the growth of
+the peak RSS of a forked child running each pipeline.
+
+Usage: python benchmarks/parquet_streaming.py [N_ROWS]
+"""
+import sys
+import tempfile
+
+from pathlib import Path
+from typing import Any, Callable
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from arrow_backend import measure_rss
+from dataframe_normalize import make_matrix
+
+from talus_utils import dataframe
+from talus_utils.parquet import ParquetFrame
+
+
+def make_pipeline(how: str) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """Return a decorator that drops empty rows, log scales and normalizes."""
+
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        return dataframe.dropna(how="all")(
+            dataframe.log_scaling()(dataframe.normalize(how=how)(func))
+        )
+
+    return decorator
+
+
+def main() -> None:
+    """Run the benchmark."""
+    n_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 2_000_000
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        input_path = Path(tmp_dir, "input.parquet")
+        output_path = Path(tmp_dir, "output.parquet")
+        # Write in slices so that the input is never fully in memory either.
+        writer = None
+        for start in range(0, n_rows, 500_000):
+            matrix = make_matrix(min(500_000, n_rows - start), 20, seed=start)
+            matrix.columns = matrix.columns.astype(str)
+            table = pa.Table.from_pandas(matrix, preserve_index=False)
+            if writer is None:
+                writer = pq.ParquetWriter(input_path, table.schema)
+            writer.write_table(table)
+        writer.close()
+        size_mb = input_path.stat().st_size / 1024 ** 2
+        print(f"{n_rows} rows x 20 columns, {size_mb:.0f} MB on disk")
+
+        print(f"{'normalize':>10} {'mode':>9} {'seconds':>8} {'peak MB':>8}")
+        for how in ["row", "median", "quantile"]:
+            pipeline = make_pipeline(how)
+            in_memory = pipeline(lambda df: df.to_parquet(output_path, index=False))
+            streamed = pipeline(lambda df: df.write(output_path))
+            runs = [
+                ("in-memory", lambda: in_memory(pq.read_table(input_path).to_pandas())),
+                ("streamed", lambda: streamed(ParquetFrame(input_path))),
+            ]
+            for mode, func in runs:
+                elapsed, peak = measure_rss(func)
+                print(f"{how:>10} {mode:>9} {elapsed:>8.2f} {peak:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
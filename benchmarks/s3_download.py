@@ -0,0 +1,98 @@
+"""Peak-RSS benchmark for downloading .elib files from S3.
+
+Starts a local moto S3 server, uploads objects of increasing size and downloads
+each one in a fresh subprocess, once with the in-memory ``_read_object`` path
+and once with the streaming ``_download_object`` path. The streaming path should
+stay flat regardless of the object size.
+
+Usage: python benchmarks/s3_download.py [SIZE_MB ...]
+"""
+import logging
+import os
+import subprocess
+import sys
+import tempfile
+
+import boto3
+
+from moto.server import ThreadedMotoServer
+
+
+BUCKET = "talus-utils-benchmark"
+CHUNK = 8 * 1024 * 1024
+
+CHILD = """
+import sys, tempfile
+from talus_utils.s3 import _download_object, _read_object
+
+mode, bucket, key = sys.argv[1:4]
+if mode == "read_object":
+    data = _read_object(bucket=bucket, key=key)
+    with tempfile.NamedTemporaryFile() as tmp:
+        tmp.write(data.read())
+else:
+    with tempfile.NamedTemporaryFile() as tmp:
+        _download_object(bucket=bucket, key=key, filename=tmp.name)
+# VmHWM is the peak RSS of this process image only, unlike ru_maxrss which
+# inherits the high-water mark of the (moto server) parent across fork/exec.
+with open("/proc/self/status") as status:
+    print(next(line.split()[1] for line in status if line.startswith("VmHWM")))
+"""
+
+
+def upload(s3_client: "boto3.client", key: str, size_mb: int) -> None:
+    """Upload an object of size_mb megabytes without holding it in memory."""
+    with tempfile.NamedTemporaryFile() as tmp:
+        for _ in range(size_mb * 1024 * 1024 // CHUNK):
+            tmp.write(os.urandom(CHUNK))
+        tmp.flush()
+        s3_client.upload_file(Filename=tmp.name, Bucket=BUCKET, Key=key)
+
+
+def peak_rss_mb(mode: str, key: str, env: dict) -> float:
+    """Run a download in a subprocess and return its peak RSS in megabytes."""
+    output = subprocess.run(
+        [sys.executable, "-c", CHILD, mode, BUCKET, key],
+        env=env,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    # VmHWM is reported in kilobytes.
+    return int(output.strip()) / 1024
+
+
+def main() -> None:
+    """Run the benchmark."""
+    sizes = [int(size) for size in sys.argv[1:]] or [64, 256, 1024]
+    server = ThreadedMotoServer(port=0)
+    server.start()
+    host, port = server.get_host_and_port()
+    env = dict(
+        os.environ,
+        AWS_ENDPOINT_URL=f"http://{host}:{port}",
+        AWS_ACCESS_KEY_ID="testing",
+        AWS_SECRET_ACCESS_KEY="testing",
+        AWS_DEFAULT_REGION="us-east-1",
+    )
+    os.environ.update(env)
+    try:
+        s3_client = boto3.client("s3")
+        s3_client.create_bucket(Bucket=BUCKET)
+        print(
+            f"{'size (MB)':>10} {'read_object (MB)':>18} {'download_object (MB)':>22}"
+        )
+        for size_mb in sizes:
+            key = f"{size_mb}.elib"
+            upload(s3_client, key, size_mb)
+            in_memory = peak_rss_mb("read_object", key, env)
+            streaming = peak_rss_mb("download_object", key, env)
+            print(f"{size_mb:>10} {in_memory:>18.1f} {streaming:>22.1f}")
+            s3_client.delete_object(Bucket=BUCKET, Key=key)
+    finally:
+        server.stop()
+
+
+if __name__ == "__main__":
+    logging.getLogger("werkzeug").setLevel(logging.ERROR)
+    main()
@@ -0,0 +1,94 @@
+"""Generate synthetic .elib files with the EncyclopeDIA schema for benchmarks."""
+import sqlite3
+
+from pathlib import Path
+from typing import Union
+
+import numpy as np
+
+
+SCHEMA = """
+CREATE TABLE metadata ( Key string not null, Value string not null );
+CREATE TABLE peptidetoprotein (PeptideSeq string not null,isDecoy boolean,ProteinAccession string not null);
+CREATE TABLE peptidescores ( PrecursorCharge int not null, PeptideModSeq string not null, PeptideSeq string not null, SourceFile string not null, QValue double not null, PosteriorErrorProbability double not null, IsDecoy boolean not null );
+CREATE TABLE proteinscores ( ProteinGroup int not null, ProteinAccession string not null, SourceFile string not null, QValue double not null, MinimumPeptidePEP double not null, IsDecoy boolean not null );
+CREATE INDEX 'Key_Metadata_index' on 'metadata' ('Key' ASC);
+CREATE INDEX 'PeptideModSeq_PrecursorCharge_SourceFile_Scores_index' on 'peptidescores' ('PeptideModSeq' ASC, 'PrecursorCharge' ASC, 'SourceFile' ASC);
+CREATE INDEX 'PeptideSeq_Scores_index' on 'peptidescores' ('PeptideSeq' ASC);
+CREATE INDEX 'ProteinGroup_ProteinScores_index' on 'proteinscores' ('ProteinGroup' ASC);
+CREATE INDEX 'ProteinAccession_ProteinScores_index' on 'proteinscores' ('ProteinAccession' ASC);
+CREATE INDEX 'ProteinAccession_PeptideToProtein_index' on 'peptidetoprotein' ('ProteinAccession' ASC);
+CREATE INDEX 'PeptideSeq_PeptideToProtein_index' on 'peptidetoprotein' ('PeptideSeq' ASC);
+"""
+
+AMINO_ACIDS = np.array(list("ACDEFGHIKLMNPQRSTVWY"))
+
+
+def make_elib(
+    filename: Union[Path, str],
+    n_rows: int,
+    n_proteins: int = 20000,
+    n_source_files: int = 1,
+    decoy_fraction: float = 0.1,
+    seed: int = 0,
+) -> Path:
+    """Write a synthetic elib file with n_rows rows in each table.
+
+    Parameters
+    ----------
+    filename : Union[Path, str]
+        The path of the elib file to create.
+    n_rows : int
+        The number of rows in peptidetoprotein, peptidescores and proteinscores.
+    n_proteins : int
+        The number of distinct protein accessions. (Default value = 20000).
+    n_source_files : int
+        The number of distinct SourceFile values. (Default value = 1).
+    decoy_fraction : float
+        The fraction of decoy rows. (Default value = 0.1).
+    seed : int
+        The random seed. (Default value = 0).
+
+    Returns
+    -------
+    Path
+        The path to the created file.
+    """
+    rng = np.random.default_rng(seed)
+    filename = Path(filename)
+    filename.unlink(missing_ok=True)
+
+    peptides = [
+        "".join(residues)
+        for residues in AMINO_ACIDS[rng.integers(0, 20, size=(n_rows, 12))]
+    ]
+    accessions = [
+        f"sp|P{protein:05d}|PROT{protein}_HUMAN"
+        for protein in rng.integers(0, n_proteins, size=n_rows)
+    ]
+    source_files = [
+        f"sample_{source:03d}.mzML"
+        for source in rng.integers(0, n_source_files, size=n_rows)
+    ]
+    decoys = (rng.random(n_rows) < decoy_fraction).astype(int).tolist()
+    qvalues = (rng.random(n_rows) * 0.05).tolist()
+    charges = rng.integers(2, 5, size=n_rows).tolist()
+
+    connection = sqlite3.connect(filename)
+    connection.executescript(SCHEMA)
+    connection.executemany(
+        "INSERT INTO peptidetoprotein VALUES (?, ?, ?);",
+        zip(peptides, decoys, accessions),
+    )
+    connection.executemany(
+        "INSERT INTO peptidescores VALUES (?, ?, ?, ?, ?, ?, ?);",
+        zip(charges, peptides, peptides, source_files, qvalues, qvalues, decoys),
+    )
+    connection.executemany(
+        "INSERT INTO proteinscores VALUES (?, ?, ?, ?, ?, ?);",
+        zip(range(n_rows), accessions, source_files, qvalues, qvalues, decoys),
+    )
+    connection.execute("INSERT INTO metadata VALUES ('version', '0.1.14');")
+    connection.commit()
+    connection.close()
+    return filename
@@ -21,25 +21,27 @@ def subcellular_enrichment_scores(
         A pandas data frame of enrichment scores.
 
     """
-    for sample in proteins_with_locations["Sample"].unique():
-        sample_df = proteins_with_locations.loc[
-            proteins_with_locations["Sample"] == sample
-        ]
-        # Calculate the fraction that each group (each location) represents of the whole dataset
-        total_proteins = sample_df["Protein"].nunique()
-        sample_df = sample_df.groupby("Main location", as_index=False).apply(
-            lambda location: location["Protein"].nunique() / total_proteins
-        )
-        sample_df.columns = ["Main location", sample]
-        expected_fractions_of_locations = pd.merge(
-            expected_fractions_of_locations, sample_df, on="Main location", how="left"
-        )
-        # Calculate the enrichment score by dividing the fraction of each location in the dataset by the expected fraction of each location
-        expected_fractions_of_locations[sample] /= expected_fractions_of_locations[
-            "Expected Fraction"
-        ]
+    samples = proteins_with_locations["Sample"].unique()
+    # Count the proteins of all (sample, location) pairs at once instead of masking every sample.
+    location_proteins = proteins_with_locations.groupby(["Sample", "Main location"])[
+        "Protein"
+    ].nunique()
+    total_proteins = proteins_with_locations.groupby("Sample")["Protein"].nunique()
+    fractions = location_proteins.div(total_proteins, level="Sample").unstack("Sample")
+
+    expected_fractions_of_locations = expected_fractions_of_locations.set_index(
+        "Main location"
+    )
+    fractions = fractions.reindex(
+        index=expected_fractions_of_locations.index, columns=samples
+    )
+    # Calculate the enrichment score by dividing the fraction of each location in the dataset by the expected fraction of each location
+    enrichment_scores = fractions.div(
+        expected_fractions_of_locations["Expected Fraction"], axis=0
+    )
+    enrichment_scores.columns.name = None
 
     expected_fractions_of_locations = expected_fractions_of_locations.drop(
         ["Expected Fraction", "# of Proteins", "Total # of Proteins"], axis=1
     )
-    return expected_fractions_of_locations.set_index("Main location")
+    return pd.concat([expected_fractions_of_locations, enrichment_scores], axis=1)
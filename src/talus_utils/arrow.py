@@ -0,0 +1,381 @@
+"""src/talus_utils/arrow.py module."""
+
+import functools
+
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from .constants import (
+    COLUMN_NORMALIZATIONS,
+    MEDIAN_NORMALIZATIONS,
+    MINMAX_NORMALIZATIONS,
+    QUANTILE_NORMALIZATIONS,
+    ROW_NORMALIZATIONS,
+)
+
+
+# numpy logarithms and their pyarrow.compute kernels.
+LOG_KERNELS = {np.log10: pc.log10, np.log2: pc.log2, np.log: pc.ln, np.log1p: pc.log1p}
+
+
+def _is_numeric(column: pa.ChunkedArray) -> bool:
+    """Check whether a column holds integer or floating point values.
+
+    Parameters
+    ----------
+    column : pa.ChunkedArray
+        The column.
+
+    Returns
+    -------
+    bool
+        True if the column is numeric.
+    """
+    return pa.types.is_integer(column.type) or pa.types.is_floating(column.type)
+
+
+def _numeric_columns(table: pa.Table) -> List[str]:
+    """Return the names of the numeric columns of a table.
+
+    Parameters
+    ----------
+    table : pa.Table
+        The input table.
+
+    Returns
+    -------
+    List[str]
+        The names of the integer and floating point columns.
+    """
+    return [
+        name
+        for name, column in zip(table.column_names, table.columns)
+        if _is_numeric(column)
+    ]
+
+
+def _replace_columns(table: pa.Table, columns: Dict[str, Any]) -> pa.Table:
+    """Replace columns of a table, keeping their position.
+
+    Parameters
+    ----------
+    table : pa.Table
+        The input table.
+    columns : Dict[str, Any]
+        The new columns by name.
+
+    Returns
+    -------
+    pa.Table
+        The table with the columns replaced.
+    """
+    for name, column in columns.items():
+        i = table.column_names.index(name)
+        table = table.set_column(i, name, column)
+    return table
+
+
+def dropna(
+    table: pa.Table,
+    axis: int = 0,
+    how: str = "any",
+    thresh: Optional[int] = None,
+    subset: Optional[Sequence[str]] = None,
+    inplace: bool = False,
+) -> pa.Table:
+    """Drop the rows or columns of a table with null values, like pd.DataFrame.dropna.
+
+    Like the other functions of this module, only nulls are missing values, not
+    floating point NaN. pa.Table.from_pandas converts NaN to null.
+
+    Parameters
+    ----------
+    table : pa.Table
+        The input table.
+    axis : int
+        0 or 'index' to drop rows, 1 or 'columns' to drop columns. (Default value = 0).
+    how : str
+        'any' to drop if any value is missing, 'all' if all values are. (Default value = 'any').
+    thresh : Optional[int]
+        If given, keep the rows or columns with at least this many values. (Default value = None).
+    subset : Optional[Sequence[str]]
+        The columns to consider when dropping rows. (Default value = None).
+    inplace : bool
+        Ignored, tables are immutable. (Default value = False).
+
+    Returns
+    -------
+    pa.Table
+        The table without the rows or columns with missing values.
+
+    Raises
+    ------
+    ValueError
+        If how or axis is invalid.
+    """
+    if how not in ("any", "all"):
+        raise ValueError(f"Invalid how option: {how}")
+
+    if axis in (1, "columns"):
+        keep = []
+        for name, column in zip(table.column_names, table.columns):
+            n_missing = column.null_count
+            n_valid = len(column) - n_missing
+            if thresh is not None:
+                is_kept = n_valid >= thresh
+            elif how == "any":
+                is_kept = n_missing == 0
+            else:
+                is_kept = n_valid > 0
+            if is_kept:
+                keep.append(name)
+        return table.select(keep)
+    if axis not in (0, "index"):
+        raise ValueError(f"No axis named {axis} for object type Table")
+
+    names = table.column_names if subset is None else list(subset)
+    if not names:
+        return table
+    is_valid = [pc.is_valid(table[name]) for name in names]
+    if thresh is not None:
+        n_valid = functools.reduce(
+            pc.add, [pc.cast(valid, pa.int32()) for valid in is_valid]
+        )
+        mask = pc.greater_equal(n_valid, thresh)
+    elif how == "any":
+        mask = functools.reduce(pc.and_, is_valid)
+    else:
+        mask = functools.reduce(pc.or_, is_valid)
+    if pc.all(mask).as_py():
+        # Tables are immutable, so there's no need to copy.
+        return table
+    return table.filter(mask)
+
+
+def explode(
+    table: pa.Table,
+    column: str,
+    sep: Optional[str] = None,
+    categorical: bool = False,
+) -> pa.Table:
+    """Explode a column of lists or separated strings of a table, like pd.DataFrame.explode.
+
+    Null values and empty lists are kept as a single null row.
+
+    Parameters
+    ----------
+    table : pa.Table
+        The input table.
+    column : str
+        The column to explode.
+    sep : Optional[str]
+        If given, split the strings of the column with this separator. (Default value = None).
+    categorical : bool
+        If True, dictionary encode the exploded column. (Default value = False).
+
+    Returns
+    -------
+    pa.Table
+        A table with the given column exploded.
+
+    Raises
+    ------
+    TypeError
+        If the column doesn't hold lists, or strings when sep is given.
+    """
+    values = table[column].combine_chunks()
+    if pa.types.is_dictionary(values.type):
+        values = values.dictionary_decode()
+    if sep:
+        if not (
+            pa.types.is_string(values.type) or pa.types.is_large_string(values.type)
+        ):
+            raise TypeError(f"Column '{column}' needs to hold strings to be split.")
+        values = pc.split_pattern(values, pattern=sep)
+    elif not (pa.types.is_list(values.type) or pa.types.is_large_list(values.type)):
+        raise TypeError(f"Column '{column}' needs to hold lists to be exploded.")
+
+    lengths = pc.fill_null(pc.list_value_length(values), 0).to_numpy()
+    # Like pandas, nulls and empty lists become a single missing value.
+    is_filler = lengths == 0
+    exploded_table = table.take(
+        np.repeat(np.arange(len(table)), np.maximum(lengths, 1))
+    )
+
+    flat = pc.list_flatten(values)
+    is_filler = np.repeat(is_filler, np.maximum(lengths, 1))
+    if is_filler.any():
+        indices = np.zeros(len(is_filler), dtype=np.int64)
+        indices[~is_filler] = np.arange(len(flat))
+        flat = pc.take(flat, pa.array(indices, mask=is_filler))
+    if categorical:
+        flat = pc.dictionary_encode(flat)
+    return _replace_columns(exploded_table, {column: flat})
+
+
+def update_column(
+    table: pa.Table, column: str, update_func: Callable[..., Any]
+) -> pa.Table:
+    """Apply a function to the values of a column of a table.
+
+    The function is only called once per distinct value that isn't null, and nulls stay
+    null.
+
+    Parameters
+    ----------
+    table : pa.Table
+        The input table.
+    column : str
+        The column to update.
+    update_func : Callable[..., Any]
+        The function to apply to every value.
+
+    Returns
+    -------
+    pa.Table
+        The table with the column updated.
+    """
+    values = table[column].combine_chunks()
+    if pa.types.is_dictionary(values.type):
+        encoded = values
+    else:
+        encoded = pc.dictionary_encode(values)
+    dictionary = pa.array(
+        [update_func(value) for value in encoded.dictionary.to_pylist()]
+    )
+    return _replace_columns(table, {column: pc.take(dictionary, encoded.indices)})
+
+
+def log_scaling(
+    table: pa.Table,
+    log_function: Callable[..., Any] = np.log10,
+    filter_outliers: bool = True,
+) -> pa.Table:
+    """Apply a log scale to the numeric columns of a table.
+
+    Parameters
+    ----------
+    table : pa.Table
+        The input table.
+    log_function : Callable[..., Any]
+        The logarithm function to apply. (Default value = np.log10).
+    filter_outliers : bool
+        If False, set all values below 1 to 1 instead of null. (Default value = True).
+
+    Returns
+    -------
+    pa.Table
+        The table with its numeric columns log scaled. Other columns are kept as they are.
+    """
+    columns = {}
+    for name in _numeric_columns(table):
+        column = pc.cast(table[name], pa.float64())
+        is_outlier = pc.less(column, 1)
+        if filter_outliers:
+            column = pc.if_else(is_outlier, pa.scalar(None, pa.float64()), column)
+        else:
+            column = pc.if_else(is_outlier, 1.0, column)
+        if log_function in LOG_KERNELS:
+            columns[name] = LOG_KERNELS[log_function](column)
+        else:
+            # Other functions run on NumPy arrays, with nulls as NaN.
+            values = column.to_numpy()
+            columns[name] = pa.array(log_function(values), from_pandas=True)
+    return _replace_columns(table, columns)
+
+
+def _normalize_columns(
+    table: pa.Table, names: List[str], how: str
+) -> Dict[str, pa.ChunkedArray]:
+    """Normalize numeric columns of a table with pyarrow.compute kernels.
+
+    Parameters
+    ----------
+    table : pa.Table
+        The input table.
+    names : List[str]
+        The numeric columns.
+    how : str
+        One of 'row', 'column', 'minmax' or 'median'.
+
+    Returns
+    -------
+    Dict[str, pa.ChunkedArray]
+        The normalized columns by name.
+    """
+    columns = {name: pc.cast(table[name], pa.float64()) for name in names}
+    if how == "row":
+        row_sum = functools.reduce(
+            pc.add, [pc.fill_null(column, 0.0) for column in columns.values()]
+        )
+        return {name: pc.divide(column, row_sum) for name, column in columns.items()}
+
+    normalized = {}
+    for name, column in columns.items():
+        if how == "column":
+            normalized[name] = pc.divide(column, pc.sum(column))
+        elif how == "minmax":
+            min_max = pc.min_max(column)
+            minimum, maximum = min_max["min"], min_max["max"]
+            normalized[name] = pc.divide(
+                pc.subtract(column, minimum), pc.subtract(maximum, minimum)
+            )
+        else:
+            median = pc.quantile(column, q=0.5)[0]
+            normalized[name] = pc.divide(column, median)
+    return normalized
+
+
+def normalize(table: pa.Table, how: str) -> pa.Table:
+    """Apply a row or column normalization to the numeric columns of a table.
+
+    Parameters
+    ----------
+    table : pa.Table
+        The input table.
+    how : str
+        The normalization method to apply, as in talus_utils.dataframe.normalize.
+
+    Returns
+    -------
+    pa.Table
+        The table with its numeric columns normalized. Other columns are kept as they are.
+
+    Raises
+    ------
+    ValueError
+        If how is not a normalization method.
+    """
+    names = _numeric_columns(table)
+    how = how.lower()
+    if how in ROW_NORMALIZATIONS:
+        columns = _normalize_columns(table, names, "row")
+    elif how in COLUMN_NORMALIZATIONS:
+        columns = _normalize_columns(table, names, "column")
+    elif how in MINMAX_NORMALIZATIONS:
+        columns = _normalize_columns(table, names, "minmax")
+    elif how in MEDIAN_NORMALIZATIONS:
+        columns = _normalize_columns(table, names, "median")
+    elif how in QUANTILE_NORMALIZATIONS:
+        # Imported here because talus_utils.dataframe imports this module.
+        from .dataframe import quantile_normalize
+
+        # There's no pyarrow kernel for this, so run the NumPy implementation on
+        # the numeric columns only.
+        df = pd.DataFrame(
+            {name: pc.cast(table[name], pa.float64()).to_numpy() for name in names}
+        )
+        normalized = quantile_normalize(df)
+        columns = {
+            name: pa.array(normalized[name].to_numpy(), from_pandas=True)
+            for name in names
+        }
+    else:
+        raise ValueError(
+            "Invalid input value for 'how'. Needs to be one of {'row', 'colum', 'minmax'}."
+        )
+    return _replace_columns(table, columns)
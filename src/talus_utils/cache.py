@@ -0,0 +1,146 @@
+"""src/talus_utils/cache.py module."""
+import hashlib
+import os
+import tempfile
+
+from pathlib import Path
+from typing import List, Optional, Union
+
+from talus_utils.s3 import _download_object, _head_object
+
+
+DEFAULT_MAX_SIZE = 50 * 1024 ** 3
+
+
+class S3Cache:
+    """Content-addressed on-disk cache for objects stored in S3.
+
+    Every object is stored under a directory derived from its bucket and key and
+    a file named after its ETag, so a changed object never matches a stale entry.
+    Hits are revalidated with a single HEAD request and files are filled atomically
+    through a rename, which makes the cache safe to share between processes.
+    The least recently used files are evicted once the cache exceeds max_size.
+    """
+
+    def __init__(
+        self, cache_dir: Union[Path, str], max_size: int = DEFAULT_MAX_SIZE
+    ) -> None:
+        """Initialize a new cache in the given directory.
+
+        Parameters
+        ----------
+        cache_dir : Union[Path, str]
+            The directory to store the cached files in. It is created if it doesn't exist.
+        max_size : int
+            The maximum total size of the cached files in bytes. (Default value = DEFAULT_MAX_SIZE).
+        """
+        self._cache_dir = Path(cache_dir)
+        self._cache_dir.mkdir(parents=True, exist_ok=True)
+        self._max_size = max_size
+
+    def get(self, bucket: str, key: str) -> Path:
+        """Get the path to a local copy of an object, downloading it on a cache miss.
+
+        Parameters
+        ----------
+        bucket : str
+            The S3 bucket to load from.
+        key : str
+            The object key within the s3 bucket.
+
+        Returns
+        -------
+        Path
+            The path to the cached file.
+        """
+        etag = _head_object(bucket=bucket, key=key)["ETag"].strip('"')
+        entry_dir = self._cache_dir.joinpath(
+            hashlib.sha256(f"{bucket}/{key}".encode()).hexdigest()
+        )
+        path = entry_dir.joinpath(f"{etag}{Path(key).suffix}")
+        if path.exists():
+            # Mark the entry as recently used for the LRU eviction.
+            os.utime(path)
+            return path
+
+        entry_dir.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=entry_dir, prefix=".", suffix=".part")
+        os.close(fd)
+        try:
+            _download_object(bucket=bucket, key=key, filename=tmp_name)
+            os.replace(tmp_name, path)
+        finally:
+            if os.path.exists(tmp_name):
+                os.remove(tmp_name)
+
+        # Remove older versions of the same object.
+        for stale in self._files(entry_dir):
+            if stale != path:
+                self._unlink(stale)
+        self.evict(keep=path)
+        return path
+
+    def evict(self, keep: Optional[Path] = None) -> None:
+        """Remove the least recently used files until the cache fits within max_size.
+
+        Parameters
+        ----------
+        keep : Optional[Path]
+            A file that must not be evicted, e.g. the one that was just filled. (Default value = None).
+        """
+        entries = []
+        for path in self._files(self._cache_dir):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                # Evicted concurrently by another process.
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        total_size = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries, key=lambda entry: entry[0]):
+            if total_size <= self._max_size:
+                break
+            if path == keep:
+                continue
+            self._unlink(path)
+            total_size -= size
+
+    def clear(self) -> None:
+        """Remove all the cached files."""
+        for path in self._files(self._cache_dir):
+            self._unlink(path)
+
+    @staticmethod
+    def _unlink(path: Path) -> None:
+        """Remove a file unless another process already removed it.
+
+        Parameters
+        ----------
+        path : Path
+            The file to remove.
+        """
+        try:
+            path.unlink()
+        except FileNotFoundError:
+            pass
+
+    @staticmethod
+    def _files(directory: Path) -> List[Path]:
+        """List the complete cache files in a directory, skipping partial downloads.
+
+        Parameters
+        ----------
+        directory : Path
+            The directory to search.
+
+        Returns
+        -------
+        List[Path]
+            The cached files.
+        """
+        return [
+            path
+            for path in directory.rglob("*")
+            if path.is_file() and not path.name.startswith(".")
+        ]
@@ -6,3 +6,18 @@ PRIMARY_COLOR: Final = "#001425"
 SECONDARY_COLOR: Final = "#308AAD"
 MIN_PEPTIDES_HIT_SELECTION: Final = 2
 MAX_NAN_VALUES_HIT_SELECTION: Final = 2
+
+# Accepted names of the talus_utils.dataframe.normalize methods.
+ROW_NORMALIZATIONS: Final = frozenset(["row", "r"])
+COLUMN_NORMALIZATIONS: Final = frozenset(["column", "col", "c"])
+MINMAX_NORMALIZATIONS: Final = frozenset(["minmax", "min-max", "min_max"])
+MEDIAN_NORMALIZATIONS: Final = frozenset(["median", "median_column", "median_col"])
+QUANTILE_NORMALIZATIONS: Final = frozenset(
+    ["quantile", "quantile_column", "quantile_col"]
+)
+IN_PLACE_NORMALIZATIONS: Final = (
+    ROW_NORMALIZATIONS
+    | COLUMN_NORMALIZATIONS
+    | MINMAX_NORMALIZATIONS
+    | MEDIAN_NORMALIZATIONS
+)
@@ -1,22 +1,138 @@
 """src/talus_utils/dataframe.py module."""
 
+import contextlib
 import functools
-
-from typing import Any, Callable, Optional, Union
+import hashlib
+import os
+import pickle
+import types
+import warnings
+
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import (
+    Any,
+    Callable,
+    ContextManager,
+    Dict,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Union,
+)
 
 import numpy as np
 import pandas as pd
-
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+
+from . import arrow, parquet
+from .constants import (
+    COLUMN_NORMALIZATIONS,
+    IN_PLACE_NORMALIZATIONS,
+    MINMAX_NORMALIZATIONS,
+    QUANTILE_NORMALIZATIONS,
+    ROW_NORMALIZATIONS,
+)
+from .parquet import ParquetFrame
 from .utils import override_args, override_kwargs
 
 
-def copy(func: Callable[..., Any]) -> Callable[..., Any]:
-    """Create a deep copy of a given pandas DataFrame and substitute it in the arguments.
+COPY_MODES = ("deep", "readonly", "cow")
+# The pivot_table arguments and aggregations covered by the unique pairs fast path.
+UNIQUE_PIVOT_KWARGS = frozenset(
+    {"index", "columns", "values", "aggfunc", "fill_value", "margins", "dropna", "sort"}
+)
+UNIQUE_PIVOT_AGGFUNCS = frozenset({"mean", "median", "min", "max", "first", "last"})
+
+try:
+    pd.get_option("mode.copy_on_write")
+    HAS_COPY_ON_WRITE = True
+except KeyError:
+    HAS_COPY_ON_WRITE = False
+
+
+class _Step(NamedTuple):
+    """A transformation that a decorator applies to every pandas DataFrame argument."""
+
+    name: str
+    apply_func: Callable[[pd.DataFrame], pd.DataFrame]
+    # True if apply_func returns new data and leaves its input untouched.
+    allocates: bool = True
+    params: Dict[str, Any] = {}
+    # Entered around the call of the wrapped function.
+    context: Callable[[], ContextManager[Any]] = contextlib.nullcontext
+    # Applies the step to pyarrow Tables, which are passed as they are if None.
+    arrow_func: Optional[Callable[[pa.Table], pa.Table]] = None
+    # Applies the step out of core to ParquetFrames, which are passed as they are if None.
+    parquet_func: Optional[Callable[[ParquetFrame], ParquetFrame]] = None
+
+
+def _is_polars_frame(arg: Any) -> bool:
+    """Check whether an argument is a polars DataFrame, without importing polars.
+
+    Parameters
+    ----------
+    arg : Any
+        The argument.
+
+    Returns
+    -------
+    bool
+        True if arg is a polars DataFrame.
+    """
+    arg_type = type(arg)
+    return arg_type.__name__ == "DataFrame" and arg_type.__module__.startswith("polars")
+
+
+def _apply_step(step: _Step, arg: Any) -> Any:
+    """Apply a step to a pandas DataFrame, pyarrow Table, polars DataFrame or Parquet argument.
 
     Parameters
     ----------
-    func: Callable[..., Any] :
+    step : _Step
+        The step to apply.
+    arg : Any
+        The argument. pyarrow datasets are read as ParquetFrames and other types are
+        returned as they are.
+
+    Returns
+    -------
+    Any
+        The transformed argument.
+    """
+    if type(arg) == pd.DataFrame:
+        return step.apply_func(arg)
+    if step.arrow_func is not None:
+        if isinstance(arg, pa.Table):
+            return step.arrow_func(arg)
+        if _is_polars_frame(arg):
+            import polars as pl
+
+            return pl.from_arrow(step.arrow_func(arg.to_arrow()))
+    if step.parquet_func is not None:
+        if isinstance(arg, ds.Dataset):
+            arg = ParquetFrame(arg)
+        if isinstance(arg, ParquetFrame):
+            return step.parquet_func(arg)
+    return arg
+
+
+def _wrap_step(func: Callable[..., Any], step: _Step) -> Callable[..., Any]:
+    """Wrap a function to apply a step to its pandas DataFrame arguments.
+
+    The step is recorded on the wrapped function so that lazy can plan and fuse
+    stacked decorators.
+
+    Parameters
+    ----------
+    func : Callable[..., Any]
         The input function.
+    step : _Step
+        The step to apply.
 
     Returns
     -------
@@ -26,34 +142,117 @@ def copy(func: Callable[..., Any]) -> Callable[..., Any]:
 
     @functools.wraps(func)
     def wrapped_func(*args: str, **kwargs: str) -> Any:
-        """Substitute the arguments that are pandas DataFrames with a deep copy.
+        apply_func = functools.partial(_apply_step, step)
+        with step.context():
+            args = override_args(args=args, func=apply_func)
+            kwargs = override_kwargs(kwargs=kwargs, func=apply_func)
+            return_value = func(*args, **kwargs)
+        return return_value
 
-        Parameters
-        ----------
-        args :
-            The arguments to the wrapped function.
-        kwargs :
-            The keyword arguments to the wrapped function.
+    wrapped_func._step = step  # type: ignore[attr-defined]
+    return wrapped_func
 
-        Returns
-        -------
-        Any
-            The return value of the function it wraps.
 
-        """
-        apply_func = lambda df: df.copy(deep=True)
-        filter_func = lambda arg: type(arg) == pd.DataFrame
-        args = override_args(args=args, func=apply_func, filter=filter_func)
-        kwargs = override_kwargs(kwargs=kwargs, func=apply_func, filter=filter_func)
-        return_value = func(*args, **kwargs)
-        return return_value
+def _readonly_view(df: pd.DataFrame) -> pd.DataFrame:
+    """Return a zero-copy view of a dataframe whose NumPy-backed columns can't be written to.
 
-    return wrapped_func
+    Parameters
+    ----------
+    df : pd.DataFrame
+        Input dataframe.
+
+    Returns
+    -------
+    pd.DataFrame
+        A dataframe sharing the data of df through read-only arrays.
+    """
+    dtypes = set(df.dtypes)
+    if len(dtypes) == 1 and isinstance(next(iter(dtypes)), np.dtype):
+        # Matrices of a single dtype are returned as a view of their 2D array, which
+        # keeps them in a single block. The view leaves df itself writable.
+        values = df.to_numpy()
+        if np.may_share_memory(values, df.iloc[:, 0].to_numpy()):
+            values = values.view()
+            values.flags.writeable = False
+            view = pd.DataFrame(values, index=df.index, columns=df.columns, copy=False)
+            return view.__finalize__(df)
+
+    columns = {}
+    for position, (_, column) in enumerate(df.items()):
+        values = column.array
+        if isinstance(column.dtype, np.dtype):
+            values = column.to_numpy().view()
+            values.flags.writeable = False
+        columns[position] = values
+    view = pd.DataFrame(columns, index=df.index, copy=False).__finalize__(df)
+    view.columns = df.columns
+    return view
+
+
+def copy(
+    func: Optional[Callable[..., Any]] = None, mode: str = "deep"
+) -> Callable[..., Any]:
+    """Create a copy of a given pandas DataFrame and substitute it in the arguments.
+
+    Can be used as @copy or as @copy(mode=...).
+
+    Parameters
+    ----------
+    func: Optional[Callable[..., Any]] :
+        The input function. (Default value = None).
+    mode: str
+        How to protect the DataFrame arguments. Can be one of {'deep', 'readonly', 'cow'}.
+        'deep': Pass a deep copy.
+        'readonly': Pass a zero-copy view whose NumPy-backed columns raise a ValueError when
+        written to in place. Assigning whole columns only changes the view.
+        'cow': Pass a shallow copy and run the function with pandas copy-on-write enabled,
+        so data is only copied for the columns that are written to. Falls back to 'deep'
+        on pandas versions without copy-on-write.
+        (Default value = 'deep').
+
+    Returns
+    -------
+    Callable[..., Any]
+        The wrapped function.
+
+    Raises
+    ------
+    ValueError
+        If mode is not one of the copy modes.
+    """
+    if mode not in COPY_MODES:
+        raise ValueError(
+            "Invalid input value for 'mode'. Needs to be one of {'deep', 'readonly', 'cow'}."
+        )
+    if func is None:
+        return functools.partial(copy, mode=mode)
+
+    if mode == "readonly":
+        step = _Step(name="copy", apply_func=_readonly_view, params={"mode": mode})
+    elif mode == "cow" and HAS_COPY_ON_WRITE:
+        step = _Step(
+            name="copy",
+            apply_func=lambda df: df.copy(deep=False),
+            params={"mode": mode},
+            context=lambda: pd.option_context("mode.copy_on_write", True),
+        )
+    else:
+        step = _Step(
+            name="copy",
+            apply_func=lambda df: df.copy(deep=True),
+            params={"mode": "deep"},
+        )
+    return _wrap_step(func, step)
 
 
 def dropna(*pd_args: Union[int, str], **pd_kwargs: str) -> Callable[..., Any]:
     """Drop NaN values in a pandas DataFrame argument.
 
+    pyarrow Table and polars DataFrame arguments are processed natively with
+    talus_utils.arrow.dropna.
+    ParquetFrame and pyarrow dataset arguments are streamed out of core with
+    talus_utils.parquet.dropna.
+
     Parameters
     ----------
     pd_args :
@@ -82,32 +281,81 @@ def dropna(*pd_args: Union[int, str], **pd_kwargs: str) -> Callable[..., Any]:
             The wrapped function.
 
         """
+        step = _Step(
+            name="dropna",
+            apply_func=lambda df: df.dropna(*pd_args, **pd_kwargs),
+            allocates=not pd_kwargs.get("inplace", False),
+            params={"pd_args": pd_args, "pd_kwargs": pd_kwargs},
+            arrow_func=lambda table: arrow.dropna(table, *pd_args, **pd_kwargs),
+            parquet_func=lambda frame: parquet.dropna(frame, *pd_args, **pd_kwargs),
+        )
+        return _wrap_step(func, step)
 
-        @functools.wraps(func)
-        def wrapped_func(*args: str, **kwargs: str) -> Any:
-            apply_func = lambda df: df.dropna(*pd_args, **pd_kwargs)
-            filter_func = lambda arg: type(arg) == pd.DataFrame
-            args = override_args(args=args, func=apply_func, filter=filter_func)
-            kwargs = override_kwargs(kwargs=kwargs, func=apply_func, filter=filter_func)
-            return_value = func(*args, **kwargs)
-            return return_value
+    return dropna_wrap
 
-        return wrapped_func
 
-    return dropna_wrap
+def _log_frame(
+    df: pd.DataFrame,
+    eager_func: Callable[[pd.DataFrame], pd.DataFrame],
+    log_function: Callable[..., Any],
+    filter_outliers: bool,
+    n_jobs: Optional[int],
+) -> pd.DataFrame:
+    """Apply the log_scaling transformation to column blocks of a dataframe in threads.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        Input data frame.
+    eager_func : Callable[[pd.DataFrame], pd.DataFrame]
+        The pandas implementation, used for dataframes with columns that aren't
+        float64 or integers and for log functions that aren't numpy ufuncs.
+    log_function : Callable[..., Any]
+        The logarithm function to apply.
+    filter_outliers : bool
+        If False, set all values below 1 to 1 instead of NaN.
+    n_jobs : Optional[int]
+        The number of threads, -1 for all CPUs.
+
+    Returns
+    -------
+    pd.DataFrame
+        Transformed output data frame.
+    """
+    # Other dtypes (e.g. float32) and log functions keep the pandas semantics.
+    if not isinstance(log_function, np.ufunc) or not all(
+        dtype == np.float64 or np.issubdtype(dtype, np.integer) for dtype in df.dtypes
+    ):
+        return eager_func(df)
+    values = df.to_numpy(dtype=np.float64, copy=True)
+    block_func = functools.partial(
+        _log_block, log_function=log_function, filter_outliers=filter_outliers
+    )
+    _map_blocks(block_func, values, n_jobs=n_jobs)
+    return pd.DataFrame(values, index=df.index, columns=df.columns)
 
 
 def log_scaling(
-    log_function: Callable[..., Any] = np.log10, filter_outliers: bool = True
+    log_function: Callable[..., Any] = np.log10,
+    filter_outliers: bool = True,
+    n_jobs: Optional[int] = None,
 ) -> Callable[..., Any]:
     """Apply a log scale to a given pandas DataFrame argument.
 
+    pyarrow Table and polars DataFrame arguments are processed natively with
+    talus_utils.arrow.log_scaling.
+    ParquetFrame and pyarrow dataset arguments are streamed out of core with
+    talus_utils.parquet.log_scaling.
+
     Parameters
     ----------
     log_function : Callable[..., Any]
         The logarithm function to apply. (Default value = np.log10).
     filter_outliers : bool
         If False, set all values below 1 to 1 to ensure np.log works. (Default value = True).
+    n_jobs : Optional[int]
+        If given, log scale numeric DataFrames in column blocks across this many threads,
+        -1 for all CPUs. (Default value = None).
 
     Returns
     -------
@@ -130,31 +378,196 @@ def log_scaling(
             The wrapped function.
 
         """
+        if filter_outliers:
+            apply_func = lambda df: log_function(df.where(df >= 1))
+        else:
+            apply_func = lambda df: log_function(df.mask(df < 1, 1))
+        if n_jobs is not None:
+            apply_func = functools.partial(
+                _log_frame,
+                eager_func=apply_func,
+                log_function=log_function,
+                filter_outliers=filter_outliers,
+                n_jobs=n_jobs,
+            )
+        step = _Step(
+            name="log_scaling",
+            apply_func=apply_func,
+            params={
+                "log_function": log_function,
+                "filter_outliers": filter_outliers,
+                "n_jobs": n_jobs,
+            },
+            arrow_func=lambda table: arrow.log_scaling(
+                table, log_function=log_function, filter_outliers=filter_outliers
+            ),
+            parquet_func=lambda frame: parquet.log_scaling(
+                frame, log_function=log_function, filter_outliers=filter_outliers
+            ),
+        )
+        return _wrap_step(func, step)
 
-        @functools.wraps(func)
-        def wrapped_func(*args: str, **kwargs: str) -> Any:
-            if filter_outliers:
-                apply_func = lambda df: log_function(df.where(df >= 1))
-            else:
-                apply_func = lambda df: log_function(df.mask(df < 1, 1))
-            filter_func = lambda arg: type(arg) == pd.DataFrame
-            args = override_args(args=args, func=apply_func, filter=filter_func)
-            kwargs = override_kwargs(kwargs=kwargs, func=apply_func, filter=filter_func)
-            return_value = func(*args, **kwargs)
-            return return_value
+    return log_scaling_wrap
 
-        return wrapped_func
 
-    return log_scaling_wrap
+def _unique_pivot_table(
+    df: pd.DataFrame,
+    index: Any,
+    columns: Any,
+    values: Any,
+    dropna: bool = True,
+    sort: bool = True,
+    assume_unique: bool = False,
+    dtype: Optional[Union[str, np.dtype]] = None,
+) -> Optional[pd.DataFrame]:
+    """Pivot a long table whose (index, columns) pairs are unique without aggregating.
+
+    The rows and columns of the wide matrix are the factorized codes of the index and
+    columns keys, and the values are scattered into a preallocated array. This gives
+    the same result as df.pivot_table(values, index, columns) with its default mean
+    aggregation, since every cell holds a single value.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        The long input table.
+    index : Any
+        The column with the row keys.
+    columns : Any
+        The column with the column keys.
+    values : Any
+        The column with the floating point values.
+    dropna : bool
+        If True, drop the rows and columns without values, like pivot_table. (Default value = True).
+    sort : bool
+        If True, sort the keys, like pivot_table. (Default value = True).
+    assume_unique : bool
+        If True, skip checking that the pairs are unique. (Default value = False).
+    dtype : Optional[Union[str, np.dtype]]
+        The dtype of the output, e.g. np.float32 to halve its memory. (Default value = None).
 
+    Returns
+    -------
+    Optional[pd.DataFrame]
+        The wide table, or None if some (index, columns) pairs are duplicated.
+    """
+    row_keys, column_keys = df[index], df[columns]
+    cell_values = df[values].to_numpy()
+    if dropna:
+        # pivot_table drops the missing values and keys before unstacking, so the
+        # keys without any value disappear and the others keep their order.
+        keep = row_keys.notna().to_numpy() & column_keys.notna().to_numpy()
+        keep &= ~np.isnan(cell_values)
+        if not keep.all():
+            row_keys = row_keys[keep]
+            column_keys = column_keys[keep]
+            cell_values = cell_values[keep]
+    row_codes, row_keys = pd.factorize(row_keys, sort=sort)
+    column_codes, column_keys = pd.factorize(column_keys, sort=sort)
+    # Like groupby, drop the rows with missing keys.
+    has_keys = (row_codes >= 0) & (column_codes >= 0)
+    if not has_keys.all():
+        row_codes = row_codes[has_keys]
+        column_codes = column_codes[has_keys]
+        cell_values = cell_values[has_keys]
+
+    n_rows, n_columns = len(row_keys), len(column_keys)
+    cells = row_codes.astype(np.int64) * n_columns + column_codes
+    if not assume_unique:
+        is_filled = np.zeros(n_rows * n_columns, dtype=bool)
+        is_filled[cells] = True
+        if np.count_nonzero(is_filled) != len(cells):
+            return None
+        del is_filled
+
+    matrix = np.full((n_rows, n_columns), np.nan, dtype=dtype or np.float64)
+    matrix.reshape(-1)[cells] = cell_values
+    return pd.DataFrame(
+        matrix,
+        index=pd.Index(row_keys, name=index),
+        columns=pd.Index(column_keys, name=columns),
+    )
+
+
+def _pivot_table(
+    df: pd.DataFrame,
+    pd_args: Tuple[Any, ...],
+    pd_kwargs: Dict[str, Any],
+    assume_unique: bool = False,
+    dtype: Optional[Union[str, np.dtype]] = None,
+) -> pd.DataFrame:
+    """Pivot a dataframe, without aggregating when the pivoted pairs are unique.
 
-def pivot_table(*pd_args: str, **pd_kwargs: str) -> Callable[..., Any]:
+    Parameters
+    ----------
+    df : pd.DataFrame
+        The input dataframe.
+    pd_args : Tuple[Any, ...]
+        The arguments to pd.DataFrame.pivot_table.
+    pd_kwargs : Dict[str, Any]
+        The keyword arguments to pd.DataFrame.pivot_table.
+    assume_unique : bool
+        If True, skip checking that the pairs are unique. (Default value = False).
+    dtype : Optional[Union[str, np.dtype]]
+        The dtype of the output. (Default value = None).
+
+    Returns
+    -------
+    pd.DataFrame
+        The pivoted dataframe.
+    """
+    kwargs = {"aggfunc": "mean", "fill_value": None, "margins": False, **pd_kwargs}
+    keys = [kwargs.get(name) for name in ("index", "columns", "values")]
+    # The fast path only covers a single float column pivoted on two plain keys.
+    is_simple = (
+        not pd_args
+        and set(kwargs) <= UNIQUE_PIVOT_KWARGS
+        and isinstance(kwargs["aggfunc"], str)
+        and kwargs["aggfunc"] in UNIQUE_PIVOT_AGGFUNCS
+        and kwargs["fill_value"] is None
+        and not kwargs["margins"]
+        and all(pd.api.types.is_hashable(key) and key in df.columns for key in keys)
+        and df.columns.is_unique
+        and np.issubdtype(df[keys[2]].dtype, np.floating)
+        and not any(pd.api.types.is_categorical_dtype(df[key]) for key in keys[:2])
+    )
+    if is_simple:
+        table = _unique_pivot_table(
+            df,
+            *keys,
+            dropna=kwargs.get("dropna", True),
+            sort=kwargs.get("sort", True),
+            assume_unique=assume_unique,
+            dtype=dtype,
+        )
+        if table is not None:
+            return table
+
+    table = df.pivot_table(*pd_args, **pd_kwargs)
+    return table if dtype is None else table.astype(dtype)
+
+
+def pivot_table(
+    *pd_args: str,
+    assume_unique: bool = False,
+    dtype: Optional[Union[str, np.dtype]] = None,
+    **pd_kwargs: str,
+) -> Callable[..., Any]:
     """Apply a pivot to a pandas DataFrame argument.
 
+    When a single floating point values column is pivoted on unique (index, columns)
+    pairs, e.g. peptide and sample in long quant exports, the wide matrix is built
+    directly instead of through a groupby aggregation.
+
     Parameters
     ----------
     pd_args :
         The arguments to the wrapped function.
+    assume_unique : bool
+        If True, skip checking that the (index, columns) pairs are unique. Duplicated
+        pairs then keep one of their values instead of their mean. (Default value = False).
+    dtype : Optional[Union[str, np.dtype]]
+        The dtype of the output, e.g. np.float32 to halve its memory. (Default value = None).
     pd_kwargs :
         The keyword arguments to the wrapped function.
 
@@ -179,65 +592,410 @@ def pivot_table(*pd_args: str, **pd_kwargs: str) -> Callable[..., Any]:
             The wrapped function.
 
         """
+        step = _Step(
+            name="pivot_table",
+            apply_func=lambda df: _pivot_table(
+                df, pd_args, pd_kwargs, assume_unique=assume_unique, dtype=dtype
+            ),
+            params={
+                "pd_args": pd_args,
+                "pd_kwargs": pd_kwargs,
+                "assume_unique": assume_unique,
+                "dtype": dtype,
+            },
+        )
+        return _wrap_step(func, step)
 
-        @functools.wraps(func)
-        def wrapped_func(*args: str, **kwargs: str) -> Any:
-            apply_func = lambda df: df.pivot_table(*pd_args, **pd_kwargs)
-            filter_func = lambda arg: type(arg) == pd.DataFrame
-            args = override_args(args=args, func=apply_func, filter=filter_func)
-            kwargs = override_kwargs(kwargs=kwargs, func=apply_func, filter=filter_func)
-            return_value = func(*args, **kwargs)
-            return return_value
+    return pivot_table_wrap
 
-        return wrapped_func
 
-    return pivot_table_wrap
+def _map_blocks(
+    func: Callable[[np.ndarray], Any],
+    values: np.ndarray,
+    axis: int = 1,
+    n_jobs: Optional[int] = None,
+) -> np.ndarray:
+    """Apply an in-place function to blocks of a 2D array in parallel threads.
 
+    The blocks are views of values, so no data is copied. NumPy releases the GIL in
+    its kernels, which lets the threads run concurrently.
 
-def median_normalize(df):
-    """Apply median normalization to input dataframe.
+    Parameters
+    ----------
+    func : Callable[[np.ndarray], Any]
+        The function to apply, which overwrites its input.
+    values : np.ndarray
+        The 2D input array.
+    axis : int
+        1 to split values into column blocks, 0 into row blocks. (Default value = 1).
+    n_jobs : Optional[int]
+        The number of threads, -1 for all CPUs. None runs func on values in the
+        calling thread. (Default value = None).
+
+    Returns
+    -------
+    np.ndarray
+        The transformed array (the same object as values).
+    """
+    if n_jobs is not None and n_jobs < 0:
+        n_jobs = os.cpu_count() or 1
+    n_blocks = min(n_jobs or 1, values.shape[axis])
+    if n_blocks <= 1:
+        func(values)
+        return values
+
+    bounds = np.linspace(0, values.shape[axis], n_blocks + 1).astype(int)
+    blocks = [
+        values[:, start:stop] if axis == 1 else values[start:stop]
+        for start, stop in zip(bounds[:-1], bounds[1:])
+    ]
+    with ThreadPoolExecutor(max_workers=n_blocks) as executor:
+        # Consume the results to raise the exceptions of the threads.
+        list(executor.map(func, blocks))
+    return values
+
+
+def _normalize_block(values: np.ndarray, how: str) -> None:
+    """Normalize a 2D float array in place, ignoring NaN values.
+
+    Parameters
+    ----------
+    values : np.ndarray
+        The array to normalize. It is overwritten with the result.
+    how : str
+        One of the row, column, minmax or median normalizations.
+    """
+    # All-NaN rows or columns legitimately produce NaN. np.errstate is thread local,
+    # so it is set here rather than around the threads.
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # A boolean mask is cheaper than the NaN-free copy that np.nansum makes.
+        if how in ROW_NORMALIZATIONS:
+            values /= np.sum(values, axis=1, keepdims=True, where=~np.isnan(values))
+        elif how in COLUMN_NORMALIZATIONS:
+            values /= np.sum(values, axis=0, where=~np.isnan(values))
+        elif how in MINMAX_NORMALIZATIONS:
+            values -= np.nanmin(values, axis=0)
+            values /= np.nanmax(values, axis=0)
+        else:
+            values /= np.nanmedian(values, axis=0)
+
+
+def _normalize_values(
+    values: np.ndarray, how: str, n_jobs: Optional[int] = None
+) -> np.ndarray:
+    """Normalize a 2D float array in place, ignoring NaN values.
+
+    Parameters
+    ----------
+    values : np.ndarray
+        The array to normalize. It is overwritten with the result.
+    how : str
+        One of the row, column, minmax or median normalizations.
+    n_jobs : Optional[int]
+        The number of threads to split values across, -1 for all CPUs. Row
+        normalizations are split into row blocks, the others into column blocks.
+        (Default value = None).
+
+    Returns
+    -------
+    np.ndarray
+        The normalized array (the same object as values).
+    """
+    how = how.lower()
+    if how not in IN_PLACE_NORMALIZATIONS:
+        raise ValueError(f"Normalization '{how}' can't be applied in place.")
+    axis = 0 if how in ROW_NORMALIZATIONS else 1
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", category=RuntimeWarning)
+        _map_blocks(functools.partial(_normalize_block, how=how), values, axis, n_jobs)
+    return values
+
+
+def _log_block(
+    values: np.ndarray, log_function: np.ufunc, filter_outliers: bool
+) -> None:
+    """Apply the log_scaling transformation to a 2D float array in place.
+
+    Parameters
+    ----------
+    values : np.ndarray
+        The array to transform. It is overwritten with the result.
+    log_function : np.ufunc
+        The logarithm function to apply.
+    filter_outliers : bool
+        If False, set all values below 1 to 1 instead of NaN.
+    """
+    with np.errstate(invalid="ignore"):
+        values[values < 1] = np.nan if filter_outliers else 1
+        log_function(values, out=values)
+
+
+def _normalize_frame(
+    df: pd.DataFrame,
+    how: str,
+    inplace: bool = False,
+    dtype: Optional[Union[str, np.dtype]] = None,
+    n_jobs: Optional[int] = None,
+) -> pd.DataFrame:
+    """Apply a vectorized row, column, minmax or median normalization to a dataframe.
 
     Parameters
     ----------
     df: pd.DataFrame
         Input data frame.
+    how: str
+        One of the row, column, minmax or median normalizations.
+    inplace: bool
+        If True, overwrite and return df instead of allocating a new data frame. (Default value = False).
+    dtype: Optional[Union[str, np.dtype]]
+        The dtype of the output, e.g. np.float32 to halve its memory. Defaults to the
+        common floating dtype of df, or float64. (Default value = None).
+    n_jobs: Optional[int]
+        The number of threads to normalize blocks of the values with, -1 for all CPUs. (Default value = None).
 
     Returns
     -------
     pd.DataFrame
         Transformed output data frame.
+
+    Raises
+    ------
+    ValueError
+        If inplace is used together with dtype.
     """
-    return df / df.median()
+    if inplace:
+        if dtype is not None:
+            raise ValueError("The dtype of a dataframe can't be changed in place.")
+        values = df.to_numpy(copy=False)
+        if not np.issubdtype(values.dtype, np.floating):
+            raise ValueError(
+                "Only floating point dataframes can be normalized in place."
+            )
+        _normalize_values(values, how, n_jobs=n_jobs)
+        # to_numpy only returns a view of single-block dataframes, write back otherwise.
+        if df.shape[1] and not np.shares_memory(values, df.iloc[:, 0].to_numpy()):
+            df.iloc[:, :] = values
+        return df
+
+    if dtype is None:
+        dtype = np.result_type(*df.dtypes) if len(df.columns) else np.float64
+        if not np.issubdtype(dtype, np.floating):
+            dtype = np.float64
+    values = df.to_numpy(dtype=dtype, copy=True)
+    _normalize_values(values, how, n_jobs=n_jobs)
+    return pd.DataFrame(values, index=df.index, columns=df.columns)
+
+
+def row_normalize(
+    df: pd.DataFrame,
+    inplace: bool = False,
+    dtype: Optional[Union[str, np.dtype]] = None,
+    n_jobs: Optional[int] = None,
+) -> pd.DataFrame:
+    """Divide every row of the input dataframe by its sum.
 
+    Parameters
+    ----------
+    df: pd.DataFrame
+        Input data frame.
+    inplace: bool
+        If True, overwrite and return df instead of allocating a new data frame. (Default value = False).
+    dtype: Optional[Union[str, np.dtype]]
+        The dtype of the output, e.g. np.float32 to halve its memory. (Default value = None).
+    n_jobs: Optional[int]
+        The number of threads to normalize blocks of the values with, -1 for all CPUs. (Default value = None).
 
-def quantile_normalize(df):
-    """Apply quantile normalization to input dataframe.
+    Returns
+    -------
+    pd.DataFrame
+        Transformed output data frame.
+    """
+    return _normalize_frame(df, how="row", inplace=inplace, dtype=dtype, n_jobs=n_jobs)
+
+
+def column_normalize(
+    df: pd.DataFrame,
+    inplace: bool = False,
+    dtype: Optional[Union[str, np.dtype]] = None,
+    n_jobs: Optional[int] = None,
+) -> pd.DataFrame:
+    """Divide every column of the input dataframe by its sum.
+
+    Parameters
+    ----------
+    df: pd.DataFrame
+        Input data frame.
+    inplace: bool
+        If True, overwrite and return df instead of allocating a new data frame. (Default value = False).
+    dtype: Optional[Union[str, np.dtype]]
+        The dtype of the output, e.g. np.float32 to halve its memory. (Default value = None).
+    n_jobs: Optional[int]
+        The number of threads to normalize blocks of the values with, -1 for all CPUs. (Default value = None).
+
+    Returns
+    -------
+    pd.DataFrame
+        Transformed output data frame.
+    """
+    return _normalize_frame(
+        df, how="column", inplace=inplace, dtype=dtype, n_jobs=n_jobs
+    )
+
+
+def minmax_normalize(
+    df: pd.DataFrame,
+    inplace: bool = False,
+    dtype: Optional[Union[str, np.dtype]] = None,
+    n_jobs: Optional[int] = None,
+) -> pd.DataFrame:
+    """Scale every column of the input dataframe to the range [0, 1].
 
     Parameters
     ----------
     df: pd.DataFrame
         Input data frame.
+    inplace: bool
+        If True, overwrite and return df instead of allocating a new data frame. (Default value = False).
+    dtype: Optional[Union[str, np.dtype]]
+        The dtype of the output, e.g. np.float32 to halve its memory. (Default value = None).
+    n_jobs: Optional[int]
+        The number of threads to normalize blocks of the values with, -1 for all CPUs. (Default value = None).
 
     Returns
     -------
     pd.DataFrame
         Transformed output data frame.
     """
-    rank_mean = df.stack().groupby(df.rank(method="first").stack().astype(int)).mean()
-    return df.rank(method="min").stack().astype(int).map(rank_mean).unstack()
+    return _normalize_frame(
+        df, how="minmax", inplace=inplace, dtype=dtype, n_jobs=n_jobs
+    )
+
 
+def median_normalize(
+    df: pd.DataFrame,
+    inplace: bool = False,
+    dtype: Optional[Union[str, np.dtype]] = None,
+    n_jobs: Optional[int] = None,
+) -> pd.DataFrame:
+    """Apply median normalization to input dataframe.
+
+    Parameters
+    ----------
+    df: pd.DataFrame
+        Input data frame.
+    inplace: bool
+        If True, overwrite and return df instead of allocating a new data frame. (Default value = False).
+    dtype: Optional[Union[str, np.dtype]]
+        The dtype of the output, e.g. np.float32 to halve its memory. (Default value = None).
+    n_jobs: Optional[int]
+        The number of threads to normalize blocks of the values with, -1 for all CPUs. (Default value = None).
+
+    Returns
+    -------
+    pd.DataFrame
+        Transformed output data frame.
+    """
+    return _normalize_frame(
+        df, how="median", inplace=inplace, dtype=dtype, n_jobs=n_jobs
+    )
 
-def normalize(how: str) -> Callable[..., Any]:
+
+def quantile_normalize(
+    df: pd.DataFrame,
+    dtype: Optional[Union[str, np.dtype]] = None,
+    inplace: bool = False,
+) -> pd.DataFrame:
+    """Apply quantile normalization to input dataframe.
+
+    Every value is replaced by the mean over all columns of the values with the same
+    rank, where tied values share the lowest rank. Missing values are ignored when
+    ranking and stay missing.
+
+    Parameters
+    ----------
+    df: pd.DataFrame
+        Input data frame.
+    dtype: Optional[Union[str, np.dtype]]
+        The dtype of the output, e.g. np.float32 to halve its memory. (Default value = None).
+    inplace: bool
+        If True, write the result back into df and return it. (Default value = False).
+
+    Returns
+    -------
+    pd.DataFrame
+        Transformed output data frame.
+
+    Raises
+    ------
+    ValueError
+        If inplace is used together with dtype.
+    """
+    if inplace and dtype is not None:
+        raise ValueError("The dtype of a dataframe can't be changed in place.")
+
+    # Work column by column on a column-major copy to keep memory accesses contiguous.
+    values = np.asfortranarray(df.to_numpy(dtype=np.float64))
+    n_rows, n_columns = values.shape
+    index_dtype = np.int32 if n_rows < 2 ** 31 else np.intp
+    orders = np.empty((n_rows, n_columns), dtype=index_dtype, order="F")
+    n_valid = np.empty(n_columns, dtype=np.intp)
+    rank_sum = np.zeros(n_rows)
+    rank_count = np.zeros(n_rows, dtype=np.intp)
+    for i in range(n_columns):
+        # NaNs are sorted to the end of each column.
+        orders[:, i] = np.argsort(values[:, i])
+        n_valid[i] = np.count_nonzero(~np.isnan(values[:, i]))
+        rank_sum[: n_valid[i]] += values[orders[: n_valid[i], i], i]
+        rank_count[: n_valid[i]] += 1
+    with np.errstate(invalid="ignore"):
+        rank_mean = rank_sum / rank_count
+
+    normalized = np.full(values.shape, np.nan, dtype=dtype or np.float64, order="F")
+    positions = np.arange(n_rows)
+    for i in range(n_columns):
+        order = orders[: n_valid[i], i]
+        sorted_values = values[order, i]
+        # Tied values share the position of the first value in their run.
+        is_first = np.empty(len(order), dtype=bool)
+        is_first[:1] = True
+        is_first[1:] = sorted_values[1:] != sorted_values[:-1]
+        ranks = np.maximum.accumulate(np.where(is_first, positions[: len(order)], 0))
+        normalized[order, i] = rank_mean[ranks]
+    if inplace:
+        df.iloc[:, :] = normalized
+        return df
+    return pd.DataFrame(normalized, index=df.index, columns=df.columns)
+
+
+def normalize(
+    how: str,
+    inplace: bool = False,
+    dtype: Optional[Union[str, np.dtype]] = None,
+    n_jobs: Optional[int] = None,
+) -> Callable[..., Any]:
     """Apply a row or column normalization to a pandas DataFrame argument.
 
+    pyarrow Table and polars DataFrame arguments are processed natively with
+    talus_utils.arrow.normalize.
+    ParquetFrame and pyarrow dataset arguments are streamed out of core with
+    talus_utils.parquet.normalize.
+
     Parameters
     ----------
     how : str
-        The normalization method to apply. Can be one of {'row', 'colum', 'minmax', 'median_column'}.
+        The normalization method to apply. Can be one of {'row', 'colum', 'minmax', 'median_column', 'quantile_column'}.
         'row': Normalize each row to the range [0, 1].
         'colum': Normalize each column to the range [0, 1].
         'minmax': Apply a min-max normalization.
         'median_column': Scale each column by subtracting the median value.
+        'quantile_column': Apply a quantile normalization over the columns.
+    inplace : bool
+        If True, overwrite the DataFrame argument instead of allocating a new one. (Default value = False).
+    dtype : Optional[Union[str, np.dtype]]
+        The dtype of the output, e.g. np.float32 to halve its memory. (Default value = None).
+    n_jobs : Optional[int]
+        The number of threads to normalize blocks of the values with, -1 for all CPUs.
+        Ignored by the quantile normalization. (Default value = None).
 
     Returns
     -------
@@ -260,50 +1018,178 @@ def normalize(how: str) -> Callable[..., Any]:
             The wrapped function.
 
         """
+        if how.lower() in IN_PLACE_NORMALIZATIONS:
+            apply_func = lambda df: _normalize_frame(
+                df, how=how, inplace=inplace, dtype=dtype, n_jobs=n_jobs
+            )
+        elif how.lower() in QUANTILE_NORMALIZATIONS:
+            apply_func = lambda df: quantile_normalize(df, dtype=dtype, inplace=inplace)
+        else:
+            raise ValueError(
+                "Invalid input value for 'how'. Needs to be one of {'row', 'colum', 'minmax'}."
+            )
 
-        @functools.wraps(func)
-        def wrapped_func(*args: str, **kwargs: str) -> Any:
-            if how.lower() in set(["row", "r"]):
-                apply_func = lambda df: df.apply(lambda x: x / x.sum(), axis=1)
-            elif how.lower() in set(["column", "col", "c"]):
-                apply_func = lambda df: df.apply(lambda x: x / x.sum(), axis=0)
-            elif how.lower() in set(["minmax", "min-max", "min_max"]):
-                apply_func = lambda df: (df - df.min()) / (df.max() - df.min())
-            elif how.lower() in set(["median", "median_column", "median_col"]):
-                apply_func = lambda df: median_normalize(df)
-            elif how.lower() in set(["quantile", "quantile_column", "quantile_col"]):
-                apply_func = lambda df: quantile_normalize(df)
-            else:
-                raise ValueError(
-                    "Invalid input value for 'how'. Needs to be one of {'row', 'colum', 'minmax'}."
-                )
+        step = _Step(
+            name="normalize",
+            apply_func=apply_func,
+            allocates=not inplace,
+            params={"how": how, "dtype": dtype, "n_jobs": n_jobs},
+            arrow_func=lambda table: arrow.normalize(table, how=how),
+            parquet_func=lambda frame: parquet.normalize(frame, how=how),
+        )
+        return _wrap_step(func, step)
 
-            filter_func = lambda arg: type(arg) == pd.DataFrame
-            args = override_args(args=args, func=apply_func, filter=filter_func)
-            kwargs = override_kwargs(kwargs=kwargs, func=apply_func, filter=filter_func)
-            return_value = func(*args, **kwargs)
-            return return_value
+    return normalize_wrap
 
-        return wrapped_func
 
-    return normalize_wrap
+def _nanquantile_rows(values: np.ndarray, q: float) -> np.ndarray:
+    """Compute a quantile of every row of a 2D array, ignoring NaN values.
+
+    This gives the same linear interpolation as np.nanquantile but sorts all rows at
+    once, which is much faster than np.nanquantile on many short rows.
+
+    Parameters
+    ----------
+    values : np.ndarray
+        The 2D input array.
+    q : float
+        The quantile to compute, between 0 and 1.
+
+    Returns
+    -------
+    np.ndarray
+        The quantile of every row, NaN for rows without values.
+    """
+    sorted_values = np.sort(values, axis=1)
+    n_valid = np.count_nonzero(~np.isnan(values), axis=1)
+    position = q * np.maximum(n_valid - 1, 0)
+    low = np.floor(position).astype(np.intp)
+    high = np.ceil(position).astype(np.intp)
+    rows = np.arange(len(values))
+    low_values = sorted_values[rows, low]
+    high_values = sorted_values[rows, high]
+    if q == 0.5:
+        quantile = (low_values + high_values) / 2
+    else:
+        quantile = low_values + (high_values - low_values) * (position - low)
+    quantile[n_valid == 0] = np.nan
+    return quantile
+
+
+def _nanmean_rows(values: np.ndarray) -> np.ndarray:
+    """Compute the mean of every row of a 2D array, ignoring NaN values.
+
+    Parameters
+    ----------
+    values : np.ndarray
+        The 2D input array.
+
+    Returns
+    -------
+    np.ndarray
+        The mean of every row, NaN for rows without values.
+    """
+    # A boolean mask is cheaper than the NaN-free copy that np.nanmean makes.
+    mask = ~np.isnan(values)
+    return np.sum(values, axis=1, where=mask) / np.count_nonzero(mask, axis=1)
+
+
+def _nanstd_rows(values: np.ndarray) -> np.ndarray:
+    """Compute the sample standard deviation of every row of a 2D array, ignoring NaN values.
+
+    Parameters
+    ----------
+    values : np.ndarray
+        The 2D input array.
+
+    Returns
+    -------
+    np.ndarray
+        The standard deviation of every row, NaN for rows with less than two values.
+    """
+    return np.std(values, axis=1, ddof=1, where=~np.isnan(values))
+
+
+ROW_REDUCERS: Dict[str, Callable[[np.ndarray], np.ndarray]] = {
+    "min": lambda values: np.nanmin(values, axis=1),
+    "max": lambda values: np.nanmax(values, axis=1),
+    "median": lambda values: _nanquantile_rows(values, 0.5),
+    "mean": _nanmean_rows,
+    "sum": lambda values: np.sum(values, axis=1, where=~np.isnan(values)),
+    "std": _nanstd_rows,
+    "cv": lambda values: _nanstd_rows(values) / _nanmean_rows(values),
+    "nan_count": lambda values: np.count_nonzero(np.isnan(values), axis=1),
+}
+
+
+def _row_order(
+    reduced: np.ndarray,
+    sort_ascending: bool,
+    top_k: Optional[int] = None,
+    bottom_k: Optional[int] = None,
+) -> np.ndarray:
+    """Return the positions of the rows sorted by their reduced values.
+
+    Parameters
+    ----------
+    reduced : np.ndarray
+        One value per row. Rows with a NaN value are sorted last.
+    sort_ascending : bool
+        Whether to sort in ascending order.
+    top_k : Optional[int]
+        If given, only return the positions of the top_k largest values. (Default value = None).
+    bottom_k : Optional[int]
+        If given, only return the positions of the bottom_k smallest values. (Default value = None).
+
+    Returns
+    -------
+    np.ndarray
+        The row positions.
+    """
+    k = top_k if top_k is not None else bottom_k
+    valid = np.flatnonzero(~np.isnan(reduced))
+    if k is None or k >= len(valid):
+        # Sort like pandas does for the previous reindex-based implementation.
+        order = pd.Series(reduced).sort_values(ascending=sort_ascending).index
+        return order.to_numpy()[: len(reduced) if k is None else k]
+
+    # Select the k rows in linear time, then only sort those.
+    keys = -reduced[valid] if top_k is not None else reduced[valid]
+    selected = valid[np.argpartition(keys, k - 1)[:k]] if k else valid[:0]
+    order = np.argsort(reduced[selected], kind="stable")
+    return selected[order if sort_ascending else order[::-1]]
 
 
 def sort_row_values(
     how: str,
     use_absolute_values: Optional[bool] = False,
     sort_ascending: Optional[bool] = False,
+    top_k: Optional[int] = None,
+    bottom_k: Optional[int] = None,
+    q: float = 0.5,
 ) -> Callable[..., Any]:
     """Reindex a pandas DataFrame argument.
 
+    The rows are sorted by a reduction of their numeric values, ignoring missing values.
+
     Parameters
     ----------
     how : str
-        The reindexing method to apply. Can be one of {'min', 'max', 'median', 'mean', 'sum'}.
+        The reindexing method to apply. Can be one of {'min', 'max', 'median', 'mean', 'sum', 'std', 'cv', 'nan_count', 'quantile'}.
+        'std': The sample standard deviation.
+        'cv': The coefficient of variation, i.e. the standard deviation divided by the mean.
+        'nan_count': The number of missing values.
+        'quantile': The quantile q.
     use_absolute_values : bool
         If True, use absolute values of the row values. (Default value = False).
     sort_ascending : bool
         Whether to sort the index in ascending order. (Default value = False).
+    top_k : Optional[int]
+        If given, only keep the top_k rows with the largest values. (Default value = None).
+    bottom_k : Optional[int]
+        If given, only keep the bottom_k rows with the smallest values. (Default value = None).
+    q : float
+        The quantile to use with how='quantile'. (Default value = 0.5).
 
     Returns
     -------
@@ -326,87 +1212,89 @@ def sort_row_values(
             The wrapped function.
 
         """
+        if how.lower() in ROW_REDUCERS:
+            reducer = ROW_REDUCERS[how.lower()]
+        elif how.lower() == "quantile":
+            reducer = lambda values: _nanquantile_rows(values, q)
+        else:
+            raise ValueError(
+                "Invalid input value for 'how'. Needs to be one of {'min', 'max', 'median', 'mean', 'sum', 'std', 'cv', 'nan_count', 'quantile'}."
+            )
+        if top_k is not None and bottom_k is not None:
+            raise ValueError("Only one of 'top_k' and 'bottom_k' can be given.")
 
-        @functools.wraps(func)
-        def wrapped_func(*args: str, **kwargs: str) -> Any:
-            if how.lower() == "min":
-                if use_absolute_values:
-                    apply_func = lambda df: df.reindex(
-                        index=df.abs()
-                        .min(axis=1)
-                        .sort_values(ascending=sort_ascending)
-                        .index
-                    )
-                else:
-                    apply_func = lambda df: df.reindex(
-                        index=df.min(axis=1).sort_values(ascending=sort_ascending).index
-                    )
-            elif how.lower() == "max":
-                if use_absolute_values:
-                    apply_func = lambda df: df.reindex(
-                        index=df.abs()
-                        .max(axis=1)
-                        .sort_values(ascending=sort_ascending)
-                        .index
-                    )
-                else:
-                    apply_func = lambda df: df.reindex(
-                        index=df.max(axis=1).sort_values(ascending=sort_ascending).index
-                    )
-            elif how.lower() == "median":
-                if use_absolute_values:
-                    apply_func = lambda df: df.reindex(
-                        index=df.abs()
-                        .median(axis=1)
-                        .sort_values(ascending=sort_ascending)
-                        .index
-                    )
-                else:
-                    apply_func = lambda df: df.reindex(
-                        index=df.median(axis=1)
-                        .sort_values(ascending=sort_ascending)
-                        .index
-                    )
-            elif how.lower() == "mean":
-                if use_absolute_values:
-                    apply_func = lambda df: df.reindex(
-                        index=df.abs()
-                        .mean(axis=1)
-                        .sort_values(ascending=sort_ascending)
-                        .index
-                    )
-                else:
-                    apply_func = lambda df: df.reindex(
-                        index=df.mean(axis=1)
-                        .sort_values(ascending=sort_ascending)
-                        .index
-                    )
-            elif how.lower() == "sum":
-                if use_absolute_values:
-                    apply_func = lambda df: df.reindex(
-                        index=df.abs()
-                        .sum(axis=1)
-                        .sort_values(ascending=sort_ascending)
-                        .index
-                    )
-                else:
-                    apply_func = lambda df: df.reindex(
-                        index=df.sum(axis=1).sort_values(ascending=sort_ascending).index
-                    )
+        def apply_func(df: pd.DataFrame) -> pd.DataFrame:
+            # Like the pandas row reductions, skip the non-numeric columns.
+            if not all(pd.api.types.is_numeric_dtype(dtype) for dtype in df.dtypes):
+                df_numeric = df.select_dtypes(include=["number", "bool"])
             else:
-                raise ValueError(
-                    "Invalid input value for 'how'. Needs to be one of {'min', 'max', 'median', 'mean', 'sum'}."
-                )
+                df_numeric = df
+            values = df_numeric.to_numpy(dtype=np.float64)
+            if use_absolute_values:
+                values = np.abs(values)
+            # All-NaN rows reduce to NaN and are sorted last.
+            with np.errstate(
+                divide="ignore", invalid="ignore"
+            ), warnings.catch_warnings():
+                warnings.simplefilter("ignore", category=RuntimeWarning)
+                reduced = np.asarray(reducer(values), dtype=np.float64)
+            return df.take(_row_order(reduced, sort_ascending, top_k, bottom_k))
+
+        step = _Step(
+            name="sort_row_values",
+            apply_func=apply_func,
+            params={
+                "how": how,
+                "use_absolute_values": use_absolute_values,
+                "sort_ascending": sort_ascending,
+                "top_k": top_k,
+                "bottom_k": bottom_k,
+                "q": q,
+            },
+        )
+        return _wrap_step(func, step)
 
-            filter_func = lambda arg: type(arg) == pd.DataFrame
-            args = override_args(args=args, func=apply_func, filter=filter_func)
-            kwargs = override_kwargs(kwargs=kwargs, func=apply_func, filter=filter_func)
-            return_value = func(*args, **kwargs)
-            return return_value
+    return reindex_wrap
 
-        return wrapped_func
 
-    return reindex_wrap
+def _split_string_column(
+    series: pd.Series, sep: str
+) -> Optional[Tuple[np.ndarray, np.ndarray, pa.Array]]:
+    """Split a column of strings with pyarrow.
+
+    Parameters
+    ----------
+    series : pd.Series
+        The column to split.
+    sep : str
+        The separator.
+
+    Returns
+    -------
+    Optional[Tuple[np.ndarray, np.ndarray, pa.Array]]
+        The number of values of every row, whether every row is missing, and the
+        split values of the rows that aren't missing. None if the column holds
+        anything but strings and missing values.
+    """
+    try:
+        array = pa.array(series, from_pandas=True)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        return None
+    if isinstance(array, pa.ChunkedArray):
+        # Columns with more than 2 GB of strings are converted in chunks.
+        array = pa.concat_arrays(
+            [chunk.cast(pa.large_string()) for chunk in array.chunks]
+        )
+    if pa.types.is_dictionary(array.type):
+        array = array.dictionary_decode()
+    if not (pa.types.is_string(array.type) or pa.types.is_large_string(array.type)):
+        return None
+
+    split = pc.split_pattern(array, pattern=sep)
+    # Missing values are kept as a single row.
+    lengths = pc.fill_null(pc.list_value_length(split), 1).to_numpy()
+    is_null = array.is_null().to_numpy(zero_copy_only=False)
+    return lengths, is_null, pc.list_flatten(split)
 
 
 def explode_column(
@@ -414,9 +1302,13 @@ def explode_column(
     column: str,
     sep: Optional[str] = ";",
     ignore_index: Optional[bool] = False,
+    categorical: bool = False,
 ) -> pd.DataFrame:
     """Explode a column in a given pandas DataFrame argument.
 
+    Columns of strings are split in a single vectorized pass with pyarrow. Other
+    columns, e.g. holding lists, are split row by row.
+
     Parameters
     ----------
     df : pd.DataFrame
@@ -427,28 +1319,63 @@ def explode_column(
         The string to use to separate values in the resulting DataFrame. (Default value = None).
     ignore_index : Optional[bool], optional
         If True, the resulting index will be labeled 0, 1, …, n - 1. (Default value = False).
+    categorical : bool
+        If True, return the exploded column as a categorical, which saves memory when
+        values are repeated. (Default value = False).
 
     Returns
     -------
     pd.DataFrame
         A DataFrame with the given column exploded.
     """
-    return df.assign(
-        **{
-            column: df[column].apply(
-                lambda row: row.split(sep) if isinstance(row, str) else row
-            )
-        }
-    ).explode(column=column, ignore_index=ignore_index)
+    split = _split_string_column(df[column], sep) if sep else None
+    if split is None:
+        exploded = df.assign(
+            **{
+                column: df[column].apply(
+                    lambda row: row.split(sep) if isinstance(row, str) else row
+                )
+            }
+        ).explode(column=column, ignore_index=ignore_index)
+        return exploded.astype({column: "category"}) if categorical else exploded
+
+    lengths, row_is_null, values = split
+    exploded = df.take(np.repeat(np.arange(len(df)), lengths))
+    is_null = np.repeat(row_is_null, lengths)
+    if categorical:
+        encoded = pc.dictionary_encode(values)
+        categories = encoded.dictionary.to_numpy(zero_copy_only=False)
+        # Sort the categories like astype("category") does.
+        order = np.argsort(categories)
+        new_codes = np.empty(len(order), dtype=np.int32)
+        new_codes[order] = np.arange(len(order), dtype=np.int32)
+        codes = np.full(len(is_null), -1, dtype=np.int32)
+        codes[~is_null] = new_codes[encoded.indices.to_numpy(zero_copy_only=False)]
+        exploded_values = pd.Categorical.from_codes(codes, categories[order])
+    else:
+        exploded_values = np.empty(len(is_null), dtype=object)
+        exploded_values[~is_null] = values.to_numpy(zero_copy_only=False)
+        # Keep the original missing values, e.g. None or np.nan.
+        exploded_values[is_null] = df[column].to_numpy()[row_is_null]
+    exploded[column] = exploded_values
+    if ignore_index:
+        exploded = exploded.reset_index(drop=True)
+    return exploded
 
 
 def explode(
     column: str,
     ignore_index: Optional[bool] = False,
     sep: Optional[str] = None,
+    categorical: bool = False,
 ) -> Callable[..., Any]:
     """Explode a column in a given pandas DataFrame argument.
 
+    pyarrow Table and polars DataFrame arguments are processed natively with
+    talus_utils.arrow.explode.
+    ParquetFrame and pyarrow dataset arguments are streamed out of core with
+    talus_utils.parquet.explode.
+
     Parameters
     ----------
     column : str
@@ -457,6 +1384,8 @@ def explode(
         If True, the resulting index will be labeled 0, 1, …, n - 1. (Default value = False).
     sep : Optional[str]
         The string to use to separate values in the resulting DataFrame. (Default value = None).
+    categorical : bool
+        If True, return the exploded column as a categorical. (Default value = False).
 
     Returns
     -------
@@ -479,24 +1408,38 @@ def explode(
             The wrapped function.
 
         """
-
-        @functools.wraps(func)
-        def wrapped_func(*args: str, **kwargs: str) -> Any:
-            if sep:
-                apply_func = lambda df: explode_column(
-                    df=df, column=column, sep=sep, ignore_index=ignore_index
-                )
-            else:
-                apply_func = lambda df: df.explode(
-                    column=column, ignore_index=ignore_index
-                )
-            filter_func = lambda arg: type(arg) == pd.DataFrame
-            args = override_args(args=args, func=apply_func, filter=filter_func)
-            kwargs = override_kwargs(kwargs=kwargs, func=apply_func, filter=filter_func)
-            return_value = func(*args, **kwargs)
-            return return_value
-
-        return wrapped_func
+        if sep:
+            apply_func = lambda df: explode_column(
+                df=df,
+                column=column,
+                sep=sep,
+                ignore_index=ignore_index,
+                categorical=categorical,
+            )
+        elif categorical:
+            apply_func = lambda df: df.explode(
+                column=column, ignore_index=ignore_index
+            ).astype({column: "category"})
+        else:
+            apply_func = lambda df: df.explode(column=column, ignore_index=ignore_index)
+
+        step = _Step(
+            name="explode",
+            apply_func=apply_func,
+            params={
+                "column": column,
+                "ignore_index": ignore_index,
+                "sep": sep,
+                "categorical": categorical,
+            },
+            arrow_func=lambda table: arrow.explode(
+                table, column=column, sep=sep, categorical=categorical
+            ),
+            parquet_func=lambda frame: parquet.explode(
+                frame, column=column, sep=sep, categorical=categorical
+            ),
+        )
+        return _wrap_step(func, step)
 
     return explode_wrap
 
@@ -504,6 +1447,11 @@ def explode(
 def update_column(column: str, update_func: Callable[..., Any]) -> Callable[..., Any]:
     """Apply a given function to a column in a given pandas DataFrame argument.
 
+    pyarrow Table and polars DataFrame arguments are processed natively with
+    talus_utils.arrow.update_column.
+    ParquetFrame and pyarrow dataset arguments are streamed out of core with
+    talus_utils.parquet.update_column.
+
     Parameters
     ----------
     column : str
@@ -532,16 +1480,444 @@ def update_column(column: str, update_func: Callable[..., Any]) -> Callable[...,
             The wrapped function.
 
         """
+        apply_func = lambda df: df.assign(**{column: df[column].apply(update_func)})
+
+        step = _Step(
+            name="update_column",
+            apply_func=apply_func,
+            params={"column": column, "update_func": update_func},
+            arrow_func=lambda table: arrow.update_column(
+                table, column=column, update_func=update_func
+            ),
+            parquet_func=lambda frame: parquet.update_column(
+                frame, column=column, update_func=update_func
+            ),
+        )
+        return _wrap_step(func, step)
 
-        @functools.wraps(func)
-        def wrapped_func(*args: str, **kwargs: str) -> Any:
-            apply_func = lambda df: df.assign(**{column: df[column].apply(update_func)})
-            filter_func = lambda arg: type(arg) == pd.DataFrame
-            args = override_args(args=args, func=apply_func, filter=filter_func)
-            kwargs = override_kwargs(kwargs=kwargs, func=apply_func, filter=filter_func)
-            return_value = func(*args, **kwargs)
-            return return_value
+    return update_column_wrap
 
-        return wrapped_func
 
-    return update_column_wrap
+def _fuse_log_normalize(log_step: _Step, normalize_step: _Step) -> _Step:
+    """Fuse a log_scaling step and the normalize step that follows it.
+
+    The fused step copies the values once and applies the outlier masking, the
+    logarithm and the normalization in place on that single buffer.
+
+    Parameters
+    ----------
+    log_step : _Step
+        The log_scaling step.
+    normalize_step : _Step
+        The normalize step applied to the output of log_step.
+
+    Returns
+    -------
+    _Step
+        The fused step.
+    """
+    log_function = log_step.params["log_function"]
+    filter_outliers = log_step.params["filter_outliers"]
+    how = normalize_step.params["how"]
+    n_jobs = normalize_step.params["n_jobs"] or log_step.params["n_jobs"]
+
+    def apply_func(df: pd.DataFrame) -> pd.DataFrame:
+        # Other dtypes (e.g. float32) keep the eager semantics.
+        if not all(
+            dtype == np.float64 or np.issubdtype(dtype, np.integer)
+            for dtype in df.dtypes
+        ):
+            return normalize_step.apply_func(log_step.apply_func(df))
+
+        values = df.to_numpy(dtype=np.float64, copy=True)
+        block_func = functools.partial(
+            _log_block, log_function=log_function, filter_outliers=filter_outliers
+        )
+        _map_blocks(block_func, values, n_jobs=n_jobs)
+        _normalize_values(values, how, n_jobs=n_jobs)
+        return pd.DataFrame(values, index=df.index, columns=df.columns)
+
+    return _Step(
+        name=f"{log_step.name}+{normalize_step.name}",
+        apply_func=apply_func,
+        params={**log_step.params, **normalize_step.params},
+        arrow_func=lambda table: normalize_step.arrow_func(log_step.arrow_func(table)),
+        parquet_func=lambda frame: normalize_step.parquet_func(
+            log_step.parquet_func(frame)
+        ),
+    )
+
+
+def _plan(steps: List[_Step]) -> List[_Step]:
+    """Fuse the steps recorded by stacked decorators.
+
+    Parameters
+    ----------
+    steps : List[_Step]
+        The steps in the order they are applied (outermost decorator first).
+
+    Returns
+    -------
+    List[_Step]
+        The fused steps.
+    """
+    plan: List[_Step] = []
+    i = 0
+    while i < len(steps):
+        step = steps[i]
+        next_step = steps[i + 1] if i + 1 < len(steps) else None
+        if (
+            step.name == "copy"
+            and step.params["mode"] == "deep"
+            and next_step is not None
+            and next_step.allocates
+        ):
+            # The next step never touches its input, so the copy is redundant.
+            i += 1
+            continue
+        if (
+            step.name == "log_scaling"
+            # Other functions may not accept the out argument of the fused step.
+            and isinstance(step.params["log_function"], np.ufunc)
+            and next_step is not None
+            and next_step.name == "normalize"
+            and next_step.params["how"].lower() in IN_PLACE_NORMALIZATIONS
+            and next_step.params["dtype"] is None
+        ):
+            plan.append(_fuse_log_normalize(step, next_step))
+            i += 2
+            continue
+        plan.append(step)
+        i += 1
+    return plan
+
+
+def _collect_steps(func: Callable[..., Any]) -> Tuple[List[_Step], Callable[..., Any]]:
+    """Collect the steps recorded by a stack of talus_utils.dataframe decorators.
+
+    Parameters
+    ----------
+    func : Callable[..., Any]
+        The outermost decorated function.
+
+    Returns
+    -------
+    Tuple[List[_Step], Callable[..., Any]]
+        The steps (outermost decorator first) and the undecorated function.
+    """
+    steps = []
+    while hasattr(func, "_step"):
+        inner = func.__wrapped__  # type: ignore[attr-defined]
+        # functools.wraps copies _step onto foreign wrappers, which must be
+        # called as they are.
+        if getattr(inner, "_step", None) is func._step:  # type: ignore[attr-defined]
+            break
+        steps.append(func._step)  # type: ignore[attr-defined]
+        func = inner
+    return steps, func
+
+
+def lazy(func: Callable[..., Any]) -> Callable[..., Any]:
+    """Run a stack of talus_utils.dataframe decorators as a single fused plan.
+
+    Instead of every decorator walking the arguments and materializing its own
+    intermediate DataFrame, the recorded steps are fused and run once per
+    pandas DataFrame argument before calling the undecorated function. A deep
+    copy is skipped when the next step returns new data anyway, and log_scaling
+    followed by a row, column, minmax or median normalize runs as a single
+    in-place pass over one NumPy buffer.
+
+    Parameters
+    ----------
+    func : Callable[..., Any]
+        A function decorated with talus_utils.dataframe decorators. lazy must be
+        the outermost decorator.
+
+    Returns
+    -------
+    Callable[..., Any]
+        The wrapped function.
+
+    Examples
+    --------
+    >>> @lazy
+    ... @copy
+    ... @log_scaling()
+    ... @normalize(how="row")
+    ... def analyze(df):
+    ...     return df
+    """
+    steps, base_func = _collect_steps(func)
+    plan = _plan(steps)
+
+    @functools.wraps(func)
+    def wrapped_func(*args: str, **kwargs: str) -> Any:
+        apply_func = lambda arg: functools.reduce(
+            lambda acc, step: _apply_step(step, acc), plan, arg
+        )
+        with contextlib.ExitStack() as stack:
+            for step in plan:
+                stack.enter_context(step.context())
+            args = override_args(args=args, func=apply_func)
+            kwargs = override_kwargs(kwargs=kwargs, func=apply_func)
+            return_value = base_func(*args, **kwargs)
+        return return_value
+
+    # Steps are only recorded for eager wrappers, functools.wraps copied this one.
+    wrapped_func.__dict__.pop("_step", None)
+    wrapped_func._plan = plan  # type: ignore[attr-defined]
+    return wrapped_func
+
+
+class CacheInfo(NamedTuple):
+    """The statistics of a function wrapped with cached."""
+
+    hits: int
+    misses: int
+    disk_hits: int
+    maxsize: int
+    currsize: int
+
+
+def _content_hash(df: Union[pd.DataFrame, pd.Series]) -> str:
+    """Hash the content of a pandas DataFrame or Series.
+
+    NumPy blocks are hashed from their raw buffers without copying them, which is
+    faster than pd.util.hash_pandas_object. Other blocks and the labels fall back to
+    pd.util.hash_pandas_object.
+
+    Parameters
+    ----------
+    df : Union[pd.DataFrame, pd.Series]
+        The input data.
+
+    Returns
+    -------
+    str
+        The hex digest of the shape, labels, dtypes and values of df.
+    """
+    frame = df.to_frame() if isinstance(df, pd.Series) else df
+    digest = hashlib.sha256()
+    digest.update(repr((type(df).__name__, frame.shape)).encode())
+    digest.update(pd.util.hash_pandas_object(frame.columns.to_frame()).to_numpy())
+    digest.update(pd.util.hash_pandas_object(frame.index.to_frame()).to_numpy())
+    for block in frame._mgr.blocks:
+        digest.update(str(block.dtype).encode())
+        digest.update(block.mgr_locs.as_array.tobytes())
+        values = block.values
+        if isinstance(values, np.ndarray) and values.dtype.kind in "biufcmM":
+            # Hash every block in (columns, rows) order, so that equal data gives the
+            # same key whatever its memory layout. Other layouts, e.g. DataFrames
+            # around 2D arrays, are copied a few columns at a time.
+            n_columns = max(1, 2 ** 23 // max(1, values.shape[1]))
+            for start in range(0, len(values), n_columns):
+                chunk = np.ascontiguousarray(values[start : start + n_columns])
+                digest.update(chunk.view(np.uint8))
+        else:
+            columns = frame.iloc[:, block.mgr_locs.as_array]
+            digest.update(pd.util.hash_pandas_object(columns, index=False).to_numpy())
+    return digest.hexdigest()
+
+
+def _stable_repr(value: Any) -> str:
+    """Represent a value the same way in every session, for cache keys.
+
+    Functions are represented by their qualified name and a hash of their code,
+    defaults and closure instead of their repr, which holds their memory address.
+    Sets are sorted, since their order depends on the string hash seed.
+
+    Parameters
+    ----------
+    value : Any
+        The value, e.g. the parameters of a decorator.
+
+    Returns
+    -------
+    str
+        The representation.
+    """
+    if isinstance(value, types.CodeType):
+        digest = hashlib.sha256(value.co_code)
+        digest.update(_stable_repr((value.co_consts, value.co_names)).encode())
+        return digest.hexdigest()
+    if isinstance(value, functools.partial):
+        return _stable_repr(("partial", value.func, value.args, value.keywords))
+    if isinstance(value, dict):
+        items = sorted(_stable_repr(item) for item in value.items())
+        return f"{{{', '.join(items)}}}"
+    if isinstance(value, (list, tuple)):
+        return f"{type(value).__name__}({', '.join(map(_stable_repr, value))})"
+    if isinstance(value, (set, frozenset)):
+        return f"{type(value).__name__}({', '.join(sorted(map(_stable_repr, value)))})"
+    if callable(value):
+        name = getattr(value, "__qualname__", getattr(value, "__name__", None))
+        if name is None:
+            return repr(value)
+        module = getattr(value, "__module__", None) or type(value).__module__
+        parts = [f"{module}.{name}"]
+        code = getattr(value, "__code__", None)
+        if code is not None:
+            closure = [cell.cell_contents for cell in value.__closure__ or ()]
+            parts.append(_stable_repr((code, value.__defaults__, closure)))
+        return f"<{' '.join(parts)}>"
+    return repr(value)
+
+
+def _cache_key(
+    prefix: str, args: Tuple[Any, ...], kwargs: Dict[str, Any]
+) -> Optional[str]:
+    """Build the cache key of a call.
+
+    Parameters
+    ----------
+    prefix : str
+        Identifies the called function.
+    args : Tuple[Any, ...]
+        The positional arguments.
+    kwargs : Dict[str, Any]
+        The keyword arguments.
+
+    Returns
+    -------
+    Optional[str]
+        The key, or None if an argument can't be hashed.
+    """
+    digest = hashlib.sha256(prefix.encode())
+    for name, arg in [*enumerate(args), *sorted(kwargs.items())]:
+        digest.update(repr(name).encode())
+        try:
+            if isinstance(arg, (pd.DataFrame, pd.Series)):
+                digest.update(_content_hash(arg).encode())
+            else:
+                digest.update(pickle.dumps(arg))
+        except (pickle.PicklingError, TypeError, AttributeError):
+            # e.g. lambdas, or lists in object columns.
+            return None
+    return digest.hexdigest()
+
+
+def _read_only(value: Any) -> Any:
+    """Protect a cached value from in-place changes by the callers.
+
+    Parameters
+    ----------
+    value : Any
+        The cached value.
+
+    Returns
+    -------
+    Any
+        A read-only view of pandas DataFrames, other values as they are.
+    """
+    if type(value) == pd.DataFrame:
+        return _readonly_view(value)
+    return value
+
+
+def cached(
+    func: Optional[Callable[..., Any]] = None,
+    maxsize: int = 32,
+    cache_dir: Optional[Union[str, Path]] = None,
+) -> Callable[..., Any]:
+    """Memoize a function on the content of its pandas DataFrame arguments.
+
+    Can be used as @cached or as @cached(maxsize=..., cache_dir=...). DataFrame and
+    Series arguments are keyed on a hash of their content, other arguments on their
+    pickled value. Calls with arguments that can't be pickled aren't cached.
+
+    Cached DataFrames are returned as read-only views, see copy(mode="readonly"), so
+    that callers can't change the cached result in place.
+
+    The wrapped function has a cache_info method returning a CacheInfo and a
+    cache_clear method.
+
+    Parameters
+    ----------
+    func: Optional[Callable[..., Any]] :
+        The input function. (Default value = None).
+    maxsize: int
+        The number of results to keep in memory, least recently used first out.
+        (Default value = 32).
+    cache_dir: Optional[Union[str, Path]]
+        If given, also write DataFrame results to Parquet files in this directory and
+        read them back when they aren't in memory anymore, e.g. in a new session.
+        Results that can't be written to Parquet are only kept in memory. The files
+        are keyed on the qualified name and code of the function and the names and
+        arguments of its talus_utils.dataframe decorators. (Default value = None).
+
+    Returns
+    -------
+    Callable[..., Any]
+        The wrapped function.
+
+    Examples
+    --------
+    >>> import tempfile
+    >>> @cached(cache_dir=tempfile.mkdtemp())
+    ... @pivot_table(index="Protein", columns="Sample", values="Intensity")
+    ... @normalize(how="quantile")
+    ... def analyze(df):
+    ...     return df
+    """
+    if func is None:
+        return functools.partial(cached, maxsize=maxsize, cache_dir=cache_dir)
+
+    steps, base_func = _collect_steps(func)
+    steps = getattr(func, "_plan", steps)
+    prefix = _stable_repr((base_func, [(step.name, step.params) for step in steps]))
+    results: "OrderedDict[str, Any]" = OrderedDict()
+    stats = {"hits": 0, "misses": 0, "disk_hits": 0}
+    if cache_dir is not None:
+        cache_dir = Path(cache_dir).expanduser()
+        cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def store(key: str, value: Any) -> None:
+        results[key] = value
+        if len(results) > maxsize:
+            results.popitem(last=False)
+
+    @functools.wraps(func)
+    def wrapped_func(*args: Any, **kwargs: Any) -> Any:
+        key = _cache_key(prefix, args, kwargs)
+        if key is None:
+            return func(*args, **kwargs)
+
+        if key in results:
+            stats["hits"] += 1
+            results.move_to_end(key)
+            return _read_only(results[key])
+
+        path = None if cache_dir is None else cache_dir.joinpath(f"{key}.parquet")
+        if path is not None and path.exists():
+            stats["disk_hits"] += 1
+            value = pd.read_parquet(path)
+            store(key, value)
+            return _read_only(value)
+
+        stats["misses"] += 1
+        value = func(*args, **kwargs)
+        store(key, value)
+        if path is not None and type(value) == pd.DataFrame:
+            try:
+                # Dictionary encoding rarely pays off on quant values and slows writes.
+                value.to_parquet(path, use_dictionary=False)
+            except (ValueError, TypeError, pa.ArrowException):
+                # e.g. non-string column names.
+                try:
+                    path.unlink()
+                except FileNotFoundError:
+                    pass
+        return _read_only(value)
+
+    def cache_info() -> CacheInfo:
+        return CacheInfo(maxsize=maxsize, currsize=len(results), **stats)
+
+    def cache_clear() -> None:
+        results.clear()
+        stats.update(hits=0, misses=0, disk_hits=0)
+
+    # Keep lazy from skipping the cache, like for other foreign wrappers.
+    wrapped_func.__dict__.pop("_step", None)
+    wrapped_func.cache_info = cache_info  # type: ignore[attr-defined]
+    wrapped_func.cache_clear = cache_clear  # type: ignore[attr-defined]
+    return wrapped_func
@@ -0,0 +1,328 @@
+"""src/talus_utils/digest.py module."""
+import re
+
+from pathlib import Path
+from typing import Dict, List, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from .fasta import read_fasta
+
+
+# Cleavage site rules, matching the residue after which each enzyme cleaves.
+ENZYMES: Dict[str, str] = {
+    "trypsin": r"[KR](?=[^P])",
+    "trypsin/p": r"[KR]",
+    "lys-c": r"K",
+    "lys-n": r"\w(?=K)",
+    "arg-c": r"R",
+    "asp-n": r"\w(?=D)",
+    "glu-c": r"E",
+    "chymotrypsin": r"[FYW](?=[^P])",
+}
+INDEX_ARRAYS = ["peptide_offsets", "peptide_data", "indptr", "protein_ids", "proteins"]
+Peptides = Union[pd.Series, np.ndarray, Sequence[str], pa.Array, pa.ChunkedArray]
+# The number of peptides held as Python strings while building an index.
+BUILD_CHUNK_SIZE = 2 ** 20
+
+
+def cleave(
+    sequence: str,
+    enzyme: str = "trypsin",
+    missed_cleavages: int = 2,
+    min_length: int = 7,
+    max_length: int = 50,
+) -> List[str]:
+    """Digest a protein sequence in silico.
+
+    Parameters
+    ----------
+    sequence : str
+        The protein sequence.
+    enzyme : str
+        The name of an enzyme in ENZYMES or a regular expression matching the
+        residues after which it cleaves. (Default value = "trypsin").
+    missed_cleavages : int
+        The maximum number of missed cleavages. (Default value = 2).
+    min_length : int
+        The minimum peptide length. (Default value = 7).
+    max_length : int
+        The maximum peptide length. (Default value = 50).
+
+    Returns
+    -------
+    List[str]
+        The unique peptides, in order of their first appearance.
+
+    Examples
+    --------
+    >>> cleave("PEPTIDEKAPEPTIDERSPEPTIDEK", missed_cleavages=1, max_length=17)
+    ['PEPTIDEK', 'PEPTIDEKAPEPTIDER', 'APEPTIDER', 'SPEPTIDEK']
+    """
+    rule = ENZYMES.get(enzyme.lower(), enzyme)
+    sites = [0]
+    sites += [match.end() for match in re.finditer(rule, sequence)]
+    if sites[-1] != len(sequence):
+        sites.append(len(sequence))
+
+    peptides = {}
+    for i, start in enumerate(sites[:-1]):
+        for end in sites[i + 1 : i + missed_cleavages + 2]:
+            if end - start > max_length:
+                break
+            if end - start >= min_length:
+                peptides[sequence[start:end]] = None
+    return list(peptides)
+
+
+def _to_arrow(peptides: Peptides) -> Union[pa.Array, pa.ChunkedArray]:
+    """Convert peptide sequences to a pyarrow large_string array.
+
+    Parameters
+    ----------
+    peptides : Union[pd.Series, np.ndarray, Sequence[str], pa.Array, pa.ChunkedArray]
+        The peptide sequences.
+
+    Returns
+    -------
+    Union[pa.Array, pa.ChunkedArray]
+        The peptide sequences.
+    """
+    if isinstance(peptides, (pa.Array, pa.ChunkedArray)):
+        return peptides.cast(pa.large_string())
+    return pa.array(
+        np.asarray(peptides, dtype=object), type=pa.large_string(), from_pandas=True
+    )
+
+
+class PeptideIndex:
+    """Map peptide sequences to the proteins they digest from.
+
+    The unique peptides are stored in a pyarrow string array, with the ids of their
+    proteins in compressed sparse row arrays, instead of millions of Python objects.
+    Batches of peptides are looked up in pyarrow's hash table rather than one at a
+    time in Python.
+
+    Examples
+    --------
+    >>> import tempfile
+    >>> path = Path(tempfile.mkdtemp(), "proteins.fasta")
+    >>> _ = path.write_text(
+    ...     ">sp|P00001|PROT1_HUMAN\\nPEPTIDEKAPEPTIDER\\n"
+    ...     ">sp|P00002|PROT2_HUMAN\\nPEPTIDEKSAMPLER\\n"
+    ... )
+    >>> index = PeptideIndex.from_fasta(path, missed_cleavages=0)
+    >>> index.save(path.with_suffix(".npz"))
+    >>> index = PeptideIndex.load(path.with_suffix(".npz"))
+    >>> index.map_peptides(["PEPTIDEK", "APEPTIDER", "TEST"])
+      PeptideSeq       ProteinAccession
+    0   PEPTIDEK  sp|P00001|PROT1_HUMAN
+    1   PEPTIDEK  sp|P00002|PROT2_HUMAN
+    2  APEPTIDER  sp|P00001|PROT1_HUMAN
+    """
+
+    def __init__(
+        self,
+        peptides: pa.LargeStringArray,
+        indptr: np.ndarray,
+        protein_ids: np.ndarray,
+        proteins: np.ndarray,
+    ) -> None:
+        """Create the index from its arrays.
+
+        Parameters
+        ----------
+        peptides : pa.LargeStringArray
+            The unique peptides.
+        indptr : np.ndarray
+            The proteins of peptide i are protein_ids[indptr[i] : indptr[i + 1]].
+        protein_ids : np.ndarray
+            The positions of the proteins in proteins.
+        proteins : np.ndarray
+            The unique protein identifiers.
+        """
+        self.peptides = peptides
+        self.indptr = indptr
+        self.protein_ids = protein_ids
+        self.proteins = proteins
+
+    @classmethod
+    def from_fasta(
+        cls,
+        path: Union[str, Path],
+        enzyme: str = "trypsin",
+        missed_cleavages: int = 2,
+        min_length: int = 7,
+        max_length: int = 50,
+    ) -> "PeptideIndex":
+        """Digest every protein of a FASTA file and index its peptides.
+
+        Proteins are identified like the ProteinAccession of elib tables, as
+        db|UniqueIdentifier|EntryName or as the whole identifier of non UniProt
+        headers.
+
+        Parameters
+        ----------
+        path : Union[str, Path]
+            The FASTA file, optionally gzip compressed.
+        enzyme : str
+            The enzyme, see cleave. (Default value = "trypsin").
+        missed_cleavages : int
+            The maximum number of missed cleavages. (Default value = 2).
+        min_length : int
+            The minimum peptide length. (Default value = 7).
+        max_length : int
+            The maximum peptide length. (Default value = 50).
+
+        Returns
+        -------
+        PeptideIndex
+            The index.
+        """
+        protein_positions: Dict[str, int] = {}
+        chunks: List[pa.Array] = []
+        chunk: List[str] = []
+        protein_ids = []
+        for record in read_fasta(path):
+            protein = (
+                "|".join([record.db, record.accession, record.entry_name])
+                if record.db
+                else record.accession
+            )
+            protein_id = protein_positions.setdefault(protein, len(protein_positions))
+            peptides = cleave(
+                record.sequence, enzyme, missed_cleavages, min_length, max_length
+            )
+            chunk.extend(peptides)
+            protein_ids.append(np.full(len(peptides), protein_id, dtype=np.int32))
+            # Move the peptides to arrow buffers before Python strings pile up.
+            if len(chunk) >= BUILD_CHUNK_SIZE:
+                chunks.append(pa.array(chunk, type=pa.large_string()))
+                chunk = []
+        chunks.append(pa.array(chunk, type=pa.large_string()))
+
+        encoded = pc.dictionary_encode(pa.concat_arrays(chunks))
+        codes = encoded.indices.to_numpy()
+        ids = np.concatenate(protein_ids or [np.empty(0, dtype=np.int32)])
+        order = np.lexsort((ids, codes))
+        codes, ids = codes[order], ids[order]
+        # Drop the pairs of repeated protein identifiers.
+        keep = np.ones(len(ids), dtype=bool)
+        keep[1:] = (codes[1:] != codes[:-1]) | (ids[1:] != ids[:-1])
+        codes, ids = codes[keep], ids[keep]
+
+        indptr = np.zeros(len(encoded.dictionary) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(codes, minlength=len(encoded.dictionary)), out=indptr[1:])
+        return cls(
+            peptides=encoded.dictionary,
+            indptr=indptr,
+            protein_ids=ids,
+            proteins=np.array(list(protein_positions), dtype=object),
+        )
+
+    def __len__(self) -> int:
+        """Return the number of peptides."""
+        return len(self.peptides)
+
+    def save(self, path: Union[str, Path]) -> None:
+        """Write the index to a .npz file.
+
+        Parameters
+        ----------
+        path : Union[str, Path]
+            The file to write.
+        """
+        _, offsets_buffer, data_buffer = self.peptides.buffers()
+        offsets = np.frombuffer(offsets_buffer, dtype=np.int64)
+        offsets = offsets[self.peptides.offset :][: len(self) + 1]
+        data = np.frombuffer(data_buffer or b"", dtype=np.uint8)
+        with open(path, "wb") as index_file:
+            np.savez(
+                index_file,
+                peptide_offsets=offsets - offsets[0],
+                peptide_data=data[offsets[0] : offsets[-1]],
+                indptr=self.indptr,
+                protein_ids=self.protein_ids,
+                proteins=self.proteins.astype(str),
+            )
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "PeptideIndex":
+        """Read an index written by PeptideIndex.save.
+
+        Parameters
+        ----------
+        path : Union[str, Path]
+            The .npz file.
+
+        Returns
+        -------
+        PeptideIndex
+            The index.
+        """
+        with np.load(path, allow_pickle=False) as arrays:
+            offsets, data, indptr, protein_ids, proteins = (
+                arrays[name] for name in INDEX_ARRAYS
+            )
+        peptides = pa.LargeStringArray.from_buffers(
+            len(offsets) - 1, pa.py_buffer(offsets), pa.py_buffer(data)
+        )
+        return cls(peptides, indptr, protein_ids, proteins.astype(object))
+
+    def lookup(self, peptides: Peptides) -> Tuple[np.ndarray, np.ndarray]:
+        """Find the proteins of a batch of peptides.
+
+        Parameters
+        ----------
+        peptides : Peptides
+            The peptide sequences.
+
+        Returns
+        -------
+        Tuple[np.ndarray, np.ndarray]
+            The positions in peptides and the protein ids of every (peptide, protein)
+            match. Peptides that aren't in the index have no match.
+        """
+        positions = pc.index_in(_to_arrow(peptides), value_set=self.peptides)
+        positions = pc.fill_null(positions, -1).to_numpy()
+        found = positions >= 0
+        starts = np.where(found, self.indptr[positions], 0)
+        counts = np.where(found, self.indptr[positions + 1] - starts, 0)
+
+        # Expand every peptide into its slice of protein_ids.
+        queries = np.repeat(np.arange(len(positions)), counts)
+        offsets = np.arange(counts.sum()) + np.repeat(
+            starts - (np.cumsum(counts) - counts), counts
+        )
+        return queries, self.protein_ids[offsets]
+
+    def map_peptides(self, peptides: Peptides) -> pd.DataFrame:
+        """Map a batch of peptides to their proteins.
+
+        Parameters
+        ----------
+        peptides : Peptides
+            The peptide sequences.
+
+        Returns
+        -------
+        pd.DataFrame
+            A PeptideSeq and a categorical ProteinAccession column with a row per
+            (peptide, protein) match, like the peptidetoprotein table of elib files.
+        """
+        queries, protein_ids = self.lookup(peptides)
+        if isinstance(peptides, (pa.Array, pa.ChunkedArray)):
+            matched_peptides = peptides.take(queries).to_pandas().to_numpy()
+        else:
+            matched_peptides = np.asarray(peptides, dtype=object)[queries]
+        return pd.DataFrame(
+            {
+                "PeptideSeq": matched_peptides,
+                "ProteinAccession": pd.Categorical.from_codes(
+                    protein_ids, categories=self.proteins
+                ),
+            }
+        )
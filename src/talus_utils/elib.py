@@ -1,21 +1,140 @@
 """src/talus_utils/elib.py module."""
+import asyncio
+import functools
+import itertools
 import sqlite3
 import tempfile
+import threading
 
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 from sqlite3.dbapi2 import Cursor
-from typing import Dict, Optional, Union
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
 
-from talus_utils.s3 import _read_object
+from talus_utils.cache import S3Cache
+from talus_utils.s3 import _download_object
+
+
+DEFAULT_BATCH_SIZE = 100000
+PARQUET_TABLES = ("peptidescores", "proteinscores", "peptidetoprotein")
+ELIB_TABLES = PARQUET_TABLES + ("metadata",)
+MAX_ATTACHED = 10
+
+# The number of compiled statements each connection keeps for reuse.
+CACHED_STATEMENTS = 256
+READ_ONLY_PRAGMAS = {
+    "mmap_size": 1024 ** 3,
+    "cache_size": -256 * 1024,
+    "temp_store": "MEMORY",
+    "query_only": "ON",
+}
+
+ELIB_DTYPES = {
+    "SourceFile": "category",
+    "ProteinAccession": "category",
+    "isDecoy": "bool",
+    "IsDecoy": "bool",
+}
+
+
+def _convert_elib_dtypes(df: pd.DataFrame) -> pd.DataFrame:
+    """Convert the known columns of an elib query result to compact column types.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        A query result.
+
+    Returns
+    -------
+    pd.DataFrame
+        The query result with the columns in ELIB_DTYPES converted.
+    """
+    return df.astype(
+        {column: dtype for column, dtype in ELIB_DTYPES.items() if column in df}
+    )
+
+
+def _connect(
+    file_name: Union[Path, str],
+    read_only: Optional[bool] = False,
+    check_same_thread: Optional[bool] = True,
+) -> sqlite3.Connection:
+    """Open a SQLite connection to an elib file.
+
+    Parameters
+    ----------
+    file_name : Union[Path, str]
+        The path to the elib file.
+    read_only : Optional[bool]
+        If True, open the file with an immutable read-only URI, memory-map it and
+        apply the READ_ONLY_PRAGMAS. (Default value = False).
+    check_same_thread : Optional[bool]
+        If False, allow the connection to be closed from another thread. (Default value = True).
+
+    Returns
+    -------
+    sqlite3.Connection
+        The SQLite connection.
+    """
+    if not read_only:
+        return sqlite3.connect(file_name, check_same_thread=check_same_thread)
+
+    # immutable=1 tells SQLite the file can't change, so it skips all locking.
+    uri = f"{Path(file_name).resolve().as_uri()}?mode=ro&immutable=1"
+    connection = sqlite3.connect(
+        uri,
+        uri=True,
+        cached_statements=CACHED_STATEMENTS,
+        check_same_thread=check_same_thread,
+    )
+    for pragma, value in READ_ONLY_PRAGMAS.items():
+        connection.execute(f"PRAGMA {pragma} = {value};")
+    return connection
+
+
+def _quote(value: str) -> str:
+    """Quote a string as an SQL literal.
+
+    Parameters
+    ----------
+    value : str
+        The string to quote.
+
+    Returns
+    -------
+    str
+        The SQL string literal.
+    """
+    return "'{}'".format(value.replace("'", "''"))
 
 
 class Elib:
     """Handle easy interactions with .elib files."""
 
-    def __init__(self, key_or_filename: Union[Path, str], bucket: Optional[str] = None):
-        """Initialize a new SQLite connection to a file by downloading it as a tmp file.
+    def __init__(
+        self,
+        key_or_filename: Union[Path, str],
+        bucket: Optional[str] = None,
+        cache: Optional[S3Cache] = None,
+        read_only: Optional[bool] = False,
+    ):
+        """Initialize a new SQLite connection to a file by streaming it to a tmp file.
 
         Parameters
         ----------
@@ -23,24 +142,66 @@ class Elib:
             Either a key to an object in S3 (when bucket is given) or a file name to connect to.
         bucket : Optional[str], optional
             The name of the S3 bucket to load the file from, by default None
+        cache : Optional[S3Cache], optional
+            A cache to reuse local copies of S3 files from instead of downloading
+            them to a tmp file, by default None
+        read_only : Optional[bool], optional
+            If True, open the file as an immutable, read-only, memory-mapped database
+            tuned for repeated analysis queries, by default False
         """
         self._tmp = None
         if not bucket:
             self._file_name = key_or_filename
+        elif cache:
+            self._file_name = cache.get(bucket=bucket, key=str(key_or_filename))
         else:
-            elib = _read_object(bucket=bucket, key=key_or_filename)
-            elib_content = elib.read()
-            self._tmp = tempfile.NamedTemporaryFile()
-            self._tmp.write(elib_content)
+            self._tmp = tempfile.NamedTemporaryFile(suffix=".elib")
+            _download_object(
+                bucket=bucket, key=str(key_or_filename), filename=self._tmp.name
+            )
             self._file_name = self._tmp.name
 
         # connect to tmp file
-        self._connection = sqlite3.connect(self._file_name)
+        self._open(read_only=read_only)
+
+    def __enter__(self) -> "Elib":
+        """Enter the runtime context, returning this Elib.
+
+        Returns
+        -------
+        Elib
+            This Elib.
+        """
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        """Close the connection and the tmp file when leaving the runtime context.
+
+        Parameters
+        ----------
+        exc_info : Any
+            The exception raised within the context, if any.
+        """
+        self.close()
+
+    def _open(self, read_only: Optional[bool] = False) -> None:
+        """Open the connection and cursor to the elib file.
+
+        Parameters
+        ----------
+        read_only : Optional[bool]
+            If True, open a read-only connection. (Default value = False).
+        """
+        self._connection = _connect(self._file_name, read_only=read_only)
         self._cursor = self._connection.cursor()
 
     def execute_sql(
-        self, sql: str, use_pandas: Optional[bool] = False
-    ) -> Union[pd.DataFrame, Cursor]:
+        self,
+        sql: str,
+        use_pandas: Optional[bool] = False,
+        chunksize: Optional[int] = None,
+        parameters: Sequence[Any] = (),
+    ) -> Union[pd.DataFrame, Iterator[pd.DataFrame], Cursor]:
         """Execute a given SQL command and returns the result as a cursor or a pandas DataFrame.
 
         Parameters
@@ -49,27 +210,616 @@ class Elib:
             SQL String to excute.
         use_pandas : bool
             If True, return the query result as a pandas DataFrame. (Default value = False).
+        chunksize : Optional[int]
+            If given together with use_pandas, return an iterator of DataFrames with
+            at most chunksize rows each, converted to the ELIB_DTYPES column types. (Default value = None).
+        parameters : Sequence[Any]
+            The values of the placeholders in the SQL string. Parameterized queries
+            reuse their compiled statement across calls. (Default value = ()).
 
         Returns
         -------
-        Union[pd.DataFrame, Cursor]
-            Returns either a cursor or a pandas DataFrame with the result
-            of the executed SQL query.
+        Union[pd.DataFrame, Iterator[pd.DataFrame], Cursor]
+            Returns either a cursor, a pandas DataFrame or an iterator of pandas
+            DataFrames with the result of the executed SQL query.
 
         """
-        if use_pandas:
-            return pd.read_sql_query(sql=sql, con=self._connection)
+        if use_pandas and chunksize:
+            chunks = pd.read_sql_query(
+                sql=sql, con=self._connection, params=parameters, chunksize=chunksize
+            )
+            return (_convert_elib_dtypes(chunk) for chunk in chunks)
+        elif use_pandas:
+            return pd.read_sql_query(sql=sql, con=self._connection, params=parameters)
         else:
-            return self._cursor.execute(sql)
+            return self._cursor.execute(sql, parameters)
+
+    def execute_sql_arrow(
+        self, sql: str, batch_size: int = DEFAULT_BATCH_SIZE
+    ) -> Iterator[pa.RecordBatch]:
+        """Execute a given SQL command and stream the result as Arrow record batches.
+
+        String columns in ELIB_DTYPES are dictionary encoded and decoy flags are booleans.
+
+        Parameters
+        ----------
+        sql : str
+            SQL String to excute.
+        batch_size : int
+            The maximum number of rows in each record batch. (Default value = DEFAULT_BATCH_SIZE).
+
+        Yields
+        ------
+        pa.RecordBatch
+            The next batch of rows of the query result.
+
+        """
+        for chunk in self.execute_sql(sql=sql, use_pandas=True, chunksize=batch_size):
+            yield pa.RecordBatch.from_pandas(chunk, preserve_index=False)
+
+    def count_distinct(
+        self,
+        table: str,
+        column: str,
+        where: Optional[str] = None,
+        parameters: Sequence[Any] = (),
+    ) -> int:
+        """Count the distinct values of a column inside SQLite without loading any rows.
+
+        Parameters
+        ----------
+        table : str
+            The name of the table to query.
+        column : str
+            The column to count the distinct values of.
+        where : Optional[str], optional
+            An optional SQL condition to filter the rows by. (Default value = None).
+        parameters : Sequence[Any], optional
+            The values of the placeholders in the where condition. (Default value = ()).
+
+        Returns
+        -------
+        int
+            The number of distinct values.
+
+        """
+        sql = f"SELECT COUNT(DISTINCT {column}) FROM {table}"
+        if where:
+            sql += f" WHERE {where}"
+        return self._cursor.execute(sql, parameters).fetchone()[0]
+
+    def get_summary(self, q_value_threshold: float = 0.01) -> Dict[str, int]:
+        """Summarize the target, decoy and q-value filtered peptides and proteins.
+
+        Parameters
+        ----------
+        q_value_threshold : float
+            The maximum q-value of the peptides and proteins in peptidescores and
+            proteinscores to count as detected. (Default value = 0.01).
+
+        Returns
+        -------
+        Dict[str, int]
+            A dictionary containing the number of unique target and decoy peptides
+            and proteins and the number of unique target peptides and proteins
+            passing the q-value threshold.
+
+        """
+        return {
+            "Unique Proteins": self.count_distinct(
+                "peptidetoprotein", "ProteinAccession", where="isDecoy == 0"
+            ),
+            "Unique Peptides": self.count_distinct(
+                "peptidetoprotein", "PeptideSeq", where="isDecoy == 0"
+            ),
+            "Decoy Proteins": self.count_distinct(
+                "peptidetoprotein", "ProteinAccession", where="isDecoy == 1"
+            ),
+            "Decoy Peptides": self.count_distinct(
+                "peptidetoprotein", "PeptideSeq", where="isDecoy == 1"
+            ),
+            "Filtered Proteins": self.count_distinct(
+                "proteinscores",
+                "ProteinAccession",
+                where="IsDecoy == 0 AND QValue <= ?",
+                parameters=(q_value_threshold,),
+            ),
+            "Filtered Peptides": self.count_distinct(
+                "peptidescores",
+                "PeptideSeq",
+                where="IsDecoy == 0 AND QValue <= ?",
+                parameters=(q_value_threshold,),
+            ),
+        }
+
+    def to_parquet(
+        self,
+        directory: Union[Path, str],
+        tables: Sequence[str] = PARQUET_TABLES,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> Path:
+        """Export tables of the elib file to Parquet datasets for fast columnar queries.
+
+        Each table is streamed in batches into its own sub directory. Tables with a
+        SourceFile column are partitioned by it and strings are dictionary encoded.
+
+        Parameters
+        ----------
+        directory : Union[Path, str]
+            The directory to write the datasets to. It should not contain previous exports.
+        tables : Sequence[str]
+            The tables to export. (Default value = PARQUET_TABLES).
+        batch_size : int
+            The number of rows to read and write at a time. (Default value = DEFAULT_BATCH_SIZE).
+
+        Returns
+        -------
+        Path
+            The directory the datasets were written to.
+
+        """
+        directory = Path(directory)
+        for table in tables:
+            chunks = self.execute_sql(
+                sql=f"SELECT * FROM {table};", use_pandas=True, chunksize=batch_size
+            )
+            first_chunk = next(chunks, None)
+            if first_chunk is None:
+                continue
+            # Categories differ between chunks, so fix the dictionary index type.
+            schema = pa.Schema.from_pandas(first_chunk, preserve_index=False)
+            for i, field in enumerate(schema):
+                if pa.types.is_dictionary(field.type):
+                    schema = schema.set(
+                        i, field.with_type(pa.dictionary(pa.int32(), pa.string()))
+                    )
+            schema = schema.remove_metadata()
+            partition_cols = ["SourceFile"] if "SourceFile" in schema.names else None
+            for chunk in itertools.chain([first_chunk], chunks):
+                # Every call adds new uniquely named files to the dataset.
+                pq.write_to_dataset(
+                    pa.Table.from_pandas(chunk, schema=schema, preserve_index=False),
+                    root_path=str(directory.joinpath(table)),
+                    partition_cols=partition_cols,
+                )
+        return directory
 
     def close(self) -> None:
         """Close and remove the tmp file and the connection."""
+        self._connection.close()
         if self._tmp:
             self._tmp.close()
 
 
+class ElibPool(Elib):
+    """Share an .elib file between threads, each with its own read-only connection."""
+
+    def __init__(
+        self,
+        key_or_filename: Union[Path, str],
+        bucket: Optional[str] = None,
+        cache: Optional[S3Cache] = None,
+        max_workers: Optional[int] = None,
+    ):
+        """Initialize a new pool of read-only SQLite connections to a file.
+
+        Connections are opened lazily, one per thread that queries the file.
+
+        Parameters
+        ----------
+        key_or_filename : str
+            Either a key to an object in S3 (when bucket is given) or a file name to connect to.
+        bucket : Optional[str], optional
+            The name of the S3 bucket to load the file from, by default None
+        cache : Optional[S3Cache], optional
+            A cache to reuse local copies of S3 files from instead of downloading
+            them to a tmp file, by default None
+        max_workers : Optional[int], optional
+            The number of threads used by execute_sql_async, by default None
+        """
+        self._max_workers = max_workers
+        super().__init__(
+            key_or_filename=key_or_filename, bucket=bucket, cache=cache, read_only=True
+        )
+
+    def _open(self, read_only: Optional[bool] = True) -> None:
+        """Set up the per-thread connections and the executor for async queries.
+
+        Parameters
+        ----------
+        read_only : Optional[bool]
+            Ignored, pooled connections are always read-only. (Default value = True).
+        """
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._connections: List[sqlite3.Connection] = []
+        self._executor = ThreadPoolExecutor(max_workers=self._max_workers)
+
+    @property  # type: ignore[override]
+    def _connection(self) -> sqlite3.Connection:
+        """Get the connection of the current thread, opening it on first use.
+
+        Returns
+        -------
+        sqlite3.Connection
+            The connection of the current thread.
+        """
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = _connect(
+                self._file_name, read_only=True, check_same_thread=False
+            )
+            self._local.connection = connection
+            self._local.cursor = connection.cursor()
+            with self._lock:
+                self._connections.append(connection)
+        return connection
+
+    @property  # type: ignore[override]
+    def _cursor(self) -> Cursor:
+        """Get the cursor of the current thread.
+
+        Returns
+        -------
+        Cursor
+            The cursor of the current thread.
+        """
+        _ = self._connection
+        return self._local.cursor
+
+    async def execute_sql_async(
+        self,
+        sql: str,
+        use_pandas: Optional[bool] = False,
+        parameters: Sequence[Any] = (),
+    ) -> Union[pd.DataFrame, List[Tuple[Any, ...]]]:
+        """Execute a given SQL command in the pool's executor without blocking the event loop.
+
+        Parameters
+        ----------
+        sql : str
+            SQL String to excute.
+        use_pandas : bool
+            If True, return the query result as a pandas DataFrame. (Default value = False).
+        parameters : Sequence[Any]
+            The values of the placeholders in the SQL string. (Default value = ()).
+
+        Returns
+        -------
+        Union[pd.DataFrame, List[Tuple[Any, ...]]]
+            Returns either the fetched rows or a pandas DataFrame with the result
+            of the executed SQL query.
+
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor,
+            functools.partial(
+                self._fetch_sql, sql=sql, use_pandas=use_pandas, parameters=parameters
+            ),
+        )
+
+    def _fetch_sql(
+        self,
+        sql: str,
+        use_pandas: Optional[bool] = False,
+        parameters: Sequence[Any] = (),
+    ) -> Union[pd.DataFrame, List[Tuple[Any, ...]]]:
+        """Execute a given SQL command and fetch all the rows on the calling thread.
+
+        Parameters
+        ----------
+        sql : str
+            SQL String to excute.
+        use_pandas : bool
+            If True, return the query result as a pandas DataFrame. (Default value = False).
+        parameters : Sequence[Any]
+            The values of the placeholders in the SQL string. (Default value = ()).
+
+        Returns
+        -------
+        Union[pd.DataFrame, List[Tuple[Any, ...]]]
+            Returns either the fetched rows or a pandas DataFrame.
+
+        """
+        if use_pandas:
+            return self.execute_sql(sql=sql, use_pandas=True, parameters=parameters)
+        return self.execute_sql(sql=sql, parameters=parameters).fetchall()
+
+    def close(self) -> None:
+        """Close and remove the tmp file and all the connections of the pool."""
+        self._executor.shutdown(wait=True)
+        with self._lock:
+            for connection in self._connections:
+                connection.close()
+            self._connections.clear()
+        if self._tmp:
+            self._tmp.close()
+
+
+class ElibParquet:
+    """Serve the summary queries of an Elib from Parquet datasets written by Elib.to_parquet."""
+
+    def __init__(self, directory: Union[Path, str]):
+        """Initialize a new reader for the Parquet datasets in a directory.
+
+        Parameters
+        ----------
+        directory : Union[Path, str]
+            The directory passed to Elib.to_parquet.
+        """
+        self._directory = Path(directory)
+        self._datasets: Dict[str, ds.Dataset] = {}
+
+    def dataset(self, table: str) -> ds.Dataset:
+        """Get the Parquet dataset of a table.
+
+        Parameters
+        ----------
+        table : str
+            The name of the table.
+
+        Returns
+        -------
+        ds.Dataset
+            The dataset of the table.
+
+        """
+        if table not in self._datasets:
+            self._datasets[table] = ds.dataset(
+                self._directory.joinpath(table), format="parquet", partitioning="hive"
+            )
+        return self._datasets[table]
+
+    def read_table(
+        self,
+        table: str,
+        columns: Optional[List[str]] = None,
+        filter: Optional[ds.Expression] = None,
+    ) -> pa.Table:
+        """Read the given columns of the rows of a table that match a filter.
+
+        Only the requested columns are read and the filter is pushed down to skip
+        partitions and row groups whose statistics don't match.
+
+        Parameters
+        ----------
+        table : str
+            The name of the table.
+        columns : Optional[List[str]], optional
+            The columns to read, all when None. (Default value = None).
+        filter : Optional[ds.Expression], optional
+            An expression to filter the rows by. (Default value = None).
+
+        Returns
+        -------
+        pa.Table
+            The matching rows.
+
+        """
+        return self.dataset(table).to_table(columns=columns, filter=filter)
+
+    def count_distinct(
+        self, table: str, column: str, filter: Optional[ds.Expression] = None
+    ) -> int:
+        """Count the distinct non-null values of a column.
+
+        Parameters
+        ----------
+        table : str
+            The name of the table.
+        column : str
+            The column to count the distinct values of.
+        filter : Optional[ds.Expression], optional
+            An expression to filter the rows by. (Default value = None).
+
+        Returns
+        -------
+        int
+            The number of distinct values.
+
+        """
+        valid = ds.field(column).is_valid()
+        filter = valid if filter is None else filter & valid
+        values = self.read_table(table, columns=[column], filter=filter).column(column)
+        return len(values.unique())
+
+    def get_summary(
+        self, q_value_threshold: float = 0.01, source_file: Optional[str] = None
+    ) -> Dict[str, int]:
+        """Summarize the target, decoy and q-value filtered peptides and proteins.
+
+        Parameters
+        ----------
+        q_value_threshold : float
+            The maximum q-value of the peptides and proteins in peptidescores and
+            proteinscores to count as detected. (Default value = 0.01).
+        source_file : Optional[str], optional
+            Only count the q-value filtered peptides and proteins of this
+            SourceFile. (Default value = None).
+
+        Returns
+        -------
+        Dict[str, int]
+            The same summary as Elib.get_summary.
+
+        """
+        # Decoy flags are exported as booleans.
+        target = ~ds.field("isDecoy")
+        decoy = ds.field("isDecoy")
+        filtered = ~ds.field("IsDecoy") & (ds.field("QValue") <= q_value_threshold)
+        if source_file:
+            filtered = filtered & (ds.field("SourceFile") == source_file)
+        return {
+            "Unique Proteins": self.count_distinct(
+                "peptidetoprotein", "ProteinAccession", filter=target
+            ),
+            "Unique Peptides": self.count_distinct(
+                "peptidetoprotein", "PeptideSeq", filter=target
+            ),
+            "Decoy Proteins": self.count_distinct(
+                "peptidetoprotein", "ProteinAccession", filter=decoy
+            ),
+            "Decoy Peptides": self.count_distinct(
+                "peptidetoprotein", "PeptideSeq", filter=decoy
+            ),
+            "Filtered Proteins": self.count_distinct(
+                "proteinscores", "ProteinAccession", filter=filtered
+            ),
+            "Filtered Peptides": self.count_distinct(
+                "peptidescores", "PeptideSeq", filter=filtered
+            ),
+        }
+
+
+class ElibCollection:
+    """Run the same query over many .elib files attached to a single SQLite connection."""
+
+    def __init__(
+        self,
+        filenames: Sequence[Union[Path, str]],
+        sample_names: Optional[Sequence[str]] = None,
+        tables: Sequence[str] = ELIB_TABLES,
+    ):
+        """Initialize a new collection of local elib files.
+
+        Parameters
+        ----------
+        filenames : Sequence[Union[Path, str]]
+            The paths to the elib files.
+        sample_names : Optional[Sequence[str]], optional
+            The name of the sample of each file, by default the file name without
+            its extensions.
+        tables : Sequence[str], optional
+            The names of the tables that queries may refer to, by default ELIB_TABLES.
+        """
+        self._filenames = [Path(filename) for filename in filenames]
+        if sample_names is None:
+            sample_names = [
+                filename.with_suffix("").stem for filename in self._filenames
+            ]
+        self._sample_names = list(sample_names)
+        self._tables = list(tables)
+        # uri=True lets ATTACH open the files with read-only URIs.
+        self._connection = sqlite3.connect(":memory:", uri=True)
+        # SQLite can only attach a limited number of databases at once (10 by default).
+        self._max_attached = MAX_ATTACHED
+        if hasattr(self._connection, "getlimit"):
+            self._max_attached = self._connection.getlimit(
+                sqlite3.SQLITE_LIMIT_ATTACHED
+            )
+
+    def __enter__(self) -> "ElibCollection":
+        """Enter the runtime context, returning this collection.
+
+        Returns
+        -------
+        ElibCollection
+            This collection.
+        """
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        """Close the connection when leaving the runtime context.
+
+        Parameters
+        ----------
+        exc_info : Any
+            The exception raised within the context, if any.
+        """
+        self.close()
+
+    def execute_sql(
+        self,
+        sql: str,
+        chunksize: Optional[int] = None,
+        parameters: Sequence[Any] = (),
+    ) -> Iterator[pd.DataFrame]:
+        """Execute a given SQL command on every file and stream the combined result.
+
+        The files are attached in batches. For every batch, the query is run once as
+        a UNION ALL of the query on each attached file, with a leading 'Sample'
+        column. Each part is planned on its own file, so it still uses that
+        file's indexes and aggregates per sample.
+
+        Parameters
+        ----------
+        sql : str
+            SQL String to excute as on a single file, referring to the tables with
+            format fields, e.g. "SELECT * FROM {peptidetoprotein}". Literal braces
+            must be doubled.
+        chunksize : Optional[int], optional
+            The maximum number of rows per DataFrame, by default one DataFrame per batch.
+        parameters : Sequence[Any], optional
+            The values of the placeholders in the SQL string, by default ().
+
+        Yields
+        ------
+        pd.DataFrame
+            The next part of the query result.
+
+        Raises
+        ------
+        ValueError
+            If the SQL string has a format field that isn't one of the tables.
+
+        """
+        sql = sql.strip().rstrip(";")
+        try:
+            sql.format_map({table: table for table in self._tables})
+        except (KeyError, IndexError, ValueError) as error:
+            raise ValueError(
+                f"Invalid table field {error} in the SQL string. Needs to be one of "
+                f"{self._tables}."
+            ) from error
+
+        files = list(zip(self._sample_names, self._filenames))
+        for start in range(0, len(files), self._max_attached):
+            batch = files[start : start + self._max_attached]
+            n_attached = 0
+            try:
+                for i, (_, filename) in enumerate(batch):
+                    uri = f"{filename.resolve().as_uri()}?mode=ro&immutable=1"
+                    self._connection.execute(f"ATTACH DATABASE ? AS elib{i};", (uri,))
+                    n_attached += 1
+                union_sql = " UNION ALL ".join(
+                    "SELECT {} AS Sample, * FROM ({})".format(
+                        _quote(sample_name),
+                        sql.format_map(
+                            {table: f"elib{i}.{table}" for table in self._tables}
+                        ),
+                    )
+                    for i, (sample_name, _) in enumerate(batch)
+                )
+                # Positional placeholders repeat once per file.
+                if isinstance(parameters, dict):
+                    union_parameters = parameters
+                else:
+                    union_parameters = list(parameters) * len(batch)
+                if chunksize:
+                    yield from pd.read_sql_query(
+                        sql=union_sql,
+                        con=self._connection,
+                        params=union_parameters,
+                        chunksize=chunksize,
+                    )
+                else:
+                    yield pd.read_sql_query(
+                        sql=union_sql, con=self._connection, params=union_parameters
+                    )
+            finally:
+                for i in range(n_attached):
+                    self._connection.execute(f"DETACH DATABASE elib{i};")
+
+    def close(self) -> None:
+        """Close the connection."""
+        self._connection.close()
+
+
 def get_unique_peptide_proteins(
-    elib_filename: Union[Path, str], bucket: Optional[str] = None
+    elib_filename: Union[Path, str],
+    bucket: Optional[str] = None,
+    cache: Optional[S3Cache] = None,
 ) -> Dict[str, Union[int, str]]:
     """Get the number of unique peptides and proteins in the given elib file.
 
@@ -79,23 +829,69 @@ def get_unique_peptide_proteins(
         The path to the elib file.
     bucket : Optional[str], optional
         The name of the bucket to use. (Default value = None)
+    cache : Optional[S3Cache], optional
+        A cache for files loaded from S3. (Default value = None)
 
     Returns
     -------
     Dict[str, Union[int, str]]
         A dictionary containing the sample name, number of unique peptides and proteins.
     """
-    elib_conn = Elib(key_or_filename=elib_filename, bucket=bucket)
-    peptide_to_protein = elib_conn.execute_sql(
-        sql="SELECT PeptideSeq, ProteinAccession FROM peptidetoprotein WHERE isDecoy == 0;",
-        use_pandas=True,
-    )
+    elib_conn = Elib(key_or_filename=elib_filename, bucket=bucket, cache=cache)
+    try:
+        unique_proteins = elib_conn.count_distinct(
+            "peptidetoprotein", "ProteinAccession", where="isDecoy == 0"
+        )
+        unique_peptides = elib_conn.count_distinct(
+            "peptidetoprotein", "PeptideSeq", where="isDecoy == 0"
+        )
+    finally:
+        elib_conn.close()
     sample_name = Path(elib_filename).with_suffix("").stem
-    unique_proteins = peptide_to_protein["ProteinAccession"].nunique()
-    unique_peptides = peptide_to_protein["PeptideSeq"].nunique()
-    elib_conn.close()
     return {
         "Sample Name": sample_name,
         "Unique Proteins": unique_proteins,
         "Unique Peptides": unique_peptides,
     }
+
+
+def get_unique_peptide_proteins_batch(
+    elib_filenames: Iterable[Union[Path, str]],
+    bucket: Optional[str] = None,
+    cache: Optional[S3Cache] = None,
+    max_workers: Optional[int] = None,
+    use_processes: Optional[bool] = False,
+) -> pd.DataFrame:
+    """Get the number of unique peptides and proteins for many elib files in parallel.
+
+    Each worker downloads (when a bucket is given) and queries one file at a time,
+    so downloads and queries of different files overlap.
+
+    Parameters
+    ----------
+    elib_filenames : Iterable[Union[Path, str]]
+        The paths to the elib files or their keys in S3 (when bucket is given).
+    bucket : Optional[str], optional
+        The name of the bucket to use. (Default value = None)
+    cache : Optional[S3Cache], optional
+        A cache for files loaded from S3. (Default value = None)
+    max_workers : Optional[int], optional
+        The number of workers to use. Uses the executor default when None. (Default value = None)
+    use_processes : Optional[bool], optional
+        If True, use a process pool instead of a thread pool. (Default value = False)
+
+    Returns
+    -------
+    pd.DataFrame
+        A DataFrame with one row per elib file containing the sample name,
+        number of unique peptides and proteins.
+    """
+    executor_class = ProcessPoolExecutor if use_processes else ThreadPoolExecutor
+    summarize = functools.partial(
+        get_unique_peptide_proteins, bucket=bucket, cache=cache
+    )
+    with executor_class(max_workers=max_workers) as executor:
+        summaries = list(executor.map(summarize, elib_filenames))
+    return pd.DataFrame(
+        summaries, columns=["Sample Name", "Unique Proteins", "Unique Peptides"]
+    )
@@ -1,7 +1,90 @@
 """src/talus_utils/uniprot.py module."""
-from typing import Tuple
+import csv
+import functools
+import gzip
+import mmap
+import sys
 
+from pathlib import Path
+from typing import (
+    IO,
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
 
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+
+
+T = TypeVar("T")
+
+# The number of distinct headers each parse function remembers.
+HEADER_CACHE_SIZE = 2 ** 16
+FAI_COLUMNS = ["name", "length", "offset", "line_bases", "line_width"]
+FASTA_HEADER_COLUMNS = ["db", "accession", "entry_name", "protein", "species", "valid"]
+# Each field is non-empty, like the splits of parse_fasta_header_uniprot_entry.
+FASTA_HEADER_PATTERN = r"^(?P<db>[^|]+)\|(?P<accession>[^|]+)\|(?P<entry_name>[^|]+)$"
+ENTRY_NAME_PATTERN = r"^(?P<protein>[^_]+)_(?P<species>[^_]+)$"
+
+
+def _intern(value: T) -> T:
+    """Intern a string or the strings of a tuple, leaving other values as they are.
+
+    Parameters
+    ----------
+    value : T
+        The value to intern.
+
+    Returns
+    -------
+    T
+        The value, with its strings interned.
+    """
+    if isinstance(value, str):
+        return sys.intern(value)  # type: ignore[return-value]
+    if isinstance(value, tuple):
+        return tuple(_intern(item) for item in value)  # type: ignore[return-value]
+    return value
+
+
+def _header_cache(func: Callable[[str], T]) -> Callable[[str], T]:
+    """Memoize a header parse function in a bounded LRU cache, interning its results.
+
+    Headers repeat for every peptide of a protein, so the cache skips parsing them
+    again and interning shares a single copy of each db, accession, protein and
+    species string among all the parsed headers.
+
+    Parameters
+    ----------
+    func : Callable[[str], T]
+        The header parse function.
+
+    Returns
+    -------
+    Callable[[str], T]
+        The cached function, with the cache_info and cache_clear methods of
+        functools.lru_cache.
+    """
+
+    @functools.lru_cache(maxsize=HEADER_CACHE_SIZE)
+    @functools.wraps(func)
+    def wrapped_func(fasta_header: str) -> T:
+        return _intern(func(fasta_header))
+
+    return wrapped_func
+
+
+@_header_cache
 def parse_fasta_header(fasta_header: str) -> Tuple[str, str, str]:
     """Parse a fasta header with the following format: db|UniqueIdentifier|EntryName.
     https://www.uniprot.org/help/fasta-headers
@@ -30,6 +113,7 @@ def parse_fasta_header(fasta_header: str) -> Tuple[str, str, str]:
     return db, unique_identifier, entry_name
 
 
+@_header_cache
 def parse_fasta_header_uniprot_entry(fasta_header: str) -> Tuple[str, str]:
     """Extract the Protein and Species name from a fasta header in the format: db|UniqueIdentifier|EntryName.
     The EntryName field has the format ProteinName_SpeciesName according to
@@ -60,6 +144,7 @@ def parse_fasta_header_uniprot_entry(fasta_header: str) -> Tuple[str, str]:
     return protein_name, species_name
 
 
+@_header_cache
 def parse_fasta_header_uniprot_protein(fasta_header: str) -> str:
     """Extract the Protein name from a fasta header in the format: db|UniqueIdentifier|EntryName.
     The EntryName field has the format ProteinName_SpeciesName according to
@@ -78,3 +163,399 @@ def parse_fasta_header_uniprot_protein(fasta_header: str) -> str:
     """
     protein_name, _ = parse_fasta_header_uniprot_entry(fasta_header=fasta_header)
     return protein_name
+
+
+HEADER_PARSERS = [
+    parse_fasta_header,
+    parse_fasta_header_uniprot_entry,
+    parse_fasta_header_uniprot_protein,
+]
+
+
+def header_cache_info() -> Dict[str, Any]:
+    """Return the cache statistics of the header parse functions.
+
+    Returns
+    -------
+    Dict[str, Any]
+        The functools.lru_cache CacheInfo (hits, misses, maxsize, currsize) of
+        every header parse function, by function name.
+    """
+    return {
+        func.__name__: func.cache_info()  # type: ignore[attr-defined]
+        for func in HEADER_PARSERS
+    }
+
+
+def header_cache_clear() -> None:
+    """Empty the caches of the header parse functions."""
+    for func in HEADER_PARSERS:
+        func.cache_clear()  # type: ignore[attr-defined]
+
+
+def parse_fasta_header_series(
+    headers: pd.Series,
+    parse_func: Callable[[str], Any] = parse_fasta_header_uniprot_protein,
+) -> pd.Series:
+    """Parse a Series of fasta headers, parsing every distinct header only once.
+
+    The headers are factorized and parse_func is only called on the unique ones, so
+    the work scales with the number of proteins rather than with the number of rows.
+
+    Parameters
+    ----------
+    headers : pd.Series
+        The fasta headers.
+    parse_func : Callable[[str], Any]
+        The function parsing a single header. (Default value = parse_fasta_header_uniprot_protein).
+
+    Returns
+    -------
+    pd.Series
+        The parsed headers, with the index and name of headers. Missing headers stay missing.
+
+    Raises
+    ------
+    ValueError
+        If parse_func raises a ValueError on any of the headers.
+
+    Examples
+    --------
+    >>> parse_fasta_header_series(pd.Series(["sp|P04637|P53_HUMAN"] * 2))
+    0    P53
+    1    P53
+    dtype: object
+    """
+    codes, uniques = pd.factorize(headers)
+    # Fill element-wise so that tuple results aren't unpacked into a 2D array.
+    parsed = np.empty(len(uniques) + 1, dtype=object)
+    for i, header in enumerate(uniques):
+        parsed[i] = parse_func(header)
+    # Missing headers have the code -1, which picks this last element.
+    parsed[-1] = np.nan
+    return pd.Series(parsed[codes], index=headers.index, name=headers.name)
+
+
+def parse_fasta_headers(
+    headers: Union[pd.Series, pa.Array, pa.ChunkedArray]
+) -> Union[pd.DataFrame, pa.Table]:
+    """Parse many fasta headers in the format db|UniqueIdentifier|EntryName at once.
+    Vectorized version of parse_fasta_header and parse_fasta_header_uniprot_entry, for
+    columns such as the ProteinAccession of elib tables.
+
+    Parameters
+    ----------
+    headers : Union[pd.Series, pa.Array, pa.ChunkedArray]
+        The fasta headers.
+
+    Returns
+    -------
+    Union[pd.DataFrame, pa.Table]
+        The db, accession, entry_name, protein and species of every header, as a
+        DataFrame with the index of a Series or as a Table for pyarrow arrays. Fields
+        that can't be parsed are null. The valid column is False for the headers
+        on which parse_fasta_header_uniprot_entry raises a ValueError.
+
+    Examples
+    --------
+    >>> parse_fasta_headers(pd.Series(["sp|P04637|P53_HUMAN", "P04637"]))
+         db accession entry_name protein species  valid
+    0    sp    P04637  P53_HUMAN     P53   HUMAN   True
+    1  None      None       None    None    None  False
+    """
+    array = headers
+    if isinstance(headers, pd.Series):
+        array = pa.array(headers, type=pa.string(), from_pandas=True)
+    header_fields = pc.extract_regex(array, pattern=FASTA_HEADER_PATTERN)
+    entry_fields = pc.extract_regex(
+        pc.struct_field(header_fields, [2]), pattern=ENTRY_NAME_PATTERN
+    )
+    columns = [pc.struct_field(header_fields, [i]) for i in range(3)]
+    columns += [pc.struct_field(entry_fields, [i]) for i in range(2)]
+    columns.append(pc.fill_null(pc.is_valid(entry_fields), False))
+    table = pa.table(columns, names=FASTA_HEADER_COLUMNS)
+    if isinstance(headers, pd.Series):
+        return table.to_pandas().set_index(headers.index)
+    return table
+
+
+class FastaRecord(NamedTuple):
+    """A FASTA entry: the fields of its header and its sequence.
+
+    Headers that don't follow the UniProt format db|UniqueIdentifier|EntryName have
+    their identifier as accession and empty db and entry_name fields.
+    """
+
+    db: str
+    accession: str
+    entry_name: str
+    description: str
+    sequence: str
+
+
+def _parse_header_line(header: str) -> Tuple[str, str, str, str]:
+    """Split a FASTA header line, without its '>', into its fields.
+
+    Parameters
+    ----------
+    header : str
+        The header line.
+
+    Returns
+    -------
+    Tuple[str, str, str, str]
+        The db, accession, entry name and description of the header.
+    """
+    identifier, _, description = header.strip().partition(" ")
+    try:
+        # Skip the cache, every entry of a FASTA file has a different header.
+        db, accession, entry_name = parse_fasta_header.__wrapped__(identifier)
+    except ValueError:
+        db, accession, entry_name = "", identifier, ""
+    return db, accession, entry_name, description.strip()
+
+
+def _open_fasta(path: Union[str, Path]) -> IO[str]:
+    """Open a FASTA file for reading, decompressing it if its name ends with .gz.
+
+    Parameters
+    ----------
+    path : Union[str, Path]
+        The FASTA file.
+
+    Returns
+    -------
+    IO[str]
+        The text file.
+    """
+    if str(path).endswith(".gz"):
+        return gzip.open(path, "rt")
+    return open(path)
+
+
+def read_fasta(path: Union[str, Path]) -> Iterator[FastaRecord]:
+    """Read the entries of a FASTA file one at a time.
+
+    Only the current entry is held in memory, so whole proteomes can be streamed.
+
+    Parameters
+    ----------
+    path : Union[str, Path]
+        The FASTA file, optionally gzip compressed.
+
+    Yields
+    ------
+    FastaRecord
+        The entries of the file, in order.
+    """
+    header: Optional[str] = None
+    lines: List[str] = []
+    with _open_fasta(path) as fasta_file:
+        for line in fasta_file:
+            if line.startswith(">"):
+                if header is not None:
+                    yield FastaRecord(*_parse_header_line(header), "".join(lines))
+                header = line[1:]
+                lines = []
+            elif header is not None:
+                lines.append(line.strip())
+    if header is not None:
+        yield FastaRecord(*_parse_header_line(header), "".join(lines))
+
+
+def index_fasta(
+    path: Union[str, Path], index_path: Optional[Union[str, Path]] = None
+) -> Path:
+    """Write a samtools-compatible .fai index of a FASTA file.
+
+    Every line of the index holds the identifier of an entry, the length of its
+    sequence, the byte offset of the sequence and the number of bases and bytes per
+    line, which lets IndexedFasta read any entry without scanning the file.
+
+    Parameters
+    ----------
+    path : Union[str, Path]
+        The uncompressed FASTA file.
+    index_path : Optional[Union[str, Path]]
+        The index to write. Defaults to the FASTA file name with .fai appended. (Default value = None).
+
+    Returns
+    -------
+    Path
+        The path of the index.
+
+    Raises
+    ------
+    ValueError
+        If the sequence lines of an entry, except its last one, have different lengths.
+    """
+    index_path = Path(index_path or f"{path}.fai")
+    with open(path, "rb") as fasta_file, open(index_path, "w") as index_file:
+        if not fasta_file.seek(0, 2):
+            return index_path
+        with mmap.mmap(fasta_file.fileno(), 0, access=mmap.ACCESS_READ) as fasta:
+            size = len(fasta)
+            start = 0 if fasta[:1] == b">" else fasta.find(b"\n>") + 1 or size
+            # Jump from header to header, sequences are only split into lines.
+            while start < size:
+                header_end = fasta.find(b"\n", start)
+                header_end = size if header_end == -1 else header_end
+                name = fasta[start + 1 : header_end].split(maxsplit=1)[0].decode()
+                offset = header_end + 1
+                end = fasta.find(b"\n>", header_end)
+                end = size if end == -1 else end + 1
+
+                lines = fasta[offset:end].rstrip(b"\r\n").split(b"\n")
+                line_width = len(lines[0]) + 1
+                line_bases = len(lines[0].rstrip(b"\r"))
+                # Only the last line may be shorter than the others.
+                if any(len(line) + 1 != line_width for line in lines[:-1]) or (
+                    len(lines[-1]) > line_bases
+                ):
+                    raise ValueError(
+                        f"Entry '{name}' has sequence lines of different lengths."
+                    )
+                length = sum(len(line) for line in lines)
+                # Windows line endings add a carriage return to every full line.
+                length -= (len(lines) - 1) * (line_width - 1 - line_bases)
+                index_file.write(
+                    f"{name}\t{length}\t{offset}\t{line_bases}\t{line_width}\n"
+                )
+                start = end
+    return index_path
+
+
+class IndexedFasta:
+    """Random access to the entries of a FASTA file through its .fai index.
+
+    The file is memory mapped, so looking up an entry by accession or identifier
+    only reads its header and sequence.
+
+    Examples
+    --------
+    >>> import tempfile
+    >>> path = Path(tempfile.mkdtemp(), "proteins.fasta")
+    >>> _ = path.write_text(">sp|P04637|P53_HUMAN Cellular tumor antigen p53\\nMEEPQSDPSV\\n")
+    >>> with IndexedFasta(path) as fasta:
+    ...     record = fasta["P04637"]
+    >>> record.sequence
+    'MEEPQSDPSV'
+    """
+
+    def __init__(
+        self, path: Union[str, Path], index_path: Optional[Union[str, Path]] = None
+    ) -> None:
+        """Open an indexed FASTA file, writing its index with index_fasta if needed.
+
+        Parameters
+        ----------
+        path : Union[str, Path]
+            The uncompressed FASTA file.
+        index_path : Optional[Union[str, Path]]
+            The .fai index. Defaults to the FASTA file name with .fai appended. (Default value = None).
+        """
+        index_path = Path(index_path or f"{path}.fai")
+        if not index_path.exists():
+            index_fasta(path, index_path)
+        index = pd.read_csv(
+            index_path,
+            sep="\t",
+            header=None,
+            names=FAI_COLUMNS,
+            dtype={"name": str},
+            quoting=csv.QUOTE_NONE,
+        )
+        self._entries = index[FAI_COLUMNS[1:]].to_numpy(dtype=np.int64)
+        # UniProt identifiers are db|accession|entry_name, look up both.
+        accessions = index["name"].str.extract(r"^[^|]*\|([^|]*)", expand=False)
+        self.names = pd.Index(index["name"])
+        self.accessions = pd.Index(accessions.fillna(index["name"]))
+
+        self._file = open(path, "rb")
+        self._mmap = (
+            mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            if len(self.names)
+            else b""
+        )
+
+    def __len__(self) -> int:
+        """Return the number of entries."""
+        return len(self.names)
+
+    def __contains__(self, key: object) -> bool:
+        """Check whether an accession or identifier is in the index."""
+        return key in self.accessions or key in self.names
+
+    def _locate(self, key: str) -> int:
+        """Return the position of an accession or identifier in the index.
+
+        Raises
+        ------
+        KeyError
+            If key isn't in the index.
+        """
+        index = self.accessions if key in self.accessions else self.names
+        position = index.get_loc(key)
+        if not isinstance(position, (int, np.integer)):
+            raise KeyError(f"'{key}' matches several entries.")
+        return int(position)
+
+    def fetch(self, key: str, start: int = 0, end: Optional[int] = None) -> str:
+        """Read a subsequence of an entry.
+
+        Parameters
+        ----------
+        key : str
+            The accession or identifier of the entry.
+        start : int
+            The 0-based start of the subsequence. (Default value = 0).
+        end : Optional[int]
+            The 0-based exclusive end of the subsequence. Defaults to the end of the sequence. (Default value = None).
+
+        Returns
+        -------
+        str
+            The subsequence.
+        """
+        length, offset, line_bases, line_width = self._entries[self._locate(key)]
+        start = min(max(start, 0), length)
+        end = length if end is None else min(max(end, start), length)
+        if start == end:
+            return ""
+        # Line arithmetic gives the byte span of the subsequence directly.
+        first = offset + start // line_bases * line_width + start % line_bases
+        last = offset + (end - 1) // line_bases * line_width + (end - 1) % line_bases
+        raw = self._mmap[first : last + 1]
+        return raw.replace(b"\n", b"").replace(b"\r", b"").decode()
+
+    def __getitem__(self, key: str) -> FastaRecord:
+        """Read an entry.
+
+        Parameters
+        ----------
+        key : str
+            The accession or identifier of the entry.
+
+        Returns
+        -------
+        FastaRecord
+            The entry.
+        """
+        offset = self._entries[self._locate(key)][1]
+        header_start = self._mmap.rfind(b">", 0, offset)
+        header = self._mmap[header_start + 1 : offset].decode()
+        return FastaRecord(*_parse_header_line(header), self.fetch(key))
+
+    def close(self) -> None:
+        """Close the FASTA file."""
+        if isinstance(self._mmap, mmap.mmap):
+            self._mmap.close()
+        self._file.close()
+
+    def __enter__(self) -> "IndexedFasta":
+        """Return the IndexedFasta itself."""
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        """Close the FASTA file."""
+        self.close()
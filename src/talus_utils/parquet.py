@@ -0,0 +1,666 @@
+"""src/talus_utils/parquet.py module."""
+
+import functools
+
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Tuple, Union
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+from . import arrow
+from .constants import (
+    COLUMN_NORMALIZATIONS,
+    MEDIAN_NORMALIZATIONS,
+    MINMAX_NORMALIZATIONS,
+    QUANTILE_NORMALIZATIONS,
+    ROW_NORMALIZATIONS,
+)
+
+
+DEFAULT_BATCH_SIZE = 65536
+HISTOGRAM_BINS = 2 ** 16
+# The number of bits of the values narrowed down by every pass of _medians, and the
+# number of values it keeps in memory to select the median from.
+MEDIAN_RADIX_BITS = 16
+MEDIAN_CANDIDATES = 2 ** 20
+
+
+class ParquetFrame:
+    """A Parquet file or dataset that is processed out of core, batch by batch.
+
+    Transformations are recorded and applied to every batch while it is read, so
+    the whole table never has to fit in memory. Use write to stream the result to
+    a new Parquet file.
+
+    Examples
+    --------
+    >>> import tempfile
+    >>> from talus_utils import dataframe
+    >>> path = Path(tempfile.mkdtemp(), "quant.parquet")
+    >>> pd.DataFrame({"s1": [1.0, 2.0, 4.0], "s2": [3.0, 5.0, 7.0]}).to_parquet(path)
+    >>> @dataframe.log_scaling()
+    ... @dataframe.normalize(how="median")
+    ... def analyze(df):
+    ...     return df.write(path.with_name("normalized.parquet"))
+    >>> normalized = analyze(ParquetFrame(path))
+    """
+
+    def __init__(
+        self,
+        source: Union[str, Path, ds.Dataset],
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> None:
+        """Initialize a ParquetFrame.
+
+        Parameters
+        ----------
+        source : Union[str, Path, ds.Dataset]
+            A Parquet file, a directory of Parquet files or a pyarrow dataset.
+        batch_size : int
+            The maximum number of rows to read at once. (Default value = DEFAULT_BATCH_SIZE).
+        """
+        if isinstance(source, ds.Dataset):
+            self.dataset = source
+        else:
+            self.dataset = ds.dataset(str(source), format="parquet")
+        self.batch_size = batch_size
+        self._funcs: Tuple[Callable[[pa.Table], pa.Table], ...] = ()
+
+    def map_batches(self, func: Callable[[pa.Table], pa.Table]) -> "ParquetFrame":
+        """Record a transformation to apply to every batch.
+
+        Parameters
+        ----------
+        func : Callable[[pa.Table], pa.Table]
+            The transformation, which must only depend on the rows of its batch.
+
+        Returns
+        -------
+        ParquetFrame
+            A new ParquetFrame with the transformation.
+        """
+        frame = ParquetFrame(self.dataset, batch_size=self.batch_size)
+        frame._funcs = self._funcs + (func,)
+        return frame
+
+    def _transform(self, table: pa.Table) -> pa.Table:
+        """Apply the recorded transformations to a batch.
+
+        Parameters
+        ----------
+        table : pa.Table
+            The batch.
+
+        Returns
+        -------
+        pa.Table
+            The transformed batch.
+        """
+        return functools.reduce(lambda acc, func: func(acc), self._funcs, table)
+
+    @property
+    def schema(self) -> pa.Schema:
+        """pa.Schema: The schema of the transformed batches."""
+        return self._transform(self.dataset.schema.empty_table()).schema
+
+    def iter_tables(self) -> Iterator[pa.Table]:
+        """Read the transformed batches one by one.
+
+        Yields
+        ------
+        pa.Table
+            The transformed batches.
+        """
+        for batch in self._read_batches():
+            yield self._transform(pa.Table.from_batches([batch]))
+
+    def _read_batches(self) -> Iterator[pa.RecordBatch]:
+        """Read the batches of the dataset one row group at a time.
+
+        The dataset scanner reads ahead many batches, so files are read with
+        pq.ParquetFile unless their fragments hold columns that aren't in the files,
+        e.g. hive partitions.
+
+        Yields
+        ------
+        pa.RecordBatch
+            The batches.
+        """
+        schema = self.dataset.schema
+        for fragment in self.dataset.get_fragments():
+            if not isinstance(fragment, ds.ParquetFileFragment) or not all(
+                name in fragment.physical_schema.names for name in schema.names
+            ):
+                yield from fragment.to_batches(
+                    schema=schema, batch_size=self.batch_size
+                )
+                continue
+            with self.dataset.filesystem.open_input_file(fragment.path) as source:
+                for batch in pq.ParquetFile(source).iter_batches(
+                    batch_size=self.batch_size, columns=schema.names
+                ):
+                    yield pa.RecordBatch.from_arrays(batch.columns, schema=schema)
+
+    def to_table(self) -> pa.Table:
+        """Read the whole transformed table into memory.
+
+        Returns
+        -------
+        pa.Table
+            The transformed table.
+        """
+        tables = list(self.iter_tables())
+        if not tables:
+            return self.schema.empty_table()
+        return pa.concat_tables([table.cast(tables[0].schema) for table in tables])
+
+    def to_pandas(self) -> pd.DataFrame:
+        """Read the whole transformed table into a pandas DataFrame.
+
+        Returns
+        -------
+        pd.DataFrame
+            The transformed table.
+        """
+        return self.to_table().to_pandas()
+
+    def write(self, path: Union[str, Path]) -> "ParquetFrame":
+        """Stream the transformed batches to a Parquet file.
+
+        Parameters
+        ----------
+        path : Union[str, Path]
+            The Parquet file to write.
+
+        Returns
+        -------
+        ParquetFrame
+            A ParquetFrame reading the written file.
+        """
+        writer = None
+        try:
+            for table in self.iter_tables():
+                if writer is None:
+                    writer = pq.ParquetWriter(str(path), table.schema)
+                # Batches can disagree on types, e.g. when all their values are null.
+                writer.write_table(table.cast(writer.schema))
+            if writer is None:
+                writer = pq.ParquetWriter(str(path), self.schema)
+        finally:
+            if writer is not None:
+                writer.close()
+        return ParquetFrame(path, batch_size=self.batch_size)
+
+
+def _numeric_columns(frame: ParquetFrame) -> List[str]:
+    """Return the names of the numeric columns of a ParquetFrame.
+
+    Parameters
+    ----------
+    frame : ParquetFrame
+        The input frame.
+
+    Returns
+    -------
+    List[str]
+        The names of the integer and floating point columns.
+    """
+    return arrow._numeric_columns(frame.schema.empty_table())
+
+
+def _values(table: pa.Table, name: str) -> np.ndarray:
+    """Return the values of a column of a batch that aren't null or NaN as a float64 array.
+
+    Parameters
+    ----------
+    table : pa.Table
+        The batch.
+    name : str
+        The column.
+
+    Returns
+    -------
+    np.ndarray
+        The values.
+    """
+    values = pc.drop_null(pc.cast(table[name], pa.float64())).to_numpy()
+    return values[~np.isnan(values)]
+
+
+def _column_stats(frame: ParquetFrame, names: List[str]) -> Dict[str, Dict[str, float]]:
+    """Compute the count, sum, min and max of numeric columns in a single pass.
+
+    Parameters
+    ----------
+    frame : ParquetFrame
+        The input frame.
+    names : List[str]
+        The numeric columns.
+
+    Returns
+    -------
+    Dict[str, Dict[str, float]]
+        The statistics of every column, by column name and statistic name.
+    """
+    stats = {
+        name: {"count": 0, "sum": 0.0, "min": np.inf, "max": -np.inf} for name in names
+    }
+    for table in frame.iter_tables():
+        for name in names:
+            values = _values(table, name)
+            if not len(values):
+                continue
+            stats[name]["count"] += len(values)
+            stats[name]["sum"] += values.sum()
+            stats[name]["min"] = min(stats[name]["min"], values.min())
+            stats[name]["max"] = max(stats[name]["max"], values.max())
+    return stats
+
+
+def _bin_indices(values: np.ndarray, stats: Dict[str, float]) -> np.ndarray:
+    """Return the histogram bin of every value of a column.
+
+    Parameters
+    ----------
+    values : np.ndarray
+        The values.
+    stats : Dict[str, float]
+        The statistics of the column from _column_stats.
+
+    Returns
+    -------
+    np.ndarray
+        The bin indices, between 0 and HISTOGRAM_BINS - 1.
+    """
+    width = stats["max"] - stats["min"]
+    scale = HISTOGRAM_BINS / width if width > 0 else 0.0
+    indices = ((values - stats["min"]) * scale).astype(np.intp)
+    return np.minimum(indices, HISTOGRAM_BINS - 1)
+
+
+def _histograms(
+    frame: ParquetFrame, stats: Dict[str, Dict[str, float]]
+) -> Dict[str, np.ndarray]:
+    """Count the values of numeric columns in HISTOGRAM_BINS bins between their min and max.
+
+    Parameters
+    ----------
+    frame : ParquetFrame
+        The input frame.
+    stats : Dict[str, Dict[str, float]]
+        The statistics of the columns from _column_stats.
+
+    Returns
+    -------
+    Dict[str, np.ndarray]
+        The counts of every column.
+    """
+    counts = {name: np.zeros(HISTOGRAM_BINS, dtype=np.int64) for name in stats}
+    for table in frame.iter_tables():
+        for name in stats:
+            values = _values(table, name)
+            counts[name] += np.bincount(
+                _bin_indices(values, stats[name]), minlength=HISTOGRAM_BINS
+            )
+    return counts
+
+
+def _sort_keys(values: np.ndarray) -> np.ndarray:
+    """Map float64 values to unsigned integers in the same order.
+
+    Parameters
+    ----------
+    values : np.ndarray
+        The values, without NaN.
+
+    Returns
+    -------
+    np.ndarray
+        The uint64 keys.
+    """
+    bits = values.view(np.uint64)
+    negative = (bits >> np.uint64(63)).astype(bool)
+    return np.where(negative, ~bits, bits | np.uint64(1 << 63))
+
+
+def _from_sort_key(key: int) -> float:
+    """Return the float64 value of a key from _sort_keys.
+
+    Parameters
+    ----------
+    key : int
+        The key.
+
+    Returns
+    -------
+    float
+        The value.
+    """
+    bits = key ^ (1 << 63) if key >> 63 else ~key & (2 ** 64 - 1)
+    return float(np.uint64(bits).view(np.float64))
+
+
+def _radix_pass(
+    frame: ParquetFrame, prefixes: Dict[Tuple[str, int, int], bool]
+) -> Dict[Tuple[str, int, int], Any]:
+    """Count or collect the values of columns whose sort keys start with a prefix.
+
+    Parameters
+    ----------
+    frame : ParquetFrame
+        The input frame.
+    prefixes : Dict[Tuple[str, int, int], bool]
+        Whether to collect the values, by column, number of MEDIAN_RADIX_BITS digits
+        of the prefix and prefix.
+
+    Returns
+    -------
+    Dict[Tuple[str, int, int], Any]
+        The values, or the counts of the next digit of their keys, by prefix.
+    """
+    n_bins = 2 ** MEDIAN_RADIX_BITS
+    results: Dict[Tuple[str, int, int], Any] = {
+        prefix: [] if collect else np.zeros(n_bins, dtype=np.int64)
+        for prefix, collect in prefixes.items()
+    }
+    for table in frame.iter_tables():
+        for name in {name for name, _, _ in prefixes}:
+            values = _values(table, name)
+            keys = _sort_keys(values)
+            for (prefix_name, level, prefix), collect in prefixes.items():
+                if prefix_name != name:
+                    continue
+                shift = 64 - MEDIAN_RADIX_BITS * level
+                selected = np.ones(len(keys), dtype=bool)
+                if level:
+                    selected = keys >> np.uint64(shift) == np.uint64(prefix)
+                if collect:
+                    results[name, level, prefix].append(values[selected])
+                    continue
+                digits = keys[selected] >> np.uint64(shift - MEDIAN_RADIX_BITS)
+                digits &= np.uint64(n_bins - 1)
+                results[name, level, prefix] += np.bincount(
+                    digits.astype(np.intp), minlength=n_bins
+                )
+    return results
+
+
+def _medians(frame: ParquetFrame, names: List[str]) -> Dict[str, float]:
+    """Compute the exact median of numeric columns with bounded memory.
+
+    The values are mapped to integers in the same order, and every pass over the
+    input counts the next MEDIAN_RADIX_BITS bits of the integers that start with
+    the bits already found for the middle values. Once at most MEDIAN_CANDIDATES
+    values are left, a last pass keeps them to select the middle values. Unlike
+    bins between the min and max, this narrows down skewed columns too, in at most
+    64 / MEDIAN_RADIX_BITS passes.
+
+    Parameters
+    ----------
+    frame : ParquetFrame
+        The input frame.
+    names : List[str]
+        The numeric columns.
+
+    Returns
+    -------
+    Dict[str, float]
+        The median of every column, NaN for columns without values.
+    """
+    counts = _radix_pass(frame, {(name, 0, 0): False for name in names})
+    # The middle values searched for, as their column, their rank among the values
+    # whose keys start with prefix, the number of digits of prefix and prefix.
+    searches = []
+    for name in names:
+        n_values = int(counts[name, 0, 0].sum())
+        if not n_values:
+            continue
+        for rank in sorted({(n_values - 1) // 2, n_values // 2}):
+            searches.append((name, rank, 0, 0))
+
+    middle: Dict[str, List[float]] = {name: [] for name in names}
+    n_levels = 64 // MEDIAN_RADIX_BITS
+    while searches:
+        next_searches = []
+        for name, rank, level, prefix in searches:
+            if level == n_levels:
+                # Every value left has the same key.
+                middle[name].append(_from_sort_key(prefix))
+                continue
+            if isinstance(counts[name, level, prefix], list):
+                values = np.concatenate(counts[name, level, prefix])
+                middle[name].append(np.partition(values, rank)[rank])
+                continue
+            digit_counts = counts[name, level, prefix]
+            ends = np.cumsum(digit_counts)
+            digit = int(np.searchsorted(ends, rank, side="right"))
+            rank -= int(ends[digit] - digit_counts[digit])
+            prefix = (prefix << MEDIAN_RADIX_BITS) | digit
+            next_searches.append((name, rank, level + 1, prefix, digit_counts[digit]))
+
+        searches = [search[:4] for search in next_searches]
+        prefixes = {
+            (name, level, prefix): n_values <= MEDIAN_CANDIDATES
+            for name, _, level, prefix, n_values in next_searches
+            if level < n_levels
+        }
+        counts = _radix_pass(frame, prefixes) if prefixes else {}
+
+    return {
+        name: sum(values) / len(values) if values else np.nan
+        for name, values in middle.items()
+    }
+
+
+def _quantile_normalizer(
+    frame: ParquetFrame, names: List[str]
+) -> Callable[[pa.Table], pa.Table]:
+    """Build an approximate quantile normalization from the histograms of the columns.
+
+    Every value is mapped to its approximate quantile within its column, and then to
+    the mean over all columns of the values at that quantile.
+
+    Parameters
+    ----------
+    frame : ParquetFrame
+        The input frame.
+    names : List[str]
+        The numeric columns.
+
+    Returns
+    -------
+    Callable[[pa.Table], pa.Table]
+        The transformation to apply to every batch.
+    """
+    stats = _column_stats(frame, names)
+    stats = {name: column for name, column in stats.items() if column["count"]}
+    counts = _histograms(frame, stats)
+
+    edges = {}
+    cdfs = {}
+    for name, column in stats.items():
+        edges[name] = np.linspace(column["min"], column["max"], HISTOGRAM_BINS + 1)
+        cdfs[name] = np.concatenate([[0.0], np.cumsum(counts[name]) / column["count"]])
+    grid = np.linspace(0.0, 1.0, HISTOGRAM_BINS + 1)
+    reference = np.mean(
+        [np.interp(grid, cdfs[name], edges[name]) for name in stats], axis=0
+    )
+
+    def apply_func(table: pa.Table) -> pa.Table:
+        columns = {}
+        for name in names:
+            values = pc.cast(table[name], pa.float64()).to_numpy()
+            if name in stats:
+                quantiles = np.interp(values, edges[name], cdfs[name])
+                values = np.interp(quantiles, grid, reference)
+            columns[name] = pa.array(values, from_pandas=True)
+        return arrow._replace_columns(table, columns)
+
+    return apply_func
+
+
+def dropna(frame: ParquetFrame, *args: Any, **kwargs: Any) -> ParquetFrame:
+    """Drop the rows or columns of a ParquetFrame with null values.
+
+    Parameters
+    ----------
+    frame : ParquetFrame
+        The input frame.
+    args : Any
+        The arguments to talus_utils.arrow.dropna.
+    kwargs : Any
+        The keyword arguments to talus_utils.arrow.dropna.
+
+    Returns
+    -------
+    ParquetFrame
+        The transformed frame.
+    """
+    axis = kwargs.get("axis", args[0] if args else 0)
+    if axis not in (1, "columns"):
+        return frame.map_batches(lambda table: arrow.dropna(table, *args, **kwargs))
+
+    # Dropping columns depends on all rows, so count the nulls first.
+    names = frame.schema.names
+    null_counts = dict.fromkeys(names, 0)
+    n_rows = 0
+    for table in frame.iter_tables():
+        n_rows += len(table)
+        for name in names:
+            null_counts[name] += table[name].null_count
+    how = kwargs.get("how", args[1] if len(args) > 1 else "any")
+    thresh = kwargs.get("thresh", args[2] if len(args) > 2 else None)
+    if thresh is not None:
+        keep = [name for name in names if n_rows - null_counts[name] >= thresh]
+    elif how == "any":
+        keep = [name for name in names if null_counts[name] == 0]
+    else:
+        keep = [name for name in names if null_counts[name] < n_rows]
+    return frame.map_batches(lambda table: table.select(keep))
+
+
+def explode(frame: ParquetFrame, *args: Any, **kwargs: Any) -> ParquetFrame:
+    """Explode a column of a ParquetFrame, see talus_utils.arrow.explode.
+
+    Parameters
+    ----------
+    frame : ParquetFrame
+        The input frame.
+    args : Any
+        The arguments to talus_utils.arrow.explode.
+    kwargs : Any
+        The keyword arguments to talus_utils.arrow.explode.
+
+    Returns
+    -------
+    ParquetFrame
+        The transformed frame.
+    """
+    return frame.map_batches(lambda table: arrow.explode(table, *args, **kwargs))
+
+
+def update_column(frame: ParquetFrame, *args: Any, **kwargs: Any) -> ParquetFrame:
+    """Apply a function to a column of a ParquetFrame, see talus_utils.arrow.update_column.
+
+    Parameters
+    ----------
+    frame : ParquetFrame
+        The input frame.
+    args : Any
+        The arguments to talus_utils.arrow.update_column.
+    kwargs : Any
+        The keyword arguments to talus_utils.arrow.update_column.
+
+    Returns
+    -------
+    ParquetFrame
+        The transformed frame.
+    """
+    return frame.map_batches(lambda table: arrow.update_column(table, *args, **kwargs))
+
+
+def log_scaling(frame: ParquetFrame, *args: Any, **kwargs: Any) -> ParquetFrame:
+    """Apply a log scale to a ParquetFrame, see talus_utils.arrow.log_scaling.
+
+    Parameters
+    ----------
+    frame : ParquetFrame
+        The input frame.
+    args : Any
+        The arguments to talus_utils.arrow.log_scaling.
+    kwargs : Any
+        The keyword arguments to talus_utils.arrow.log_scaling.
+
+    Returns
+    -------
+    ParquetFrame
+        The transformed frame.
+    """
+    return frame.map_batches(lambda table: arrow.log_scaling(table, *args, **kwargs))
+
+
+def normalize(frame: ParquetFrame, how: str) -> ParquetFrame:
+    """Apply a row or column normalization to the numeric columns of a ParquetFrame.
+
+    Row normalization is applied batch by batch. Column normalizations first compute
+    the statistics of the columns in extra passes over the input: the column and
+    minmax normalizations and the median are exact, the quantile normalization is
+    approximated from histograms of HISTOGRAM_BINS bins.
+
+    Parameters
+    ----------
+    frame : ParquetFrame
+        The input frame.
+    how : str
+        The normalization method to apply, as in talus_utils.dataframe.normalize.
+
+    Returns
+    -------
+    ParquetFrame
+        The transformed frame.
+
+    Raises
+    ------
+    ValueError
+        If how is not a normalization method.
+    """
+    how = how.lower()
+    if how in ROW_NORMALIZATIONS:
+        return frame.map_batches(lambda table: arrow.normalize(table, how=how))
+
+    names = _numeric_columns(frame)
+    if how in COLUMN_NORMALIZATIONS:
+        stats = _column_stats(frame, names)
+        scales = {
+            name: (0.0, stats[name]["sum"] if stats[name]["count"] else np.nan)
+            for name in names
+        }
+    elif how in MINMAX_NORMALIZATIONS:
+        stats = _column_stats(frame, names)
+        scales = {
+            name: (stats[name]["min"], stats[name]["max"] - stats[name]["min"])
+            for name in names
+        }
+    elif how in MEDIAN_NORMALIZATIONS:
+        medians = _medians(frame, names)
+        scales = {name: (0.0, median) for name, median in medians.items()}
+    elif how in QUANTILE_NORMALIZATIONS:
+        return frame.map_batches(_quantile_normalizer(frame, names))
+    else:
+        raise ValueError(
+            "Invalid input value for 'how'. Needs to be one of {'row', 'colum', 'minmax'}."
+        )
+
+    def apply_func(table: pa.Table) -> pa.Table:
+        columns = {}
+        for name, (offset, scale) in scales.items():
+            column = pc.cast(table[name], pa.float64())
+            columns[name] = pc.divide(pc.subtract(column, offset), scale)
+        return arrow._replace_columns(table, columns)
+
+    return frame.map_batches(apply_func)
@@ -1,11 +1,18 @@
 """src/talus_utils/s3.py module."""
 from io import BytesIO
+from pathlib import Path
+from typing import Any, Dict, Union
 
 import boto3
 
+from boto3.s3.transfer import TransferConfig
 from botocore.exceptions import ClientError
 
 
+MULTIPART_CHUNKSIZE = 64 * 1024 * 1024
+MAX_CONCURRENCY = 8
+
+
 def _read_object(bucket: str, key: str) -> BytesIO:
     """Read an object in byte format from a given s3 bucket and key name.
 
@@ -39,3 +46,82 @@ def _read_object(bucket: str, key: str) -> BytesIO:
             raise ValueError("File doesn't exist.")
         else:
             raise
+
+
+def _download_object(
+    bucket: str,
+    key: str,
+    filename: Union[Path, str],
+    multipart_chunksize: int = MULTIPART_CHUNKSIZE,
+    max_concurrency: int = MAX_CONCURRENCY,
+) -> None:
+    """Stream an object from a given s3 bucket and key name straight to a file on disk.
+
+    Large objects are fetched as parallel ranged GET requests and every part is
+    written to its offset in the target file, so memory use is bounded by
+    multipart_chunksize * max_concurrency and not by the object size.
+
+    Parameters
+    ----------
+    bucket : str
+        The S3 bucket to load from.
+    key : str
+        The object key within the s3 bucket.
+    filename : Union[Path, str]
+        The path of the file to write the object to.
+    multipart_chunksize : int
+        The size of each ranged part in bytes. (Default value = MULTIPART_CHUNKSIZE).
+    max_concurrency : int
+        The maximum number of parts downloaded in parallel. (Default value = MAX_CONCURRENCY).
+
+    Raises
+    ------
+    ValueError
+        If the file couldn't be found.
+
+    """
+    s3_resource = boto3.Session().resource("s3")
+    s3_bucket = s3_resource.Bucket(bucket)
+    config = TransferConfig(
+        multipart_threshold=multipart_chunksize,
+        multipart_chunksize=multipart_chunksize,
+        max_concurrency=max_concurrency,
+    )
+    try:
+        s3_bucket.download_file(Key=key, Filename=str(filename), Config=config)
+    except ClientError as e:
+        if e.response["Error"]["Code"] == "404":
+            raise ValueError("File doesn't exist.")
+        else:
+            raise
+
+
+def _head_object(bucket: str, key: str) -> Dict[str, Any]:
+    """Fetch the metadata of an object in a given s3 bucket without downloading it.
+
+    Parameters
+    ----------
+    bucket : str
+        The S3 bucket to look in.
+    key : str
+        The object key within the s3 bucket.
+
+    Returns
+    -------
+    Dict[str, Any]
+        The object metadata, including its 'ETag' and 'ContentLength'.
+
+    Raises
+    ------
+    ValueError
+        If the file couldn't be found.
+
+    """
+    s3_client = boto3.Session().client("s3")
+    try:
+        return s3_client.head_object(Bucket=bucket, Key=key)
+    except ClientError as e:
+        if e.response["Error"]["Code"] == "404":
+            raise ValueError("File doesn't exist.")
+        else:
+            raise
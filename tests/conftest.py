@@ -0,0 +1,36 @@
+"""tests/conftest.py module."""
+import os
+
+from pathlib import Path
+from typing import Iterator
+
+import boto3
+import pytest
+
+from moto import mock_s3
+
+
+DATA_DIR = Path(__file__).resolve().parent.joinpath("data")
+
+BUCKET = "talus-utils-test"
+ELIB_KEY = "elibs/test_local.mzML.elib"
+ELIB_FILE = DATA_DIR.joinpath("test_local.mzML.elib")
+
+
+@pytest.fixture
+def s3_bucket() -> Iterator[str]:
+    """Create a mocked S3 bucket containing a test elib file.
+
+    Yields
+    ------
+    str
+        The name of the mocked bucket.
+    """
+    os.environ.setdefault("AWS_DEFAULT_REGION", "us-east-1")
+    os.environ.setdefault("AWS_ACCESS_KEY_ID", "testing")
+    os.environ.setdefault("AWS_SECRET_ACCESS_KEY", "testing")
+    with mock_s3():
+        s3_client = boto3.client("s3")
+        s3_client.create_bucket(Bucket=BUCKET)
+        s3_client.upload_file(Filename=str(ELIB_FILE), Bucket=BUCKET, Key=ELIB_KEY)
+        yield BUCKET
@@ -0,0 +1,164 @@
+"""tests/test_arrow.py module."""
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+from pandas.testing import assert_frame_equal
+
+from talus_utils import arrow, dataframe
+from talus_utils.fasta import parse_fasta_header_uniprot_protein
+
+
+DATA_DIR = Path(__file__).resolve().parent.joinpath("data")
+
+
+def dummy_function(df: pa.Table) -> pa.Table:
+    """Return the input table.
+
+    Parameters
+    ----------
+    df : pa.Table
+        The input table.
+    """
+    return df
+
+
+def make_quant_table() -> pd.DataFrame:
+    """Create a small quant matrix with an identifier column and missing values."""
+    values = np.random.rand(20, 4) * 100
+    values[np.random.rand(20, 4) < 0.2] = np.nan
+    df = pd.DataFrame(values, columns=["s1", "s2", "s3", "s4"])
+    df.insert(0, "Protein", [f"P{i}" for i in range(20)])
+    return df
+
+
+@pytest.mark.parametrize(
+    "pd_kwargs",
+    [{}, {"how": "all"}, {"thresh": 3}, {"subset": ["s1"]}, {"axis": 1}],
+)
+def test_dropna(pd_kwargs: dict) -> None:
+    """Test the dropna decorator with a pyarrow Table."""
+    df_input = make_quant_table()
+    df_input.loc[3, ["s1", "s2", "s3", "s4"]] = np.nan
+    df_expected = df_input.dropna(**pd_kwargs).reset_index(drop=True)
+
+    table = dataframe.dropna(**pd_kwargs)(dummy_function)(
+        pa.Table.from_pandas(df_input)
+    )
+    assert_frame_equal(table.to_pandas(), df_expected)
+
+
+def test_explode() -> None:
+    """Test the explode decorator with a pyarrow Table."""
+    df_input = pd.read_csv(DATA_DIR.joinpath("peptide_proteins_to_explode.csv"))
+    df_input.loc[2, "Protein"] = None
+    df_expected = dataframe.explode_column(
+        df_input, column="Protein", sep=";", ignore_index=True
+    )
+
+    table = dataframe.explode(column="Protein", sep=";")(dummy_function)(
+        pa.Table.from_pandas(df_input)
+    )
+    assert_frame_equal(table.to_pandas(), df_expected)
+
+    table = dataframe.explode(column="Protein", sep=";", categorical=True)(
+        dummy_function
+    )(pa.Table.from_pandas(df_input))
+    assert pa.types.is_dictionary(table["Protein"].type)
+    assert table["Protein"].to_pylist() == df_expected["Protein"].tolist()
+
+
+def test_explode_lists() -> None:
+    """Test exploding a column of lists with empty lists and nulls."""
+    table = pa.table({"A": [[0, 1, 2], None, [], [3, 4]], "B": [1, 2, 3, 4]})
+
+    table = arrow.explode(table, column="A")
+    assert table["A"].to_pylist() == [0, 1, 2, None, None, 3, 4]
+    assert table["B"].to_pylist() == [1, 1, 1, 2, 3, 4, 4]
+
+    with pytest.raises(TypeError):
+        _ = arrow.explode(table, column="A", sep=";")
+
+
+def test_update_column() -> None:
+    """Test the update_column decorator with a pyarrow Table."""
+    df_input = pd.read_csv(DATA_DIR.joinpath("select_peptidetoprotein.csv"))
+    df_expected = df_input.copy(deep=True)
+    df_expected["ProteinAccession"] = df_expected["ProteinAccession"].apply(
+        parse_fasta_header_uniprot_protein
+    )
+
+    table = dataframe.update_column(
+        column="ProteinAccession", update_func=parse_fasta_header_uniprot_protein
+    )(dummy_function)(pa.Table.from_pandas(df_input))
+    assert_frame_equal(table.to_pandas(), df_expected)
+
+
+@pytest.mark.parametrize("filter_outliers", [True, False])
+@pytest.mark.parametrize("log_function", [np.log10, np.log2, np.sqrt])
+def test_log_scaling(filter_outliers: bool, log_function: np.ufunc) -> None:
+    """Test the log_scaling decorator with a pyarrow Table."""
+    df_input = make_quant_table()
+    df_input.loc[0, "s1"] = 0.5
+    numeric_columns = ["s1", "s2", "s3", "s4"]
+    df_expected = df_input.copy()
+    df_expected[numeric_columns] = dataframe.log_scaling(
+        log_function=log_function, filter_outliers=filter_outliers
+    )(dummy_function)(df_input[numeric_columns])
+
+    table = dataframe.log_scaling(
+        log_function=log_function, filter_outliers=filter_outliers
+    )(dummy_function)(pa.Table.from_pandas(df_input))
+    assert_frame_equal(table.to_pandas(), df_expected)
+
+
+@pytest.mark.parametrize("how", ["row", "column", "minmax", "median", "quantile"])
+def test_normalize(how: str) -> None:
+    """Test the normalize decorator with a pyarrow Table."""
+    df_input = make_quant_table()
+    numeric_columns = ["s1", "s2", "s3", "s4"]
+    df_expected = df_input.copy()
+    df_expected[numeric_columns] = dataframe.normalize(how=how)(dummy_function)(
+        df_input[numeric_columns]
+    )
+
+    table = dataframe.normalize(how=how)(dummy_function)(pa.Table.from_pandas(df_input))
+    assert_frame_equal(table.to_pandas(), df_expected)
+
+
+def test_normalize_value_error() -> None:
+    """Test normalize with an invalid method."""
+    with pytest.raises(ValueError):
+        _ = arrow.normalize(pa.table({"a": [1.0]}), how="nonexisting")
+
+
+def test_lazy() -> None:
+    """Test the lazy decorator with a pyarrow Table."""
+    df_input = make_quant_table()
+
+    @dataframe.copy
+    @dataframe.dropna()
+    @dataframe.log_scaling()
+    @dataframe.normalize(how="median")
+    def analyze(df: pa.Table) -> pa.Table:
+        return df
+
+    expected = analyze(pa.Table.from_pandas(df_input))
+    actual = dataframe.lazy(analyze)(pa.Table.from_pandas(df_input))
+    assert actual.equals(expected)
+
+
+def test_polars() -> None:
+    """Test the normalize decorator with a polars DataFrame."""
+    pl = pytest.importorskip("polars")
+    df_input = make_quant_table()
+
+    table = dataframe.normalize(how="row")(dummy_function)(
+        pa.Table.from_pandas(df_input)
+    )
+    actual = dataframe.normalize(how="row")(dummy_function)(pl.from_pandas(df_input))
+    assert isinstance(actual, pl.DataFrame)
+    assert actual.to_arrow().equals(pl.from_arrow(table).to_arrow())
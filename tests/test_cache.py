@@ -0,0 +1,72 @@
+"""tests/test_cache.py module."""
+import os
+
+from pathlib import Path
+from unittest import mock
+
+import boto3
+
+from talus_utils import cache as cache_module
+from talus_utils.cache import S3Cache
+from talus_utils.elib import get_unique_peptide_proteins
+from tests.conftest import ELIB_FILE, ELIB_KEY
+
+
+def test_cache_hit_skips_download(s3_bucket: str, tmp_path: Path) -> None:
+    """Test that a cache hit costs a HEAD request but no download."""
+    s3_cache = S3Cache(cache_dir=tmp_path)
+    with mock.patch.object(
+        cache_module, "_download_object", wraps=cache_module._download_object
+    ) as download:
+        path_first = s3_cache.get(bucket=s3_bucket, key=ELIB_KEY)
+        path_second = s3_cache.get(bucket=s3_bucket, key=ELIB_KEY)
+
+    assert download.call_count == 1
+    assert path_first == path_second
+    assert path_first.read_bytes() == ELIB_FILE.read_bytes()
+
+
+def test_cache_revalidates_etag(s3_bucket: str, tmp_path: Path) -> None:
+    """Test that a changed object is downloaded again and replaces the stale entry."""
+    s3_cache = S3Cache(cache_dir=tmp_path)
+    path_old = s3_cache.get(bucket=s3_bucket, key=ELIB_KEY)
+
+    boto3.client("s3").put_object(Bucket=s3_bucket, Key=ELIB_KEY, Body=b"new")
+    path_new = s3_cache.get(bucket=s3_bucket, key=ELIB_KEY)
+
+    assert path_new != path_old
+    assert not path_old.exists()
+    assert path_new.read_bytes() == b"new"
+
+
+def test_cache_lru_eviction(s3_bucket: str, tmp_path: Path) -> None:
+    """Test that the least recently used files are evicted past max_size."""
+    s3_client = boto3.client("s3")
+    for key in ["a.bin", "b.bin", "c.bin"]:
+        s3_client.put_object(Bucket=s3_bucket, Key=key, Body=key.encode() * 100)
+    s3_cache = S3Cache(cache_dir=tmp_path, max_size=1000)
+
+    path_a = s3_cache.get(bucket=s3_bucket, key="a.bin")
+    path_b = s3_cache.get(bucket=s3_bucket, key="b.bin")
+    os.utime(path_a, (1, 1))
+    os.utime(path_b, (2, 2))
+    # Touch "a" so that "b" becomes the least recently used entry.
+    s3_cache.get(bucket=s3_bucket, key="a.bin")
+    path_c = s3_cache.get(bucket=s3_bucket, key="c.bin")
+
+    assert path_a.exists()
+    assert not path_b.exists()
+    assert path_c.exists()
+
+
+def test_get_unique_peptide_proteins_with_cache(s3_bucket: str, tmp_path: Path) -> None:
+    """Test get_unique_peptide_proteins with an S3 cache."""
+    dict_actual = get_unique_peptide_proteins(
+        elib_filename=ELIB_KEY, bucket=s3_bucket, cache=S3Cache(cache_dir=tmp_path)
+    )
+
+    assert dict_actual == {
+        "Sample Name": "test_local",
+        "Unique Proteins": 5,
+        "Unique Peptides": 5,
+    }
@@ -1,5 +1,7 @@
 """tests/test_dataframe.py module."""
+
 from pathlib import Path
+from typing import Any, Callable
 
 import numpy as np
 import pandas as pd
@@ -10,7 +12,6 @@ from pandas.testing import assert_frame_equal
 from talus_utils import dataframe
 from talus_utils.fasta import parse_fasta_header_uniprot_protein
 
-
 DATA_DIR = Path(__file__).resolve().parent.joinpath("data")
 
 
@@ -80,6 +81,59 @@ def test_copy_df_in_kwargs() -> None:
     assert_frame_equal(df_expected_not_to_change, df_input)
 
 
+def dummy_function_change_df_value(df: pd.DataFrame) -> None:
+    """Change a value of the input df in place.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        The input DataFrame.
+    """
+    df.iloc[0, 0] = 100.0
+
+
+def test_copy_mode_value_error() -> None:
+    """Test the copy decorator with an invalid mode."""
+    with pytest.raises(ValueError):
+        _ = dataframe.copy(mode="nonexisting")
+
+
+def test_copy_readonly() -> None:
+    """Test the copy decorator with mode='readonly'."""
+    df_input = pd.DataFrame({"a": [1.0, 2.0], "b": [3, 4], "c": ["x", "y"]})
+    df_expected = df_input.copy(deep=True)
+
+    df_actual = dataframe.copy(mode="readonly")(dummy_function)(df_input)
+    assert np.shares_memory(df_actual["a"].to_numpy(), df_input["a"].to_numpy())
+
+    with pytest.raises(ValueError):
+        dataframe.copy(dummy_function_change_df_value, mode="readonly")(df_input)
+    dataframe.copy(dummy_function_change_df_column, mode="readonly")(df=df_input)
+
+    assert_frame_equal(df_input, df_expected)
+    df_input.iloc[0, 0] = 5.0
+
+
+@pytest.mark.skipif(
+    not dataframe.HAS_COPY_ON_WRITE, reason="pandas has no copy-on-write mode"
+)
+def test_copy_cow() -> None:
+    """Test the copy decorator with mode='cow'."""
+    df_input = pd.DataFrame({"a": [1.0, 2.0], "b": [3, 4], "c": ["x", "y"]})
+    df_expected = df_input.copy(deep=True)
+
+    @dataframe.copy(mode="cow")
+    def change_and_return(df: pd.DataFrame) -> pd.DataFrame:
+        dummy_function_change_df_value(df)
+        dummy_function_change_df_column(df)
+        return df
+
+    df_actual = change_and_return(df_input)
+    assert_frame_equal(df_input, df_expected)
+    assert df_actual.iloc[0, 0] == 100.0
+    assert np.shares_memory(df_actual["b"].to_numpy(), df_input["b"].to_numpy())
+
+
 def test_dropna() -> None:
     """Test the dropna decorator."""
     df_input = pd.DataFrame(
@@ -154,6 +208,55 @@ def test_pivot_table() -> None:
     assert_frame_equal(df_actual, df_expected)
 
 
+def make_long_quant_table(n_peptides: int = 50, n_samples: int = 6) -> pd.DataFrame:
+    """Create a long peptide x sample quant table with unique pairs."""
+    df = pd.DataFrame(
+        {
+            "Peptide": np.repeat([f"PEPTIDE{i}" for i in range(n_peptides)], n_samples),
+            "Sample": np.tile([f"S{i}" for i in range(n_samples, 0, -1)], n_peptides),
+            "Intensity": np.random.rand(n_peptides * n_samples) * 100,
+        }
+    )
+    df = df.sample(frac=0.8).reset_index(drop=True)
+    df.loc[df["Peptide"] == "PEPTIDE3", "Intensity"] = np.nan
+    df.loc[df["Sample"] == "S2", "Intensity"] = np.nan
+    df.loc[::17, "Intensity"] = np.nan
+    df.loc[5, "Peptide"] = None
+    return df
+
+
+@pytest.mark.parametrize(
+    "pd_kwargs",
+    [{}, {"dropna": False}, {"sort": False}, {"aggfunc": "first"}],
+)
+def test_pivot_table_unique(pd_kwargs: dict) -> None:
+    """Test the pivot_table fast path for unique (index, columns) pairs."""
+    df_input = make_long_quant_table()
+    pivot_kwargs = {"index": "Peptide", "columns": "Sample", "values": "Intensity"}
+    df_expected = df_input.pivot_table(**pivot_kwargs, **pd_kwargs)
+
+    df_actual = dataframe.pivot_table(**pivot_kwargs, **pd_kwargs)(dummy_function)(
+        df_input
+    )
+    assert_frame_equal(df_actual, df_expected)
+
+    df_actual = dataframe.pivot_table(
+        **pivot_kwargs, **pd_kwargs, assume_unique=True, dtype=np.float32
+    )(dummy_function)(df_input)
+    assert_frame_equal(df_actual, df_expected.astype(np.float32))
+
+
+def test_pivot_table_duplicates() -> None:
+    """Test that the pivot_table decorator aggregates duplicated pairs."""
+    df_input = make_long_quant_table()
+    df_input = pd.concat([df_input, df_input.head(20).assign(Intensity=1.0)])
+    pivot_kwargs = {"index": "Peptide", "columns": "Sample", "values": "Intensity"}
+    df_expected = df_input.pivot_table(**pivot_kwargs)
+
+    df_actual = dataframe.pivot_table(**pivot_kwargs)(dummy_function)(df_input)
+    assert_frame_equal(df_actual, df_expected)
+
+
 def test_normalize_value_error() -> None:
     """Test the normalize decorator with a value error."""
     df_input = pd.DataFrame([{"test": "a", "test2": "b"}, {"test": "c", "test2": "d"}])
@@ -215,6 +318,34 @@ def test_normalize_quantile_column() -> None:
     assert_frame_equal(df_actual, df_expected)
 
 
+def test_quantile_normalize_nan_and_ties() -> None:
+    """Test quantile_normalize with missing and tied values."""
+    df_input = pd.DataFrame(np.random.rand(50, 6) * 100).round(0)
+    df_input = df_input.mask(np.random.rand(50, 6) < 0.2)
+    df_input.iloc[:, 0] = df_input.iloc[:, 0].fillna(1.0)
+
+    rank_mean = (
+        df_input.stack()
+        .groupby(df_input.rank(method="first").stack().astype(int))
+        .mean()
+    )
+    df_expected = (
+        df_input.rank(method="min").stack().astype(int).map(rank_mean).unstack()
+    )
+
+    df_actual = dataframe.quantile_normalize(df_input)
+    assert_frame_equal(df_actual, df_expected)
+
+
+def test_quantile_normalize_float32() -> None:
+    """Test quantile_normalize with a float32 output."""
+    df_input = pd.DataFrame(np.random.rand(5, 5) * 100)
+    df_expected = dataframe.quantile_normalize(df_input).astype(np.float32)
+
+    df_actual = dataframe.quantile_normalize(df_input, dtype=np.float32)
+    assert_frame_equal(df_actual, df_expected)
+
+
 def test_sort_row_values_value_error() -> None:
     """Test the sort_by decorator with a value error."""
     df_input = pd.DataFrame([{"test": "a", "test2": "b"}, {"test": "c", "test2": "d"}])
@@ -408,3 +539,395 @@ def test_update_and_explode() -> None:
     df_actual = dataframe.explode(column="Protein", sep=";")(dummy_function)(df_input)
 
     assert_frame_equal(df_actual, df_expected)
+
+
+@pytest.mark.parametrize("how", ["row", "column", "minmax", "median", "quantile"])
+@pytest.mark.parametrize("filter_outliers", [True, False])
+def test_lazy(how: str, filter_outliers: bool) -> None:
+    """Test that the lazy decorator matches the eager decorator stack."""
+    df_input = pd.DataFrame(
+        {
+            "Sample": np.repeat(["a", "b", "c", "d"], 6),
+            "Protein": np.tile(["p1", "p2", "p3", "p4", "p5", "p6"], 4),
+            "Value": np.random.rand(24) * 100,
+        }
+    )
+    df_input.loc[[0, 9], "Value"] = 0.5
+    df_original = df_input.copy(deep=True)
+
+    def analyze(df: pd.DataFrame) -> pd.DataFrame:
+        return df
+
+    for decorator in [
+        dataframe.sort_row_values(how="max"),
+        dataframe.normalize(how=how),
+        dataframe.log_scaling(filter_outliers=filter_outliers),
+        dataframe.pivot_table(index="Protein", columns="Sample", values="Value"),
+        dataframe.dropna(),
+        dataframe.copy,
+    ]:
+        analyze = decorator(analyze)
+
+    df_expected = analyze(df_input)
+    df_actual = dataframe.lazy(analyze)(df_input)
+
+    assert_frame_equal(df_actual, df_expected)
+    assert_frame_equal(df_input, df_original)
+
+
+def test_lazy_plan() -> None:
+    """Test that the lazy decorator fuses the recorded steps."""
+
+    @dataframe.lazy
+    @dataframe.copy
+    @dataframe.log_scaling()
+    @dataframe.normalize(how="row")
+    @dataframe.copy
+    def analyze(df: pd.DataFrame) -> pd.DataFrame:
+        return df
+
+    assert [step.name for step in analyze._plan] == ["log_scaling+normalize", "copy"]
+
+    analyze = dataframe.lazy(
+        dataframe.copy(mode="readonly")(dataframe.dropna()(dummy_function))
+    )
+    assert [step.name for step in analyze._plan] == ["copy", "dropna"]
+
+    # Only numpy ufuncs are fused with the normalization.
+    analyze = dataframe.lazy(
+        dataframe.log_scaling(log_function=lambda x: np.log2(x))(
+            dataframe.normalize(how="row")(dummy_function)
+        )
+    )
+    assert [step.name for step in analyze._plan] == ["log_scaling", "normalize"]
+
+
+def test_lazy_copy() -> None:
+    """Test that the lazy decorator keeps a trailing copy."""
+    df_input = pd.DataFrame([{"test": "a", "test2": "b"}, {"test": "c", "test2": "d"}])
+    df_expected_not_to_change = df_input.copy(deep=True)
+
+    dataframe.lazy(dataframe.copy(dummy_function_change_df_column))(
+        df=df_expected_not_to_change
+    )
+    assert_frame_equal(df_expected_not_to_change, df_input)
+
+
+def test_lazy_log_normalize_with_nan() -> None:
+    """Test the fused log_scaling and normalize step with an all-NaN column."""
+    df_input = pd.DataFrame(np.random.rand(5, 3) * 100 + 1)
+    df_input[1] = 0.5
+
+    def analyze(df: pd.DataFrame) -> pd.DataFrame:
+        return df
+
+    analyze = dataframe.log_scaling(log_function=np.log2)(
+        dataframe.normalize(how="median")(analyze)
+    )
+    df_expected = analyze(df_input)
+    df_actual = dataframe.lazy(analyze)(df_input)
+
+    assert_frame_equal(df_actual, df_expected)
+
+
+@pytest.mark.parametrize(
+    "how,expected_func",
+    [
+        ("row", lambda df: df.apply(lambda x: x / x.sum(), axis=1)),
+        ("column", lambda df: df.apply(lambda x: x / x.sum(), axis=0)),
+        ("minmax", lambda df: (df - df.min()) / (df.max() - df.min())),
+        ("median", lambda df: df / df.median()),
+    ],
+)
+def test_normalize_with_nan(how: str, expected_func: Callable[..., Any]) -> None:
+    """Test the vectorized normalizations against pandas with missing values."""
+    values = np.random.rand(20, 5) * 100
+    values[np.random.rand(20, 5) < 0.3] = np.nan
+    values[:, 2] = np.nan
+    df_input = pd.DataFrame(values, columns=list("abcde"))
+    df_expected = expected_func(df_input)
+
+    df_actual = dataframe.normalize(how=how)(dummy_function)(df_input)
+    assert_frame_equal(df_actual, df_expected)
+
+    df_actual = dataframe.normalize(how=how, dtype=np.float32)(dummy_function)(df_input)
+    assert (df_actual.dtypes == np.float32).all()
+    assert_frame_equal(df_actual, df_expected.astype(np.float32))
+
+
+@pytest.mark.parametrize("how", ["row", "column", "minmax", "median", "quantile"])
+def test_normalize_inplace(how: str) -> None:
+    """Test that normalize with inplace=True overwrites its input."""
+    df_input = pd.DataFrame(np.random.rand(10, 4) * 100)
+    df_expected = dataframe.normalize(how=how)(dummy_function)(df_input)
+
+    df_actual = dataframe.normalize(how=how, inplace=True)(dummy_function)(df_input)
+    assert df_actual is df_input
+    assert_frame_equal(df_actual, df_expected)
+
+
+def test_normalize_inplace_dtype_error() -> None:
+    """Test that normalize can't change the dtype in place."""
+    df_input = pd.DataFrame(np.random.rand(10, 4) * 100)
+    with pytest.raises(ValueError):
+        _ = dataframe.normalize(how="row", inplace=True, dtype=np.float32)(
+            dummy_function
+        )(df_input)
+
+
+@pytest.mark.parametrize("n_jobs", [2, 3, -1])
+@pytest.mark.parametrize("how", ["row", "column", "minmax", "median"])
+def test_normalize_n_jobs(how: str, n_jobs: int) -> None:
+    """Test that normalize gives the same results in parallel column blocks."""
+    df_input = pd.DataFrame(np.random.rand(50, 7) * 100)
+    df_input.iloc[::3, 2] = np.nan
+    df_expected = dataframe.normalize(how=how)(dummy_function)(df_input)
+
+    df_actual = dataframe.normalize(how=how, n_jobs=n_jobs)(dummy_function)(df_input)
+    assert_frame_equal(df_actual, df_expected)
+
+
+@pytest.mark.parametrize("filter_outliers", [True, False])
+@pytest.mark.parametrize(
+    "log_function", [np.log10, lambda x: np.sqrt(x), lambda df: df.apply(np.log2)]
+)
+def test_log_scaling_n_jobs(
+    log_function: Callable[..., Any], filter_outliers: bool
+) -> None:
+    """Test that log_scaling gives the same results in parallel column blocks."""
+    df_input = pd.DataFrame(np.random.rand(50, 7) * 100)
+    df_input[7] = np.arange(50)
+    df_expected = dataframe.log_scaling(
+        log_function=log_function, filter_outliers=filter_outliers
+    )(dummy_function)(df_input)
+
+    df_actual = dataframe.log_scaling(
+        log_function=log_function, filter_outliers=filter_outliers, n_jobs=3
+    )(dummy_function)(df_input)
+    assert_frame_equal(df_actual, df_expected)
+
+
+@pytest.mark.parametrize(
+    "how,reducer",
+    [
+        ("median", lambda df: df.median(axis=1)),
+        ("mean", lambda df: df.mean(axis=1)),
+        ("sum", lambda df: df.sum(axis=1)),
+        ("std", lambda df: df.std(axis=1)),
+        ("cv", lambda df: df.std(axis=1) / df.mean(axis=1)),
+        ("nan_count", lambda df: df.isna().sum(axis=1)),
+        ("quantile", lambda df: df.quantile(0.75, axis=1)),
+    ],
+)
+def test_sort_row_values_reducers(how: str, reducer: Callable[..., Any]) -> None:
+    """Test the sort_row_values decorator with the additional reducers."""
+    values = np.random.rand(50, 6) * 100
+    values[np.random.rand(50, 6) < 0.3] = np.nan
+    df_input = pd.DataFrame(values, index=[f"row{i}" for i in range(50)])
+    df_expected = df_input.reindex(
+        index=reducer(df_input).sort_values(ascending=False).index
+    )
+
+    df_actual = dataframe.sort_row_values(how=how, q=0.75)(dummy_function)(df_input)
+    assert_frame_equal(df_actual, df_expected)
+
+
+@pytest.mark.parametrize("sort_ascending", [True, False])
+def test_sort_row_values_top_k(sort_ascending: bool) -> None:
+    """Test the sort_row_values decorator with top_k and bottom_k."""
+    values = np.random.rand(100, 5) * 100
+    values[3] = np.nan
+    df_input = pd.DataFrame(values)
+    reduced = df_input.mean(axis=1).dropna()
+
+    df_actual = dataframe.sort_row_values(
+        how="mean", sort_ascending=sort_ascending, top_k=10
+    )(dummy_function)(df_input)
+    df_expected = df_input.loc[
+        reduced.nlargest(10).sort_values(ascending=sort_ascending).index
+    ]
+    assert_frame_equal(df_actual, df_expected)
+
+    df_actual = dataframe.sort_row_values(
+        how="mean", sort_ascending=sort_ascending, bottom_k=10
+    )(dummy_function)(df_input)
+    df_expected = df_input.loc[
+        reduced.nsmallest(10).sort_values(ascending=sort_ascending).index
+    ]
+    assert_frame_equal(df_actual, df_expected)
+
+    df_actual = dataframe.sort_row_values(how="mean", top_k=1000)(dummy_function)(
+        df_input
+    )
+    assert len(df_actual) == 100
+
+
+def test_sort_row_values_top_k_value_error() -> None:
+    """Test the sort_row_values decorator with both top_k and bottom_k."""
+    with pytest.raises(ValueError):
+        _ = dataframe.sort_row_values(how="mean", top_k=1, bottom_k=1)(dummy_function)
+
+
+def legacy_explode_column(
+    df: pd.DataFrame, column: str, sep: str, ignore_index: bool = False
+) -> pd.DataFrame:
+    """Explode a column row by row.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        The input DataFrame.
+    column : str
+        The column to explode.
+    sep : str
+        The separator.
+    ignore_index : bool
+        Whether to reset the index.
+    """
+    return df.assign(
+        **{
+            column: df[column].apply(
+                lambda row: row.split(sep) if isinstance(row, str) else row
+            )
+        }
+    ).explode(column=column, ignore_index=ignore_index)
+
+
+@pytest.mark.parametrize("ignore_index", [True, False])
+def test_explode_column_strings(ignore_index: bool) -> None:
+    """Test the vectorized explode_column with strings and missing values."""
+    df_input = pd.DataFrame(
+        {
+            "Peptide": ["A", "B", "C", "D", "E", "F"],
+            "Protein": ["P1;P2", None, "P3", np.nan, "P2;;P4;", ""],
+            "Count": np.arange(6, dtype=np.int32),
+        },
+        index=[0, 1, 1, 2, 3, 4],
+    )
+    df_expected = legacy_explode_column(
+        df_input, column="Protein", sep=";", ignore_index=ignore_index
+    )
+
+    df_actual = dataframe.explode_column(
+        df_input, column="Protein", sep=";", ignore_index=ignore_index
+    )
+    assert_frame_equal(df_actual, df_expected)
+
+    df_actual = dataframe.explode_column(
+        df_input, column="Protein", sep=";", ignore_index=ignore_index, categorical=True
+    )
+    assert_frame_equal(df_actual, df_expected.astype({"Protein": "category"}))
+
+
+def test_explode_column_categorical_input() -> None:
+    """Test the vectorized explode_column with a categorical column."""
+    df_input = pd.read_csv(DATA_DIR.joinpath("peptide_proteins_to_explode.csv"))
+    df_expected = legacy_explode_column(df_input, column="Protein", sep=";")
+
+    df_actual = dataframe.explode_column(
+        df_input.astype({"Protein": "category"}), column="Protein", sep=";"
+    )
+    assert_frame_equal(df_actual, df_expected)
+
+
+def test_explode_column_mixed() -> None:
+    """Test that explode_column falls back to splitting mixed columns row by row."""
+    df_input = pd.DataFrame({"A": [["x", "y"], "z;w", 1], "B": [1, 2, 3]})
+    df_expected = legacy_explode_column(df_input, column="A", sep=";")
+
+    df_actual = dataframe.explode(column="A", sep=";")(dummy_function)(df_input)
+    assert_frame_equal(df_actual, df_expected)
+
+
+def test_cached() -> None:
+    """Test that cached reuses the results of calls with equal DataFrames."""
+    df_input = pd.DataFrame(np.random.rand(10, 4) * 100, columns=list("abcd"))
+    df_input["name"] = [f"P{i}" for i in range(10)]
+    analyze = dataframe.cached(dataframe.dropna()(dummy_function))
+
+    df_expected = analyze(df_input)
+    df_actual = analyze(df_input.copy(deep=True))
+    assert_frame_equal(df_actual, df_expected)
+    assert analyze.cache_info() == dataframe.CacheInfo(1, 1, 0, 32, 1)
+
+    with pytest.raises(ValueError):
+        df_actual.iloc[0, 0] = 0.0
+
+    df_input.loc[3, "name"] = "changed"
+    _ = analyze(df_input)
+    assert analyze.cache_info().misses == 2
+
+    analyze.cache_clear()
+    assert analyze.cache_info() == dataframe.CacheInfo(0, 0, 0, 32, 0)
+
+
+def test_cached_maxsize() -> None:
+    """Test that cached evicts the least recently used results."""
+    calls = []
+
+    @dataframe.cached(maxsize=2)
+    def analyze(df: pd.DataFrame, scale: float) -> pd.DataFrame:
+        calls.append(scale)
+        return df * scale
+
+    df_input = pd.DataFrame(np.random.rand(10, 4))
+    for scale in [1, 2, 1, 3, 1, 2]:
+        _ = analyze(df_input, scale=scale)
+    assert calls == [1, 2, 3, 2]
+    assert analyze.cache_info() == dataframe.CacheInfo(2, 4, 0, 2, 2)
+
+
+def test_cached_unhashable() -> None:
+    """Test that cached calls through with arguments that can't be pickled."""
+    analyze = dataframe.cached(lambda df, func: func(df))
+    df_input = pd.DataFrame(np.random.rand(10, 4))
+
+    assert_frame_equal(analyze(df_input, lambda df: df * 2), df_input * 2)
+    assert analyze.cache_info() == dataframe.CacheInfo(0, 0, 0, 32, 0)
+
+
+def test_cached_disk(tmp_path: Path) -> None:
+    """Test that cached reads the results back from the Parquet files."""
+    df_input = pd.DataFrame(np.random.rand(10, 4) * 100, columns=list("abcd"))
+
+    analyze = dataframe.cached(cache_dir=tmp_path)(
+        dataframe.normalize(how="median")(dummy_function)
+    )
+    df_expected = analyze(df_input)
+    assert len(list(tmp_path.glob("*.parquet"))) == 1
+
+    analyze.cache_clear()
+    assert_frame_equal(analyze(df_input), df_expected)
+    assert analyze.cache_info() == dataframe.CacheInfo(0, 0, 1, 32, 1)
+
+    # Differently decorated functions don't share results.
+    other = dataframe.cached(cache_dir=tmp_path)(
+        dataframe.normalize(how="row")(dummy_function)
+    )
+    _ = other(df_input)
+    assert other.cache_info().misses == 1
+
+
+def test_cached_disk_decorator_arguments(tmp_path: Path) -> None:
+    """Test that results of decorators with other arguments don't collide on disk."""
+    df_input = make_long_quant_table().rename(columns={"Intensity": "v"})
+    df_input["w"] = np.random.rand(len(df_input))
+
+    def analyze(values: str) -> Callable[..., Any]:
+        return dataframe.cached(cache_dir=tmp_path)(
+            dataframe.pivot_table(index="Peptide", columns="Sample", values=values)(
+                dummy_function
+            )
+        )
+
+    for values in ["v", "w"]:
+        df_expected = df_input.pivot_table(
+            index="Peptide", columns="Sample", values=values
+        )
+        assert_frame_equal(analyze(values)(df_input), df_expected)
+    assert len(list(tmp_path.glob("*.parquet"))) == 2
+
+    # A new but identical wrapper reads the results back.
+    analyze_v = analyze("v")
+    _ = analyze_v(df_input)
+    assert analyze_v.cache_info().disk_hits == 1
@@ -0,0 +1,108 @@
+"""Test cases for the digest module."""
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+from talus_utils.digest import PeptideIndex, cleave
+
+
+FASTA = (
+    ">sp|P00001|ONE_HUMAN Protein one\n"
+    "PEPTIDEKAPEPTIDER\n"
+    ">sp|P00002|TWO_HUMAN Protein two\n"
+    "SPEPTIDEKAPEPTIDERGG\n"
+    ">custom\n"
+    "PEPTIDEKPEPTIDEK\n"
+    ">sp|P00001|ONE_HUMAN Repeated protein one\n"
+    "APEPTIDER\n"
+)
+
+
+@pytest.mark.parametrize(
+    "params,expected",
+    [
+        ({"missed_cleavages": 0}, ["PEPTIDEK", "APEPTIDER", "SPEPTIDEK"]),
+        (
+            {"missed_cleavages": 1, "max_length": 17},
+            ["PEPTIDEK", "PEPTIDEKAPEPTIDER", "APEPTIDER", "SPEPTIDEK"],
+        ),
+        ({"missed_cleavages": 0, "min_length": 9}, ["APEPTIDER", "SPEPTIDEK"]),
+        (
+            {"enzyme": "Lys-C", "missed_cleavages": 0},
+            ["PEPTIDEK", "APEPTIDERSPEPTIDEK"],
+        ),
+        (
+            {"enzyme": "[DE]", "missed_cleavages": 0, "min_length": 1},
+            ["PE", "PTID", "E", "KAPE", "RSPE", "K"],
+        ),
+    ],
+)
+def test_cleave(params: dict, expected: list) -> None:
+    """Tests cleave with different enzymes, missed cleavages and length bounds."""
+    sequence = "PEPTIDEKAPEPTIDERSPEPTIDEK"
+    assert cleave(sequence, **params) == expected
+
+
+def test_cleave_proline() -> None:
+    """Tests that trypsin doesn't cleave before a proline."""
+    assert cleave("PEPTIDEKPEPTIDEK", missed_cleavages=0) == ["PEPTIDEKPEPTIDEK"]
+    assert cleave("PEPTIDEKPEPTIDEK", "trypsin/p", missed_cleavages=0) == ["PEPTIDEK"]
+
+
+def test_peptide_index(tmp_path: Path) -> None:
+    """Tests PeptideIndex.from_fasta, lookups and save/load round trips."""
+    fasta_path = tmp_path.joinpath("proteins.fasta")
+    fasta_path.write_text(FASTA)
+    index = PeptideIndex.from_fasta(fasta_path, missed_cleavages=0)
+    assert list(index.proteins) == [
+        "sp|P00001|ONE_HUMAN",
+        "sp|P00002|TWO_HUMAN",
+        "custom",
+    ]
+    assert len(index) == 4
+
+    peptides = pd.Series(["APEPTIDER", "MISSING", "PEPTIDEK", "SPEPTIDEK"])
+    expected = pd.DataFrame(
+        {
+            "PeptideSeq": ["APEPTIDER", "APEPTIDER", "PEPTIDEK", "SPEPTIDEK"],
+            "ProteinAccession": pd.Categorical.from_codes(
+                [0, 1, 0, 1], categories=index.proteins
+            ),
+        }
+    )
+    pd.testing.assert_frame_equal(index.map_peptides(peptides), expected)
+
+    for arrow_peptides in [
+        pa.array(peptides),
+        pa.chunked_array([peptides[:1], [None], peptides[1:]]),
+    ]:
+        actual = index.map_peptides(arrow_peptides)
+        pd.testing.assert_frame_equal(actual, expected)
+
+    queries, protein_ids = index.lookup(["PEPTIDEKPEPTIDEK", "PEPTIDEK"])
+    np.testing.assert_array_equal(queries, [0, 1])
+    np.testing.assert_array_equal(protein_ids, [2, 0])
+
+    index_path = tmp_path.joinpath("proteins.npz")
+    index.save(index_path)
+    loaded_index = PeptideIndex.load(index_path)
+    pd.testing.assert_frame_equal(loaded_index.map_peptides(peptides), expected)
+
+    # Sliced arrays don't start at the beginning of their buffers.
+    sliced_index = PeptideIndex(
+        index.peptides[1:], index.indptr[1:], index.protein_ids, index.proteins
+    )
+    sliced_index.save(index_path)
+    assert PeptideIndex.load(index_path).peptides.equals(index.peptides[1:])
+
+
+def test_peptide_index_empty(tmp_path: Path) -> None:
+    """Tests PeptideIndex with an empty FASTA file."""
+    fasta_path = tmp_path.joinpath("empty.fasta")
+    fasta_path.write_text("")
+    index = PeptideIndex.from_fasta(fasta_path)
+    assert len(index) == 0
+    assert index.map_peptides(["PEPTIDEK"]).empty
@@ -1,13 +1,27 @@
 """tests/test_elib.py module."""
+import asyncio
 import json
+import shutil
+import sqlite3
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Any, List, Tuple
 
 import pandas as pd
+import pyarrow as pa
+import pytest
 
 from deepdiff import DeepDiff
 
-from talus_utils.elib import Elib, get_unique_peptide_proteins
+from talus_utils.elib import (
+    Elib,
+    ElibCollection,
+    ElibParquet,
+    ElibPool,
+    get_unique_peptide_proteins,
+    get_unique_peptide_proteins_batch,
+)
 
 
 DATA_DIR = Path(__file__).resolve().parent.joinpath("data")
@@ -62,3 +76,264 @@ def test_get_unique_peptides_and_proteins() -> None:
         )
         == {}
     )
+
+
+def test_get_unique_peptides_and_proteins_batch() -> None:
+    """Test the get_unique_peptide_proteins_batch function."""
+    dict_expected = json.load(DATA_DIR.joinpath("unique_peptides_proteins.json").open())
+    df_expected = pd.DataFrame([dict_expected] * 3)
+
+    for use_processes in [False, True]:
+        df_actual = get_unique_peptide_proteins_batch(
+            elib_filenames=[DATA_DIR.joinpath("test_local.mzML.elib")] * 3,
+            max_workers=2,
+            use_processes=use_processes,
+        )
+        pd.testing.assert_frame_equal(df_actual, df_expected)
+
+
+@pytest.fixture
+def decoy_elib_file(tmp_path: Path) -> Path:
+    """Create a copy of the local test elib with a decoy and a high q-value protein.
+
+    Parameters
+    ----------
+    tmp_path : Path
+        The pytest tmp_path fixture.
+
+    Returns
+    -------
+    Path
+        The path to the elib file.
+    """
+    elib_filename = tmp_path.joinpath("decoys.elib")
+    shutil.copy(DATA_DIR.joinpath("test_local.mzML.elib"), elib_filename)
+    connection = sqlite3.connect(elib_filename)
+    connection.execute(
+        "INSERT INTO peptidetoprotein VALUES ('DECOYPEPTIDEK', 1, 'DECOY_sp|P00000|PROT_HUMAN');"
+    )
+    connection.execute("UPDATE proteinscores SET QValue = 0.5 WHERE ProteinGroup = 1;")
+    connection.commit()
+    connection.close()
+    return elib_filename
+
+
+SUMMARY_EXPECTED = {
+    "Unique Proteins": 5,
+    "Unique Peptides": 5,
+    "Decoy Proteins": 1,
+    "Decoy Peptides": 1,
+    "Filtered Proteins": 4,
+    "Filtered Peptides": 5,
+}
+
+
+def test_get_summary(decoy_elib_file: Path) -> None:
+    """Test the get_summary method with decoys and a q-value threshold."""
+    elib_conn = Elib(key_or_filename=decoy_elib_file)
+    summary_actual = elib_conn.get_summary(q_value_threshold=0.01)
+    elib_conn.close()
+
+    assert summary_actual == SUMMARY_EXPECTED
+
+
+def test_execute_sql_pandas_chunksize() -> None:
+    """Tests execute_sql using pandas with a chunksize."""
+    elib_conn = Elib(key_or_filename=ELIB_FILE_KEY)
+
+    chunks = list(
+        elib_conn.execute_sql(
+            sql="SELECT * FROM peptidetoprotein;", use_pandas=True, chunksize=2
+        )
+    )
+    assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+    for chunk in chunks:
+        assert chunk["ProteinAccession"].dtype == "category"
+        assert chunk["isDecoy"].dtype == bool
+
+    df_actual = pd.concat(chunks, ignore_index=True).astype(
+        {"ProteinAccession": str, "isDecoy": int}
+    )
+    pd.testing.assert_frame_equal(df_actual, DF_EXPECTED)
+
+
+def test_execute_sql_arrow() -> None:
+    """Tests execute_sql_arrow."""
+    elib_conn = Elib(key_or_filename=ELIB_FILE_KEY)
+
+    batches = list(
+        elib_conn.execute_sql_arrow(sql="SELECT * FROM peptidescores;", batch_size=3)
+    )
+    assert [batch.num_rows for batch in batches] == [3, 2]
+    assert pa.types.is_dictionary(batches[0].schema.field("SourceFile").type)
+    assert pa.types.is_boolean(batches[0].schema.field("IsDecoy").type)
+
+
+def test_read_only() -> None:
+    """Tests that a read-only Elib can be queried but not written to."""
+    elib_conn = Elib(key_or_filename=ELIB_FILE_KEY, read_only=True)
+
+    df_actual = elib_conn.execute_sql(
+        sql="SELECT * FROM peptidetoprotein WHERE isDecoy == ?;",
+        use_pandas=True,
+        parameters=(0,),
+    )
+    pd.testing.assert_frame_equal(df_actual, DF_EXPECTED)
+
+    with pytest.raises(sqlite3.OperationalError):
+        elib_conn.execute_sql(sql="DELETE FROM peptidetoprotein;")
+    elib_conn.close()
+
+
+def test_context_manager_closes_connection() -> None:
+    """Tests that leaving the Elib context closes the connection."""
+    with Elib(key_or_filename=ELIB_FILE_KEY) as elib_conn:
+        assert elib_conn.execute_sql(sql="SELECT 1;").fetchall() == [(1,)]
+
+    with pytest.raises(sqlite3.ProgrammingError):
+        elib_conn.execute_sql(sql="SELECT 1;")
+
+
+def test_elib_pool_threads() -> None:
+    """Tests that an ElibPool gives every thread its own connection."""
+    with ElibPool(key_or_filename=ELIB_FILE_KEY) as elib_pool:
+
+        def query(_: int) -> Tuple[pd.DataFrame, int]:
+            df = elib_pool.execute_sql(
+                sql="SELECT * FROM peptidetoprotein;", use_pandas=True
+            )
+            return df, id(elib_pool._connection)
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(query, range(16)))
+
+        for df_actual, _ in results:
+            pd.testing.assert_frame_equal(df_actual, DF_EXPECTED)
+        connections = list(elib_pool._connections)
+        assert len({connection_id for _, connection_id in results}) == len(connections)
+
+    with pytest.raises(sqlite3.ProgrammingError):
+        connections[0].execute("SELECT 1;")
+
+
+def test_elib_pool_async() -> None:
+    """Tests the async query API of an ElibPool."""
+
+    async def query_all(elib_pool: ElibPool) -> List[Any]:
+        return await asyncio.gather(
+            elib_pool.execute_sql_async(
+                sql="SELECT * FROM peptidetoprotein;", use_pandas=True
+            ),
+            elib_pool.execute_sql_async(
+                sql="SELECT COUNT(*) FROM peptidetoprotein WHERE isDecoy == ?;",
+                parameters=(0,),
+            ),
+        )
+
+    with ElibPool(key_or_filename=ELIB_FILE_KEY, max_workers=2) as elib_pool:
+        df_actual, count_actual = asyncio.run(query_all(elib_pool))
+
+    pd.testing.assert_frame_equal(df_actual, DF_EXPECTED)
+    assert count_actual == [(5,)]
+
+
+def test_to_parquet(decoy_elib_file: Path, tmp_path: Path) -> None:
+    """Tests exporting an Elib to Parquet and summarizing it with ElibParquet."""
+    with Elib(key_or_filename=decoy_elib_file) as elib_conn:
+        directory = elib_conn.to_parquet(tmp_path.joinpath("parquet"), batch_size=2)
+
+    assert directory.joinpath(
+        "peptidescores", "SourceFile=210308_talus_03.mzML"
+    ).is_dir()
+
+    elib_parquet = ElibParquet(directory)
+    assert elib_parquet.get_summary(q_value_threshold=0.01) == SUMMARY_EXPECTED
+    assert (
+        elib_parquet.get_summary(q_value_threshold=0.01, source_file="other.mzML")[
+            "Filtered Proteins"
+        ]
+        == 0
+    )
+
+    df_expected = pd.read_sql_query(
+        "SELECT * FROM peptidetoprotein;", sqlite3.connect(decoy_elib_file)
+    ).astype({"isDecoy": bool})
+    df_actual = elib_parquet.read_table("peptidetoprotein").to_pandas()
+    assert df_actual["ProteinAccession"].dtype == "category"
+    pd.testing.assert_frame_equal(
+        df_actual.astype({"ProteinAccession": str}).sort_values(
+            "PeptideSeq", ignore_index=True
+        ),
+        df_expected.sort_values("PeptideSeq", ignore_index=True),
+    )
+
+
+def test_elib_collection(tmp_path: Path) -> None:
+    """Tests running a query over more elib files than SQLite can attach at once."""
+    filenames = []
+    for i in range(12):
+        filename = tmp_path.joinpath(f"sample_{i:02d}.mzML.elib")
+        shutil.copy(DATA_DIR.joinpath("test_local.mzML.elib"), filename)
+        filenames.append(filename)
+
+    with ElibCollection(filenames) as elib_collection:
+        df_actual = pd.concat(
+            elib_collection.execute_sql(
+                sql="SELECT COUNT(DISTINCT PeptideSeq) AS Peptides "
+                "FROM {peptidetoprotein} WHERE isDecoy == ?;",
+                parameters=(0,),
+            ),
+            ignore_index=True,
+        )
+        chunks = list(
+            elib_collection.execute_sql(
+                sql="SELECT * FROM {peptidetoprotein};", chunksize=4
+            )
+        )
+
+    df_expected = pd.DataFrame(
+        {"Sample": [f"sample_{i:02d}" for i in range(12)], "Peptides": 5}
+    )
+    pd.testing.assert_frame_equal(df_actual, df_expected)
+    df_union = pd.concat(chunks, ignore_index=True)
+    assert len(df_union) == 12 * 5
+    assert list(df_union.columns) == [
+        "Sample",
+        "PeptideSeq",
+        "isDecoy",
+        "ProteinAccession",
+    ]
+
+
+def test_elib_collection_tables(tmp_path: Path) -> None:
+    """Tests that only the table fields of a query refer to the attached files."""
+    filenames = [DATA_DIR.joinpath("test_local.mzML.elib")]
+    with ElibCollection(filenames, sample_names=["sample"]) as elib_collection:
+        df_actual = pd.concat(
+            elib_collection.execute_sql(
+                sql="SELECT 'peptidetoprotein' AS Source, "
+                "peptidetoprotein.PeptideSeq AS PeptideSeq "
+                "FROM {peptidetoprotein} AS peptidetoprotein LIMIT 1;"
+            )
+        )
+        assert df_actual["Source"].tolist() == ["peptidetoprotein"]
+
+        with pytest.raises(ValueError, match="Invalid table field"):
+            next(elib_collection.execute_sql(sql="SELECT * FROM {entries};"))
+
+        # The files are detached when the caller stops reading early or fails.
+        chunks = elib_collection.execute_sql(
+            sql="SELECT * FROM {peptidetoprotein};", chunksize=1
+        )
+        next(chunks)
+        chunks.close()
+        databases = elib_collection._connection.execute("PRAGMA database_list;")
+        assert [row[1] for row in databases] == ["main"]
+
+    # The attached files are detached when a later file can't be attached.
+    filenames.append(tmp_path.joinpath("missing.mzML.elib"))
+    with ElibCollection(filenames) as elib_collection:
+        with pytest.raises(sqlite3.OperationalError):
+            next(elib_collection.execute_sql(sql="SELECT * FROM {metadata};"))
+        databases = elib_collection._connection.execute("PRAGMA database_list;")
+        assert [row[1] for row in databases] == ["main"]
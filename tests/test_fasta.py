@@ -1,7 +1,54 @@
 """Test cases for the fasta module."""
+import gzip
+
+from pathlib import Path
+
+import pandas as pd
+import pyarrow as pa
 import pytest
 
-from talus_utils.fasta import parse_fasta_header, parse_fasta_header_uniprot_entry
+from talus_utils.fasta import (
+    FastaRecord,
+    IndexedFasta,
+    header_cache_clear,
+    header_cache_info,
+    index_fasta,
+    parse_fasta_header,
+    parse_fasta_header_series,
+    parse_fasta_header_uniprot_entry,
+    parse_fasta_header_uniprot_protein,
+    parse_fasta_headers,
+    read_fasta,
+)
+
+
+FASTA = (
+    ">sp|P04637|P53_HUMAN Cellular tumor antigen p53 OS=Homo sapiens OX=9606\n"
+    "MEEPQSDPSVEPPLSQETFSDLWKLL\n"
+    "PENNVLSPLPSQAMDDLMLSPDDIEQ\n"
+    "WFTEDP\n"
+    ">tr|A0A024R161|A0A024R161_HUMAN Guanine nucleotide-binding protein\n"
+    "MSSGAS\n"
+    ">custom_entry\n"
+    "PEPTIDEK\n"
+)
+RECORDS = [
+    FastaRecord(
+        "sp",
+        "P04637",
+        "P53_HUMAN",
+        "Cellular tumor antigen p53 OS=Homo sapiens OX=9606",
+        "MEEPQSDPSVEPPLSQETFSDLWKLLPENNVLSPLPSQAMDDLMLSPDDIEQWFTEDP",
+    ),
+    FastaRecord(
+        "tr",
+        "A0A024R161",
+        "A0A024R161_HUMAN",
+        "Guanine nucleotide-binding protein",
+        "MSSGAS",
+    ),
+    FastaRecord("", "custom_entry", "", "", "PEPTIDEK"),
+]
 
 
 def test_parse_fasta_header_valid() -> None:
@@ -101,3 +148,128 @@ def test_parse_fasta_header_uniprot_entry_invalid_species() -> None:
         _ = parse_fasta_header_uniprot_entry(
             fasta_header=invalid_fasta_header_emptyspecies
         )
+
+
+def test_parse_fasta_headers() -> None:
+    """Tests parse_fasta_headers against the per header parsers."""
+    headers = pd.Series(
+        [
+            "sp|A0A096LP01|SIM26_HUMAN",
+            "A0A096LP01|SIM26_HUMAN",
+            "sp||SIM26_HUMAN",
+            "sp|A0A096LP01|SIM26",
+            "sp|A0A096LP01|SIM26_HUMAN_MOUSE",
+            None,
+        ],
+        index=[5, 4, 3, 2, 1, 0],
+    )
+    expected = pd.DataFrame(
+        [
+            ["sp", "A0A096LP01", "SIM26_HUMAN", "SIM26", "HUMAN", True],
+            [None, None, None, None, None, False],
+            [None, None, None, None, None, False],
+            ["sp", "A0A096LP01", "SIM26", None, None, False],
+            ["sp", "A0A096LP01", "SIM26_HUMAN_MOUSE", None, None, False],
+            [None, None, None, None, None, False],
+        ],
+        columns=["db", "accession", "entry_name", "protein", "species", "valid"],
+        index=headers.index,
+    )
+    pd.testing.assert_frame_equal(parse_fasta_headers(headers), expected)
+
+    for header, valid in zip(headers.iloc[:-1], expected["valid"]):
+        try:
+            parse_fasta_header_uniprot_entry(fasta_header=header)
+            assert valid
+        except ValueError:
+            assert not valid
+
+    actual_table = parse_fasta_headers(pa.chunked_array([headers.iloc[:3], []]))
+    assert isinstance(actual_table, pa.Table)
+    assert actual_table.to_pandas().equals(expected.reset_index(drop=True).iloc[:3])
+
+
+def test_parse_fasta_header_cache() -> None:
+    """Tests the caching and interning of the header parse functions."""
+    header_cache_clear()
+    first = parse_fasta_header_uniprot_entry("sp|A0A096LP01|SIM26_HUMAN")
+    second = parse_fasta_header_uniprot_entry(
+        "".join(["sp|A0A096LP01|", "SIM26_HUMAN"])
+    )
+    other = parse_fasta_header_uniprot_entry("sp|A0A096LP02|SIM27_HUMAN")
+    assert first == second == ("SIM26", "HUMAN")
+    assert other[1] is first[1]
+
+    cache_info = header_cache_info()
+    assert cache_info["parse_fasta_header_uniprot_entry"].hits == 1
+    assert cache_info["parse_fasta_header_uniprot_entry"].misses == 2
+    assert cache_info["parse_fasta_header"].currsize == 2
+
+    header_cache_clear()
+    assert header_cache_info()["parse_fasta_header"].currsize == 0
+
+
+def test_parse_fasta_header_series() -> None:
+    """Tests parse_fasta_header_series against Series.apply."""
+    headers = pd.Series(
+        ["sp|A0A096LP01|SIM26_HUMAN", "sp|Q00000|TEST_MOUSE"] * 3,
+        index=list("abcdef"),
+        name="ProteinAccession",
+    )
+    for parse_func in [parse_fasta_header_uniprot_protein, parse_fasta_header]:
+        pd.testing.assert_series_equal(
+            parse_fasta_header_series(headers, parse_func), headers.apply(parse_func)
+        )
+
+    headers["c"] = None
+    actual = parse_fasta_header_series(headers)
+    assert actual.isna().tolist() == [False, False, True, False, False, False]
+
+    headers["d"] = "sp|A0A096LP01|SIM26"
+    with pytest.raises(ValueError):
+        _ = parse_fasta_header_series(headers)
+
+
+def test_read_fasta(tmp_path: Path) -> None:
+    """Tests read_fasta with a plain and a gzip compressed file."""
+    fasta_path = tmp_path.joinpath("proteins.fasta")
+    fasta_path.write_text(FASTA)
+    assert list(read_fasta(fasta_path)) == RECORDS
+
+    gzip_path = tmp_path.joinpath("proteins.fasta.gz")
+    with gzip.open(gzip_path, "wt") as gzip_file:
+        gzip_file.write(FASTA)
+    assert list(read_fasta(gzip_path)) == RECORDS
+
+
+@pytest.mark.parametrize("newline", ["\n", "\r\n"])
+def test_indexed_fasta(tmp_path: Path, newline: str) -> None:
+    """Tests index_fasta and IndexedFasta."""
+    fasta_path = tmp_path.joinpath("proteins.fasta")
+    fasta_path.write_bytes(FASTA.replace("\n", newline).encode())
+
+    index_path = index_fasta(fasta_path)
+    offset = len(FASTA.splitlines()[0]) + len(newline)
+    line_width = 26 + len(newline)
+    assert index_path.read_text().splitlines()[0] == (
+        f"sp|P04637|P53_HUMAN\t58\t{offset}\t26\t{line_width}"
+    )
+
+    with IndexedFasta(fasta_path) as fasta:
+        assert len(fasta) == 3
+        assert [fasta[record.accession] for record in RECORDS] == RECORDS
+        assert fasta["sp|P04637|P53_HUMAN"] == RECORDS[0]
+        assert fasta.fetch("P04637", 20, 30) == RECORDS[0].sequence[20:30]
+        assert fasta.fetch("P04637", 50) == RECORDS[0].sequence[50:]
+        assert "A0A024R161" in fasta
+        assert "Q00000" not in fasta
+        with pytest.raises(KeyError):
+            _ = fasta["Q00000"]
+
+
+def test_index_fasta_irregular_lines(tmp_path: Path) -> None:
+    """Tests index_fasta with lines of different lengths."""
+    fasta_path = tmp_path.joinpath("proteins.fasta")
+    fasta_path.write_text(">sp|P04637|P53_HUMAN\nMEEPQ\nSDP\nSVEPP\n")
+    with pytest.raises(ValueError, match="sequence lines of different lengths"):
+        _ = index_fasta(fasta_path)
@@ -0,0 +1,174 @@
+"""tests/test_parquet.py module."""
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+import pytest
+
+from pandas.testing import assert_frame_equal
+
+from talus_utils import dataframe, parquet
+from talus_utils.fasta import parse_fasta_header_uniprot_protein
+from talus_utils.parquet import ParquetFrame
+
+
+DATA_DIR = Path(__file__).resolve().parent.joinpath("data")
+
+
+def dummy_function(df: ParquetFrame) -> pd.DataFrame:
+    """Read the input frame into a pandas DataFrame.
+
+    Parameters
+    ----------
+    df : ParquetFrame
+        The input frame.
+    """
+    return df.to_pandas()
+
+
+def make_quant_table(n_rows: int = 200) -> pd.DataFrame:
+    """Create a quant matrix with an identifier column and missing values."""
+    values = np.random.rand(n_rows, 4) * 100
+    values[np.random.rand(n_rows, 4) < 0.2] = np.nan
+    df = pd.DataFrame(values, columns=["s1", "s2", "s3", "s4"])
+    df.insert(0, "Protein", [f"P{i}" for i in range(n_rows)])
+    return df
+
+
+def write_parquet(df: pd.DataFrame, path: Path) -> Path:
+    """Write a DataFrame to a Parquet file with small row groups."""
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    pq.write_table(table, path, row_group_size=32)
+    return path
+
+
+@pytest.mark.parametrize(
+    "pd_kwargs",
+    [{}, {"how": "all"}, {"thresh": 3}, {"subset": ["s1"]}, {"axis": 1}],
+)
+def test_dropna(tmp_path: Path, pd_kwargs: dict) -> None:
+    """Test the dropna decorator with a ParquetFrame."""
+    df_input = make_quant_table()
+    df_input.loc[3, ["s1", "s2", "s3", "s4"]] = np.nan
+    df_input["s5"] = 1.0
+    df_expected = df_input.dropna(**pd_kwargs).reset_index(drop=True)
+
+    frame = ParquetFrame(write_parquet(df_input, tmp_path / "input.parquet"), 50)
+    df_output = dataframe.dropna(**pd_kwargs)(dummy_function)(frame)
+    assert_frame_equal(df_output, df_expected)
+
+
+def test_explode(tmp_path: Path) -> None:
+    """Test the explode decorator with a pyarrow dataset."""
+    df_input = pd.read_csv(DATA_DIR.joinpath("peptide_proteins_to_explode.csv"))
+    df_input.loc[2, "Protein"] = None
+    df_expected = dataframe.explode_column(
+        df_input, column="Protein", sep=";", ignore_index=True
+    )
+
+    dataset = ds.dataset(write_parquet(df_input, tmp_path / "input.parquet"))
+    df_output = dataframe.explode(column="Protein", sep=";")(dummy_function)(dataset)
+    assert_frame_equal(df_output, df_expected)
+
+
+def test_update_column(tmp_path: Path) -> None:
+    """Test the update_column decorator with a ParquetFrame."""
+    df_input = pd.read_csv(DATA_DIR.joinpath("select_peptidetoprotein.csv"))
+    df_expected = df_input.copy(deep=True)
+    df_expected["ProteinAccession"] = df_expected["ProteinAccession"].apply(
+        parse_fasta_header_uniprot_protein
+    )
+
+    frame = ParquetFrame(write_parquet(df_input, tmp_path / "input.parquet"), 2)
+    df_output = dataframe.update_column(
+        column="ProteinAccession", update_func=parse_fasta_header_uniprot_protein
+    )(dummy_function)(frame)
+    assert_frame_equal(df_output, df_expected)
+
+
+@pytest.mark.parametrize("how", ["row", "column", "minmax", "median"])
+def test_normalize(tmp_path: Path, how: str) -> None:
+    """Test the exact normalizations of the normalize decorator with a ParquetFrame."""
+    df_input = make_quant_table()
+    df_input.loc[0, "s4"] = 100.0
+    numeric_columns = ["s1", "s2", "s3", "s4"]
+    df_expected = df_input.copy()
+    df_expected[numeric_columns] = dataframe.normalize(how=how)(lambda df: df)(
+        df_input[numeric_columns]
+    )
+
+    frame = ParquetFrame(write_parquet(df_input, tmp_path / "input.parquet"), 50)
+    df_output = dataframe.normalize(how=how)(dummy_function)(frame)
+    assert_frame_equal(df_output, df_expected)
+
+
+@pytest.mark.parametrize("max_candidates", [parquet.MEDIAN_CANDIDATES, 10, 0])
+def test_medians(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, max_candidates: int
+) -> None:
+    """Test the exact medians of skewed columns with NaN, null and tied values."""
+    monkeypatch.setattr(parquet, "MEDIAN_CANDIDATES", max_candidates)
+    n_rows = 1001
+    skewed = np.random.lognormal(0, 3, n_rows)
+    skewed[::7] = np.nan
+    tied = np.random.randint(0, 3, n_rows).astype(float)
+    tied[:10] = -np.inf
+    is_null = np.random.rand(n_rows) < 0.2
+    table = pa.table(
+        {
+            "skewed": pa.array(skewed, mask=is_null),
+            "tied": pa.array(tied),
+            "even": pa.array(np.arange(n_rows - 1, dtype=float).tolist() + [None]),
+            "empty": pa.array(np.full(n_rows, np.nan)),
+        }
+    )
+    path = tmp_path / "input.parquet"
+    pq.write_table(table, path, row_group_size=100)
+
+    medians = parquet._medians(ParquetFrame(path, 128), table.column_names)
+    assert medians["skewed"] == np.nanmedian(skewed[~is_null])
+    assert medians["tied"] == np.median(tied)
+    assert medians["even"] == (n_rows - 2) / 2
+    assert np.isnan(medians["empty"])
+
+
+def test_normalize_quantile(tmp_path: Path) -> None:
+    """Test the approximate quantile normalization with a ParquetFrame."""
+    df_input = make_quant_table(n_rows=2000)
+    numeric_columns = ["s1", "s2", "s3", "s4"]
+    df_input[numeric_columns] = np.random.rand(2000, 4) * 100
+    df_expected = dataframe.quantile_normalize(df_input[numeric_columns])
+
+    frame = ParquetFrame(write_parquet(df_input, tmp_path / "input.parquet"), 500)
+    df_output = dataframe.normalize(how="quantile")(dummy_function)(frame)
+    np.testing.assert_allclose(df_output[numeric_columns], df_expected, atol=0.5)
+
+
+def test_normalize_value_error(tmp_path: Path) -> None:
+    """Test normalize with an invalid method."""
+    frame = ParquetFrame(write_parquet(make_quant_table(), tmp_path / "input.parquet"))
+    with pytest.raises(ValueError):
+        _ = parquet.normalize(frame, how="nonexisting")
+
+
+def test_lazy_write(tmp_path: Path) -> None:
+    """Test streaming a lazy pipeline to a Parquet file."""
+    df_input = make_quant_table()
+
+    @dataframe.lazy
+    @dataframe.copy
+    @dataframe.dropna(how="all")
+    @dataframe.log_scaling()
+    @dataframe.normalize(how="median")
+    def analyze(df: ParquetFrame) -> ParquetFrame:
+        return df
+
+    df_expected = analyze(pa.Table.from_pandas(df_input)).to_pandas()
+    input_path = write_parquet(df_input, tmp_path / "input.parquet")
+    frame = analyze(ParquetFrame(input_path, batch_size=64))
+    output = frame.write(tmp_path / "output.parquet")
+    assert pq.ParquetFile(output.dataset.files[0]).metadata.num_row_groups > 1
+    assert_frame_equal(output.to_pandas(), df_expected)
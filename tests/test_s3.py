@@ -0,0 +1,58 @@
+"""tests/test_s3.py module."""
+import os
+
+from pathlib import Path
+
+import boto3
+import pytest
+
+from talus_utils.elib import Elib
+from talus_utils.s3 import _download_object
+from tests.conftest import ELIB_FILE, ELIB_KEY
+
+
+def test_download_object(s3_bucket: str, tmp_path: Path) -> None:
+    """Test that _download_object streams the object to disk."""
+    filename = tmp_path.joinpath("downloaded.elib")
+    _download_object(bucket=s3_bucket, key=ELIB_KEY, filename=filename)
+
+    assert filename.read_bytes() == ELIB_FILE.read_bytes()
+
+
+def test_download_object_multipart(s3_bucket: str, tmp_path: Path) -> None:
+    """Test that _download_object reassembles an object fetched in ranged parts."""
+    content = os.urandom(12 * 1024 * 1024)
+    boto3.client("s3").put_object(Bucket=s3_bucket, Key="large.bin", Body=content)
+
+    filename = tmp_path.joinpath("large.bin")
+    _download_object(
+        bucket=s3_bucket,
+        key="large.bin",
+        filename=filename,
+        multipart_chunksize=5 * 1024 * 1024,
+        max_concurrency=4,
+    )
+
+    assert filename.read_bytes() == content
+
+
+def test_download_object_missing_key(s3_bucket: str, tmp_path: Path) -> None:
+    """Test that _download_object raises a ValueError for a missing key."""
+    with pytest.raises(ValueError, match="File doesn't exist."):
+        _download_object(
+            bucket=s3_bucket,
+            key="does/not/exist.elib",
+            filename=tmp_path.joinpath("missing.elib"),
+        )
+
+
+def test_elib_from_s3(s3_bucket: str) -> None:
+    """Test that an Elib can be opened from a key in S3."""
+    elib_conn = Elib(key_or_filename=ELIB_KEY, bucket=s3_bucket)
+
+    values_actual = elib_conn.execute_sql(
+        sql="SELECT COUNT(*) FROM peptidetoprotein;"
+    ).fetchall()
+    elib_conn.close()
+
+    assert values_actual == [(5,)]